@@ -6,6 +6,7 @@
 
 # This relies on each of the submodules having an __all__ variable.
 from .base_events import *
+from .caches import *
 from .coroutines import *
 from .events import *
 from .exceptions import *
@@ -23,6 +24,7 @@
 from .transports import *
 
 __all__ = (base_events.__all__ +
+           caches.__all__ +
            coroutines.__all__ +
            events.__all__ +
            exceptions.__all__ +
@@ -66,6 +66,11 @@
 # Maximum timeout passed to select to avoid OS limitations
 MAXIMUM_SELECT_TIMEOUT = 24 * 3600
 
+# Each level of the timer wheel has 2**_TIMER_WHEEL_BITS slots.
+_TIMER_WHEEL_BITS = 8
+_TIMER_WHEEL_MASK = (1 << _TIMER_WHEEL_BITS) - 1
+_TIMER_WHEEL_LEVELS = 4
+
 
 def _format_handle(handle):
     cb = handle._callback
@@ -203,6 +208,177 @@ def _check_ssl_socket(sock):
         raise TypeError("Socket cannot be of type SSLSocket")
 
 
+class _TimerWheelSlot(dict):
+    # Maps id(handle) to handle.  Ids are used as keys because equal
+    # handles can be distinct.
+    __slots__ = ('level',)
+
+    def __init__(self, level):
+        self.level = level
+
+
+class _TimerWheel:
+    """Hierarchical timing wheel holding the timer handles of a loop.
+
+    Time is divided in ticks of *resolution* seconds.  A handle is stored
+    in a slot of the lowest level of the wheel which covers its tick, and
+    moves down a level when the wheel reaches the range of that slot.
+    When its tick is reached, it moves to a heap which is used like the
+    _scheduled heap of the loop, so that handles are called at the same
+    time and in the same order.  Adding and removing a handle is O(1).
+    """
+
+    def __init__(self, resolution, now):
+        self.resolution = resolution
+        self.heap = []
+        # Handles of the ticks up to _tick are in the heap.
+        self._tick = int(now / resolution)
+        self._levels = [[_TimerWheelSlot(level)
+                         for i in range(_TIMER_WHEEL_MASK + 1)]
+                        for level in range(_TIMER_WHEEL_LEVELS)]
+        # Handles beyond the range of the upper level.
+        self._far = _TimerWheelSlot(_TIMER_WHEEL_LEVELS)
+        # Number of handles in each level, and in _far.
+        self._counts = [0] * (_TIMER_WHEEL_LEVELS + 1)
+        # Maps id(handle) to the slot holding it.
+        self._slots = {}
+
+    def __len__(self):
+        return len(self._slots) + len(self.heap)
+
+    def _all_slots(self):
+        for slots in self._levels:
+            yield from slots
+        yield self._far
+
+    def handles(self):
+        """Return a list of all the handles."""
+        handles = list(self.heap)
+        for slot in self._all_slots():
+            handles.extend(slot.values())
+        return handles
+
+    def add(self, handle):
+        tick = self._tick
+        t = handle._when / self.resolution
+        if not t < tick + (1 << (_TIMER_WHEEL_BITS * _TIMER_WHEEL_LEVELS)):
+            slot = self._far
+        else:
+            t = int(t)
+            if t <= tick:
+                heapq.heappush(self.heap, handle)
+                return
+            shift = 0
+            for slots in self._levels:
+                upper = shift + _TIMER_WHEEL_BITS
+                if t >> upper == tick >> upper:
+                    slot = slots[(t >> shift) & _TIMER_WHEEL_MASK]
+                    break
+                shift = upper
+            else:
+                slot = self._far
+        key = id(handle)
+        slot[key] = handle
+        self._slots[key] = slot
+        self._counts[slot.level] += 1
+
+    def remove(self, handle):
+        """Remove handle, return False if it is in the heap."""
+        slot = self._slots.pop(id(handle), None)
+        if slot is None:
+            return False
+        del slot[id(handle)]
+        self._counts[slot.level] -= 1
+        return True
+
+    def clear(self):
+        for slot in self._all_slots():
+            slot.clear()
+        self._slots.clear()
+        self._counts = [0] * (_TIMER_WHEEL_LEVELS + 1)
+        self.heap.clear()
+
+    def _lowest_level(self):
+        # Return the lowest level holding handles, _TIMER_WHEEL_LEVELS for
+        # _far.  The wheel must not be empty.
+        level = 0
+        while not self._counts[level]:
+            level += 1
+        return level
+
+    def next_when(self):
+        """Return the time when the next handle may be due, or None."""
+        if self.heap:
+            return self.heap[0]._when
+        if not self._slots:
+            return None
+        tick = self._tick
+        level = self._lowest_level()
+        if not level:
+            level0 = self._levels[0]
+            for t in range(tick + 1, (tick | _TIMER_WHEEL_MASK) + 1):
+                if level0[t & _TIMER_WHEEL_MASK]:
+                    return t * self.resolution
+            level = 1
+        # Wake up to move handles down from the upper levels.
+        end = tick | ((1 << (_TIMER_WHEEL_BITS * level)) - 1)
+        return (end + 1) * self.resolution
+
+    def advance(self, end_time):
+        """Move the handles of the ticks before end_time to the heap."""
+        target = int(end_time / self.resolution)
+        level0 = self._levels[0]
+        while self._tick < target:
+            if not self._slots:
+                self._tick = target
+                break
+            level = self._lowest_level()
+            if level:
+                # Nothing happens until the range of the next slot of that
+                # level starts.
+                end = self._tick | ((1 << (_TIMER_WHEEL_BITS * level)) - 1)
+                if end >= target:
+                    self._tick = target
+                    break
+                self._tick = end
+            tick = self._tick = self._tick + 1
+            if not tick & _TIMER_WHEEL_MASK:
+                self._cascade(tick)
+            slot = level0[tick & _TIMER_WHEEL_MASK]
+            if slot:
+                self._move_to_heap(slot)
+
+    def _cascade(self, tick):
+        # Redistribute the handles of the slots of the upper levels which
+        # start at tick, from the highest level down.
+        level = 1
+        while (level < _TIMER_WHEEL_LEVELS and
+               not tick & ((1 << (_TIMER_WHEEL_BITS * (level + 1))) - 1)):
+            level += 1
+        for level in reversed(range(1, level + 1)):
+            if level == _TIMER_WHEEL_LEVELS:
+                slot = self._far
+            else:
+                index = tick >> (_TIMER_WHEEL_BITS * level)
+                slot = self._levels[level][index & _TIMER_WHEEL_MASK]
+            if slot:
+                handles = list(slot.values())
+                slot.clear()
+                self._counts[level] -= len(handles)
+                for handle in handles:
+                    del self._slots[id(handle)]
+                    self.add(handle)
+
+    def _move_to_heap(self, slot):
+        heap = self.heap
+        slots = self._slots
+        for key, handle in slot.items():
+            del slots[key]
+            heapq.heappush(heap, handle)
+        self._counts[0] -= len(slot)
+        slot.clear()
+
+
 class _SendfileFallbackProtocol(protocols.Protocol):
     def __init__(self, transp):
         if not isinstance(transp, transports._FlowControlMixin):
@@ -392,6 +568,7 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        self._timer_wheel = None
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -399,6 +576,7 @@ def __init__(self):
         self._thread_id = None
         self._clock_resolution = time.get_clock_info('monotonic').resolution
         self._exception_handler = None
+        self._instrumentation = None
         self.set_debug(coroutines._is_debug_mode())
         # In debug mode, if the execution of a callback or a step of a task
         # exceed this duration in seconds, the slow callback/task is logged.
@@ -688,6 +866,8 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            self._timer_wheel.clear()
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
@@ -755,10 +935,51 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        if self._timer_wheel is not None:
+            self._timer_wheel.add(timer)
+        else:
+            heapq.heappush(self._scheduled, timer)
         timer._scheduled = True
         return timer
 
+    def set_timer_wheel(self, resolution):
+        """Set the scheduler of call_at() and call_later() callbacks.
+
+        If resolution is None, the callbacks are kept in a heap, which is
+        the default.  Otherwise, they are kept in a hierarchical timing
+        wheel with ticks of resolution seconds, to which adding a callback
+        and from which cancelling it are O(1).  The callbacks are called
+        at the same time and in the same order with both schedulers.
+        """
+        if resolution is not None and not resolution > 0:
+            raise ValueError(f'resolution must be a positive number or '
+                             f'None, got {resolution!r}')
+        if self._timer_wheel is not None:
+            handles = self._timer_wheel.handles()
+        else:
+            handles = self._scheduled
+        self._scheduled = []
+        self._timer_cancelled_count = 0
+        if resolution is None:
+            self._timer_wheel = None
+        else:
+            self._timer_wheel = _TimerWheel(resolution, self.time())
+        for handle in handles:
+            if handle._cancelled:
+                handle._scheduled = False
+            elif self._timer_wheel is not None:
+                self._timer_wheel.add(handle)
+            else:
+                self._scheduled.append(handle)
+        heapq.heapify(self._scheduled)
+
+    def get_timer_wheel(self):
+        """Return the resolution of the timing wheel, or None if the
+        default heap is used."""
+        if self._timer_wheel is None:
+            return None
+        return self._timer_wheel.resolution
+
     def call_soon(self, callback, *args, context=None):
         """Arrange for a callback to be called as soon as possible.
 
@@ -1734,6 +1955,39 @@ def set_exception_handler(self, handler):
                             f'got {handler!r}')
         self._exception_handler = handler
 
+    def get_instrumentation(self):
+        """Return the instrumentation hook, or None if none is set."""
+        return self._instrumentation
+
+    def set_instrumentation(self, hook):
+        """Set hook to be called after each iteration of the event loop.
+
+        If hook is None, the instrumentation is disabled.
+
+        If hook is a callable object, it should have a signature
+        matching '(loop, stats)', where 'loop' will be a reference to
+        the active event loop and 'stats' a dict with the following
+        keys describing the iteration:
+
+        - 'select_time': Seconds spent waiting for I/O in select();
+        - 'events_time': Seconds spent processing the I/O events;
+        - 'timers_time': Seconds spent maintaining the timer heap;
+        - 'callbacks_time': Seconds spent running the ready callbacks;
+        - 'timeout': Timeout passed to select(), None to block;
+        - 'events': Number of I/O events returned by select();
+        - 'callbacks': Number of callbacks in the ready queue at the
+          start of the callback phase, including cancelled ones;
+        - 'ready': Number of callbacks left in the ready queue for the
+          next iteration;
+        - 'scheduled': Number of timer handles in the timer heap;
+        - 'cancelled_timers': Number of cancelled timer handles still
+          in the timer heap.
+        """
+        if hook is not None and not callable(hook):
+            raise TypeError(f'A callable object or None is expected, '
+                            f'got {hook!r}')
+        self._instrumentation = hook
+
     def default_exception_handler(self, context):
         """Default exception handler.
 
@@ -1869,7 +2123,11 @@ def _add_callback_signalsafe(self, handle):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            wheel = self._timer_wheel
+            if wheel is not None and wheel.remove(handle):
+                handle._scheduled = False
+            else:
+                self._timer_cancelled_count += 1
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1878,9 +2136,20 @@ def _run_once(self):
         schedules the resulting callbacks, and finally schedules
         'call_later' callbacks.
         """
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            t0 = time.perf_counter()
 
+        wheel = self._timer_wheel
         sched_count = len(self._scheduled)
-        if (sched_count > _MIN_SCHEDULED_TIMER_HANDLES and
+        if wheel is not None:
+            # Cancelled handles are removed from the wheel, except those
+            # already moved to its heap.
+            while wheel.heap and wheel.heap[0]._cancelled:
+                self._timer_cancelled_count -= 1
+                handle = heapq.heappop(wheel.heap)
+                handle._scheduled = False
+        elif (sched_count > _MIN_SCHEDULED_TIMER_HANDLES and
             self._timer_cancelled_count / sched_count >
                 _MIN_CANCELLED_TIMER_HANDLES_FRACTION):
             # Remove delayed calls that were cancelled if their number
@@ -1905,25 +2174,46 @@ def _run_once(self):
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
+        elif wheel is not None:
+            when = wheel.next_when()
+            if when is not None:
+                timeout = min(max(0, when - self.time()),
+                              MAXIMUM_SELECT_TIMEOUT)
         elif self._scheduled:
             # Compute the desired timeout.
             when = self._scheduled[0]._when
             timeout = min(max(0, when - self.time()), MAXIMUM_SELECT_TIMEOUT)
 
+        if instrumentation is not None:
+            t1 = time.perf_counter()
         event_list = self._selector.select(timeout)
+        if instrumentation is not None:
+            t2 = time.perf_counter()
+            nevents = len(event_list)
         self._process_events(event_list)
         # Needed to break cycles when an exception occurs.
         event_list = None
+        if instrumentation is not None:
+            t3 = time.perf_counter()
 
         # Handle 'later' callbacks that are ready.
         end_time = self.time() + self._clock_resolution
-        while self._scheduled:
-            handle = self._scheduled[0]
+        if wheel is not None:
+            wheel.advance(end_time)
+            scheduled = wheel.heap
+        else:
+            scheduled = self._scheduled
+        while scheduled:
+            handle = scheduled[0]
             if handle._when >= end_time:
                 break
-            handle = heapq.heappop(self._scheduled)
+            handle = heapq.heappop(scheduled)
             handle._scheduled = False
+            if handle._cancelled and wheel is not None:
+                self._timer_cancelled_count -= 1
             self._ready.append(handle)
+        if instrumentation is not None:
+            t4 = time.perf_counter()
 
         # This is the only place where callbacks are actually *called*.
         # All other places just add them to ready.
@@ -1951,6 +2241,29 @@ def _run_once(self):
                 handle._run()
         handle = None  # Needed to break cycles when an exception occurs.
 
+        if instrumentation is not None:
+            stats = {
+                'select_time': t2 - t1,
+                'events_time': t3 - t2,
+                'timers_time': (t1 - t0) + (t4 - t3),
+                'callbacks_time': time.perf_counter() - t4,
+                'timeout': timeout,
+                'events': nevents,
+                'callbacks': ntodo,
+                'ready': len(self._ready),
+                'scheduled': len(wheel or self._scheduled),
+                'cancelled_timers': self._timer_cancelled_count,
+            }
+            try:
+                instrumentation(self, stats)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                self.call_exception_handler({
+                    'message': 'Exception in instrumentation hook',
+                    'exception': exc,
+                })
+
     def _set_coroutine_origin_tracking(self, enabled):
         if bool(enabled) == bool(self._coroutine_origin_tracking_enabled):
             return
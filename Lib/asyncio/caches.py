@@ -0,0 +1,157 @@
+"""Memoization of coroutine functions."""
+
+__all__ = "alru_cache",
+
+import functools
+from collections import OrderedDict
+from time import monotonic as _monotonic
+
+from . import events
+from . import tasks
+
+
+def alru_cache(maxsize=128, typed=False, *, ttl=None):
+    """Least-recently-used cache decorator for coroutine functions.
+
+    This is the asynchronous counterpart of functools.lru_cache().  The
+    results of the awaited calls are cached rather than the coroutine
+    objects, and concurrent calls with the same arguments share a single
+    call of the wrapped function instead of calling it once each.  If a
+    caller is cancelled, the shared call keeps running for the others.
+
+    If *maxsize* is set to None, the LRU features are disabled and the cache
+    can grow without bound.  If *typed* is True, arguments of different types
+    will be cached separately.  If *ttl* is set, results are discarded *ttl*
+    seconds after they were computed.  Calls raising an exception or being
+    cancelled are not cached.
+
+    Arguments to the cached function must be hashable.
+
+    View the cache statistics named tuple (hits, misses, maxsize, currsize)
+    with f.cache_info().  Clear the cache and statistics with f.cache_clear().
+    Access the underlying function with f.__wrapped__.  Calls sharing a
+    pending call are counted as hits.
+    """
+    if ttl is not None and not ttl > 0:
+        raise ValueError('ttl must be a positive number or None')
+
+    if isinstance(maxsize, int):
+        # Negative maxsize is treated as 0
+        if maxsize < 0:
+            maxsize = 0
+    elif callable(maxsize) and isinstance(typed, bool):
+        # The user_function was passed in directly via the maxsize argument
+        user_function, maxsize = maxsize, 128
+        return _make_alru_cache(user_function, maxsize, typed, ttl)
+    elif maxsize is not None:
+        raise TypeError(
+            'Expected first argument to be an integer, a callable, or None')
+
+    def decorating_function(user_function):
+        return _make_alru_cache(user_function, maxsize, typed, ttl)
+
+    return decorating_function
+
+
+def _make_alru_cache(user_function, maxsize, typed, ttl):
+    wrapper = _alru_cache_wrapper(user_function, maxsize, typed, ttl)
+    if ttl is None:
+        wrapper.cache_parameters = lambda: {'maxsize': maxsize, 'typed': typed}
+    else:
+        wrapper.cache_parameters = lambda: {'maxsize': maxsize, 'typed': typed,
+                                            'ttl': ttl}
+    return functools.update_wrapper(wrapper, user_function)
+
+
+def _alru_cache_wrapper(user_function, maxsize, typed, ttl):
+    # Each link is a list [KEY, FUTURE, EXPIRES].  The cache dictionary is
+    # kept in recency order.  Links are added to the expiry dictionary when
+    # their future completes, which is also the order of expiration since
+    # all results share the same ttl.  Like the rest of asyncio, the cache
+    # is not thread-safe.
+    make_key = functools._make_key
+    timer = _monotonic
+    KEY, FUTURE, EXPIRES = 0, 1, 2   # names for the link fields
+
+    cache = OrderedDict()
+    expiry = OrderedDict()
+    hits = misses = evictions = expirations = 0
+
+    def discard(link):
+        key = link[KEY]
+        if cache.get(key) is link:
+            del cache[key]
+        if expiry.get(key) is link:
+            del expiry[key]
+
+    def expire(now):
+        nonlocal expirations
+        while expiry:
+            link = next(iter(expiry.values()))
+            if link[EXPIRES] > now:
+                break
+            discard(link)
+            expirations += 1
+
+    def done(link, fut):
+        if fut.cancelled() or fut.exception() is not None:
+            discard(link)
+        elif ttl is not None and cache.get(link[KEY]) is link:
+            link[EXPIRES] = timer() + ttl
+            expiry[link[KEY]] = link
+
+    async def wrapper(*args, **kwds):
+        nonlocal hits, misses, evictions
+        if maxsize == 0:
+            misses += 1
+            return await user_function(*args, **kwds)
+        key = make_key(args, kwds, typed)
+        if ttl is not None:
+            expire(timer())
+        loop = events.get_running_loop()
+        link = cache.get(key)
+        if link is not None:
+            fut = link[FUTURE]
+            if not fut.done():
+                if fut.get_loop() is loop:
+                    cache.move_to_end(key)
+                    hits += 1
+                    return await tasks.shield(fut)
+                # The call is pending in another event loop; do not share it.
+                misses += 1
+                return await user_function(*args, **kwds)
+            if not fut.cancelled() and fut.exception() is None:
+                cache.move_to_end(key)
+                hits += 1
+                return fut.result()
+            # The call failed, but done() has not been called yet.
+            discard(link)
+        misses += 1
+        fut = tasks.ensure_future(user_function(*args, **kwds), loop=loop)
+        link = [key, fut, None]
+        cache[key] = link
+        if maxsize is not None and len(cache) > maxsize:
+            _, oldlink = cache.popitem(last=False)
+            discard(oldlink)
+            evictions += 1
+        fut.add_done_callback(functools.partial(done, link))
+        return await tasks.shield(fut)
+
+    def cache_info():
+        """Report cache statistics"""
+        if ttl is None:
+            return functools._CacheInfo(hits, misses, maxsize, len(cache))
+        expire(timer())
+        return functools._PolicyCacheInfo(hits, misses, maxsize, len(cache),
+                                          evictions, expirations)
+
+    def cache_clear():
+        """Clear the cache and cache statistics"""
+        nonlocal hits, misses, evictions, expirations
+        cache.clear()
+        expiry.clear()
+        hits = misses = evictions = expirations = 0
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
@@ -602,6 +602,14 @@ def default_exception_handler(self, context):
     def call_exception_handler(self, context):
         raise NotImplementedError
 
+    # Instrumentation.
+
+    def get_instrumentation(self):
+        raise NotImplementedError
+
+    def set_instrumentation(self, hook):
+        raise NotImplementedError
+
     # Debug flag management.
 
     def get_debug(self):
@@ -1,10 +1,14 @@
-__all__ = ('Runner', 'run')
+__all__ = ('Runner', 'run', 'run_multiprocess_server')
 
+import collections
 import contextvars
 import enum
 import functools
+import os
 import threading
 import signal
+import socket
+import time
 from . import coroutines
 from . import events
 from . import exceptions
@@ -194,6 +198,190 @@ async def main():
         return runner.run(main)
 
 
+# run_multiprocess_server() gives up if as many workers as it runs died and
+# were restarted in this many seconds.
+_RESTART_WINDOW = 60.0
+
+
+def run_multiprocess_server(protocol_factory, host=None, port=None, *,
+                            workers=None, restart=True, shutdown_timeout=None,
+                            mp_context=None, loop_factory=None, **kwds):
+    """Serve protocol_factory from several processes sharing one port.
+
+    Start *workers* processes (os.cpu_count() by default), each running
+    its own event loop with a server created by
+    loop.create_server(protocol_factory, host, port, reuse_port=True,
+    **kwds), so that the kernel spreads incoming connections across them.
+
+    The function blocks until every worker has stopped.  SIGINT and SIGTERM
+    received by the calling process are forwarded to the workers as
+    SIGTERM, which closes their servers and lets them finish serving the
+    open connections.  Workers still running *shutdown_timeout* seconds
+    later are killed.
+
+    A worker that dies after it started serving is replaced by a new one
+    if *restart* is true, unless *workers* workers were already restarted
+    in the last minute.  If a worker exits before it started serving (for
+    instance because the address is in use) or dies too often, the other
+    workers are stopped and RuntimeError is raised.
+
+    protocol_factory and the keyword arguments must be picklable unless
+    *mp_context* is a multiprocessing context using the fork start method.
+    """
+    import multiprocessing
+    from multiprocessing import connection
+
+    if not hasattr(socket, 'SO_REUSEPORT'):
+        raise ValueError('reuse_port not supported by socket module')
+    if not port:
+        raise ValueError('a non-zero port is required, so that all the '
+                         'workers listen on the same one')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers <= 0:
+        raise ValueError("workers must be greater than 0")
+    if 'reuse_port' in kwds or 'start_serving' in kwds:
+        raise TypeError("run_multiprocess_server() sets reuse_port and "
+                        "start_serving itself")
+    if mp_context is None:
+        mp_context = multiprocessing.get_context()
+
+    parent_pid = os.getpid()
+    stopping = False
+    running = {}  # sentinel -> process
+    starting = {}  # ready connection -> sentinel, until the worker serves
+    failure = None
+    deadline = None
+    # Times of the last restarts, to give up if the workers keep dying.
+    restarts = collections.deque(maxlen=workers)
+
+    def start_worker():
+        ready_reader, ready_writer = mp_context.Pipe(duplex=False)
+        process = mp_context.Process(
+            target=_serve_worker,
+            args=(protocol_factory, host, port, kwds, loop_factory,
+                  ready_writer))
+        process.start()
+        ready_writer.close()
+        running[process.sentinel] = process
+        starting[ready_reader] = process.sentinel
+
+    def stop_workers():
+        nonlocal stopping, deadline
+        if not stopping and shutdown_timeout is not None:
+            deadline = time.monotonic() + shutdown_timeout
+        stopping = True
+        for process in running.values():
+            if process.exitcode is None:
+                process.terminate()
+
+    def on_signal(signum, frame):
+        # A forked worker may run this before it installs its own handlers.
+        if os.getpid() == parent_pid:
+            stop_workers()
+            # Wake up connection.wait() to take the deadline into account.
+            try:
+                wakeup_writer.send(b'\0')
+            except OSError:
+                pass
+
+    wakeup_reader, wakeup_writer = socket.socketpair()
+    wakeup_writer.setblocking(False)
+    old_handlers = {}
+    if threading.current_thread() is threading.main_thread():
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            old_handlers[signum] = signal.signal(signum, on_signal)
+    try:
+        for _ in range(workers):
+            start_worker()
+        while running:
+            if deadline is None:
+                timeout = None
+            else:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    for process in running.values():
+                        process.kill()
+                    timeout = None
+                    # stop_workers() does not set a new deadline once
+                    # stopping is true.
+                    deadline = None
+            waitables = [wakeup_reader, *running, *starting]
+            for obj in connection.wait(waitables, timeout):
+                if obj is wakeup_reader:
+                    wakeup_reader.recv(4096)
+                elif obj in starting:
+                    # The worker reported that it is serving, or died.
+                    try:
+                        obj.recv()
+                    except EOFError:
+                        pass
+                    else:
+                        del starting[obj]
+                        obj.close()
+            for sentinel, process in list(running.items()):
+                if process.exitcode is None:
+                    continue
+                del running[sentinel]
+                process.join()
+                readers = [r for r, s in starting.items() if s == sentinel]
+                if readers:
+                    del starting[readers[0]]
+                    readers[0].close()
+                    if not stopping:
+                        failure = (f'worker {process.pid} exited with code '
+                                   f'{process.exitcode} before it started '
+                                   f'serving')
+                        stop_workers()
+                elif restart and not stopping:
+                    now = time.monotonic()
+                    if (len(restarts) == workers
+                            and now - restarts[0] < _RESTART_WINDOW):
+                        failure = (f'worker {process.pid} exited with code '
+                                   f'{process.exitcode}; {workers} workers '
+                                   f'were already restarted in the last '
+                                   f'{_RESTART_WINDOW:g} seconds')
+                        stop_workers()
+                    else:
+                        restarts.append(now)
+                        start_worker()
+    finally:
+        for signum, handler in old_handlers.items():
+            signal.signal(signum, handler)
+        wakeup_reader.close()
+        wakeup_writer.close()
+        for process in running.values():
+            process.kill()
+            process.join()
+        for reader in starting:
+            reader.close()
+    if failure is not None:
+        raise RuntimeError(failure)
+
+
+def _serve_worker(protocol_factory, host, port, kwds, loop_factory,
+                  ready_writer):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    async def serve():
+        loop = events.get_running_loop()
+        server = await loop.create_server(
+            protocol_factory, host, port, reuse_port=True, **kwds)
+        main_task = tasks.current_task()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, main_task.cancel)
+        ready_writer.send(os.getpid())
+        ready_writer.close()
+        try:
+            await server.serve_forever()
+        except exceptions.CancelledError:
+            pass
+
+    with Runner(loop_factory=loop_factory) as runner:
+        runner.run(serve())
+
+
 def _cancel_all_tasks(loop):
     to_cancel = tasks.all_tasks(loop)
     if not to_cancel:
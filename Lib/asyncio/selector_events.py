@@ -792,6 +792,7 @@ def __init__(self, loop, sock, protocol, extra=None, server=None):
 
         self._server = server
         self._buffer = collections.deque()
+        self._buffer_size = 0  # Total length of the data in self._buffer.
         self._conn_lost = 0  # Set when call to connection_lost scheduled.
         self._closing = False  # Set when close() called.
         self._paused = False  # Set when pause_reading() called
@@ -894,6 +895,7 @@ def _force_close(self, exc):
             return
         if self._buffer:
             self._buffer.clear()
+            self._buffer_size = 0
             self._loop._remove_writer(self._sock_fd)
         if not self._closing:
             self._closing = True
@@ -916,7 +918,7 @@ def _call_connection_lost(self, exc):
                 self._server = None
 
     def get_write_buffer_size(self):
-        return sum(map(len, self._buffer))
+        return self._buffer_size
 
     def _add_reader(self, fd, callback, *args):
         if not self.is_reading():
@@ -1065,6 +1067,11 @@ def write(self, data):
             self._conn_lost += 1
             return
 
+        if isinstance(data, memoryview):
+            # Slice and count bytes, not items of another format, as
+            # writelines() does.
+            data = data.cast('B')
+
         if not self._buffer:
             # Optimization: try to send now.
             try:
@@ -1083,8 +1090,13 @@ def write(self, data):
             # Not all was written; register write handler.
             self._loop._add_writer(self._sock_fd, self._write_ready)
 
-        # Add it to the buffer.
+        # Add it to the buffer.  A bytearray is copied: the caller may resize
+        # it once write() returns, which would make _buffer_size wrong.  The
+        # rest of a partially sent one is a memoryview, which locks its size.
+        if isinstance(data, bytearray):
+            data = bytes(data)
         self._buffer.append(data)
+        self._buffer_size += len(data)
         self._maybe_pause_protocol()
 
     def _get_sendmsg_buffer(self):
@@ -1104,6 +1116,7 @@ def _write_sendmsg(self):
         except BaseException as exc:
             self._loop._remove_writer(self._sock_fd)
             self._buffer.clear()
+            self._buffer_size = 0
             self._fatal_error(exc, 'Fatal write error on socket transport')
             if self._empty_waiter is not None:
                 self._empty_waiter.set_exception(exc)
@@ -1120,6 +1133,7 @@ def _write_sendmsg(self):
 
     def _adjust_leftover_buffer(self, nbytes: int) -> None:
         buffer = self._buffer
+        self._buffer_size -= nbytes
         while nbytes:
             b = buffer.popleft()
             b_len = len(b)
@@ -1136,6 +1150,7 @@ def _write_send(self):
         try:
             buffer = self._buffer.popleft()
             n = self._sock.send(buffer)
+            self._buffer_size -= n
             if n != len(buffer):
                 # Not all data was written
                 self._buffer.appendleft(buffer[n:])
@@ -1146,6 +1161,7 @@ def _write_send(self):
         except BaseException as exc:
             self._loop._remove_writer(self._sock_fd)
             self._buffer.clear()
+            self._buffer_size = 0
             self._fatal_error(exc, 'Fatal write error on socket transport')
             if self._empty_waiter is not None:
                 self._empty_waiter.set_exception(exc)
@@ -1174,11 +1190,31 @@ def writelines(self, list_of_data):
             raise RuntimeError('unable to writelines; sendfile is in progress')
         if not list_of_data:
             return
-        self._buffer.extend([memoryview(data) for data in list_of_data])
+
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+
+        buffers = [memoryview(data).cast('B') for data in list_of_data]
+        # Empty buffers are skipped: sendmsg() would never consume them.
+        buffers = [data for data in buffers if data]
+        if not buffers:
+            return
+        was_empty = not self._buffer
+        self._buffer.extend(buffers)
+        self._buffer_size += sum(map(len, buffers))
+        if not was_empty:
+            # A write handler is already registered; it will send the
+            # new data after the data already buffered.
+            self._maybe_pause_protocol()
+            return
         self._write_ready()
         # If the entire buffer couldn't be written, register a write handler
         if self._buffer:
             self._loop._add_writer(self._sock_fd, self._write_ready)
+            self._maybe_pause_protocol()
 
     def can_write_eof(self):
         return True
@@ -1213,7 +1249,6 @@ def __init__(self, loop, sock, protocol, address=None,
                  waiter=None, extra=None):
         super().__init__(loop, sock, protocol, extra)
         self._address = address
-        self._buffer_size = 0
         self._loop.call_soon(self._protocol.connection_made, self)
         # only start reading when connection_made() has been called
         self._loop.call_soon(self._add_reader,
@@ -1223,9 +1258,6 @@ def __init__(self, loop, sock, protocol, address=None,
             self._loop.call_soon(futures._set_result_unless_cancelled,
                                  waiter, None)
 
-    def get_write_buffer_size(self):
-        return self._buffer_size
-
     def _read_ready(self):
         if self._conn_lost:
             return
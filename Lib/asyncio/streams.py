@@ -1,6 +1,6 @@
 __all__ = (
     'StreamReader', 'StreamWriter', 'StreamReaderProtocol',
-    'open_connection', 'start_server')
+    'BufferedStreamReaderProtocol', 'open_connection', 'start_server')
 
 import collections
 import socket
@@ -20,6 +20,7 @@
 
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
+_DEFAULT_BUFFER_SIZE = 2 ** 18  # 256 KiB
 
 
 async def open_connection(host=None, port=None, *,
@@ -297,6 +298,46 @@ def __del__(self):
                 closed.exception()
 
 
+class BufferedStreamReaderProtocol(StreamReaderProtocol,
+                                   protocols.BufferedProtocol):
+    """StreamReaderProtocol receiving data with get_buffer().
+
+    Transports supporting buffered protocols receive data directly into
+    the buffer passed to a pending StreamReader.readinto() call when the
+    reader's buffer is empty, and otherwise into a receive buffer of
+    buffer_size bytes which is reused for every read, instead of
+    allocating a new bytes object for each read.
+    """
+
+    def __init__(self, stream_reader, client_connected_cb=None, loop=None,
+                 *, buffer_size=_DEFAULT_BUFFER_SIZE):
+        if buffer_size <= 0:
+            raise ValueError('buffer_size must be positive')
+        super().__init__(stream_reader, client_connected_cb, loop)
+        self._recv_buffer = memoryview(bytearray(buffer_size))
+        self._recv_reader = None
+
+    def get_buffer(self, sizehint):
+        reader = self._stream_reader
+        if reader is not None:
+            buf = reader._readinto_view
+            if buf is not None and not reader._buffer:
+                self._recv_reader = reader
+                return buf
+        self._recv_reader = None
+        return self._recv_buffer
+
+    def buffer_updated(self, nbytes):
+        reader = self._recv_reader
+        if reader is not None:
+            self._recv_reader = None
+            reader._readinto_updated(nbytes)
+            return
+        reader = self._stream_reader
+        if reader is not None:
+            reader.feed_data(self._recv_buffer[:nbytes])
+
+
 class StreamWriter:
     """Wraps a Transport.
 
@@ -412,6 +453,8 @@ def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
         self._buffer = bytearray()
         self._eof = False    # Whether we're done.
         self._waiter = None  # A future used by _wait_for_data()
+        self._readinto_view = None  # Buffer of a waiting readinto() call
+        self._readinto_nbytes = 0
         self._exception = None
         self._transport = None
         self._paused = False
@@ -496,6 +539,14 @@ def feed_data(self, data):
             else:
                 self._paused = True
 
+    def _readinto_updated(self, nbytes):
+        # Called by BufferedStreamReaderProtocol after receiving nbytes
+        # directly into the buffer of the waiting readinto() call.
+        assert not self._eof, '_readinto_updated after feed_eof'
+        self._readinto_view = None
+        self._readinto_nbytes = nbytes
+        self._wakeup_waiter()
+
     async def _wait_for_data(self, func_name):
         """Wait until feed_data() or feed_eof() is called.
 
@@ -641,10 +692,10 @@ async def readuntil(self, separator=b'\n'):
             raise exceptions.LimitOverrunError(
                 'Separator is found, but chunk is longer than limit', isep)
 
-        chunk = self._buffer[:isep + seplen]
+        chunk = bytes(memoryview(self._buffer)[:isep + seplen])
         del self._buffer[:isep + seplen]
         self._maybe_resume_transport()
-        return bytes(chunk)
+        return chunk
 
     async def read(self, n=-1):
         """Read up to `n` bytes from the stream.
@@ -697,6 +748,58 @@ async def read(self, n=-1):
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buf):
+        """Read up to len(buf) bytes from the stream into `buf`.
+
+        `buf` must be a writable bytes-like object.  Return the number of
+        bytes read as soon as at least 1 byte is available, or 0 if EOF
+        was received and the internal buffer is empty.
+
+        Unlike read(), no new bytes object is created.  With a
+        BufferedStreamReaderProtocol, data arriving while the internal
+        buffer is empty is received directly into `buf`.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        view = memoryview(buf).cast('B')
+        if view.readonly:
+            raise TypeError('readinto() argument must be a writable '
+                            'bytes-like object')
+        if not view:
+            return 0
+
+        if not self._buffer and not self._eof:
+            if self._waiter is not None:
+                raise RuntimeError(
+                    'readinto() called while another coroutine is '
+                    'already waiting for incoming data')
+            self._readinto_view = view
+            try:
+                await self._wait_for_data('readinto')
+            except BaseException:
+                if self._readinto_nbytes:
+                    # Keep the data received into buf for the next read.
+                    self._buffer[:0] = view[:self._readinto_nbytes]
+                raise
+            finally:
+                self._readinto_view = None
+                nbytes = self._readinto_nbytes
+                self._readinto_nbytes = 0
+            if nbytes:
+                return nbytes
+
+        nbytes = min(len(view), len(self._buffer))
+        with memoryview(self._buffer) as data:
+            view[:nbytes] = data[:nbytes]
+        del self._buffer[:nbytes]
+
+        self._maybe_resume_transport()
+        return nbytes
+
     async def readexactly(self, n):
         """Read exactly `n` bytes.
 
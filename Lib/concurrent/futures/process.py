@@ -53,7 +53,9 @@
 # so that it can be accessed later as `mp.connection`
 import multiprocessing.connection
 from multiprocessing.queues import Queue
+from multiprocessing.reduction import ForkingPickler
 import threading
+import time
 import weakref
 from functools import partial
 import itertools
@@ -144,13 +146,17 @@ def __init__(self, future, fn, args, kwargs):
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        self.submit_time = time.monotonic()
 
 class _ResultItem(object):
-    def __init__(self, work_id, exception=None, result=None, exit_pid=None):
+    def __init__(self, work_id, exception=None, result=None, exit_pid=None,
+                 pid=None, run_time=0.0):
         self.work_id = work_id
         self.exception = exception
         self.result = result
         self.exit_pid = exit_pid
+        self.pid = pid
+        self.run_time = run_time
 
 class _CallItem(object):
     def __init__(self, work_id, fn, args, kwargs):
@@ -160,14 +166,41 @@ def __init__(self, work_id, fn, args, kwargs):
         self.kwargs = kwargs
 
 
+def _count_bytes_sent(writer, stats):
+    # Return the functions called by the feeder thread of the call queue
+    # with one or several pickled _CallItem.  They must not reference the
+    # queue: storing bound methods of the queue on itself would keep it
+    # alive in a cycle.
+    send_bytes = writer.send_bytes
+    send_bytes_many = writer._send_bytes_many
+    def send_counted_bytes(buf):
+        send_bytes(buf)
+        stats['bytes_sent'] += len(buf)
+    def send_counted_bytes_many(bufs):
+        send_bytes_many(bufs)
+        stats['bytes_sent'] += sum(len(buf) for buf in bufs)
+    return send_counted_bytes, send_counted_bytes_many
+
+
 class _SafeQueue(Queue):
     """Safe Queue set exception to the future object linked to a job"""
     def __init__(self, max_size=0, *, ctx, pending_work_items, shutdown_lock,
-                 thread_wakeup):
+                 thread_wakeup, stats, shared_memory_threshold=None):
         self.pending_work_items = pending_work_items
         self.shutdown_lock = shutdown_lock
         self.thread_wakeup = thread_wakeup
-        super().__init__(max_size, ctx=ctx)
+        self.stats = stats
+        super().__init__(max_size, ctx=ctx,
+                         shared_memory_threshold=shared_memory_threshold)
+
+    def _reset(self, after_fork=False):
+        super()._reset(after_fork=after_fork)
+        # The worker processes only read from the call queue: when it is
+        # unpickled there by the spawn and forkserver start methods, _reset()
+        # is called without the attributes set by __init__().
+        if hasattr(self, 'stats'):
+            self._send_bytes, self._send_bytes_many = _count_bytes_sent(
+                self._writer, self.stats)
 
     def _on_queue_feeder_error(self, e, obj):
         if isinstance(obj, _CallItem):
@@ -208,15 +241,17 @@ def _process_chunk(fn, chunk):
 
 
 def _sendback_result(result_queue, work_id, result=None, exception=None,
-                     exit_pid=None):
+                     exit_pid=None, pid=None, run_time=0.0):
     """Safely send back the given result or exception"""
     try:
         result_queue.put(_ResultItem(work_id, result=result,
-                                     exception=exception, exit_pid=exit_pid))
+                                     exception=exception, exit_pid=exit_pid,
+                                     pid=pid, run_time=run_time))
     except BaseException as e:
         exc = _ExceptionWithTraceback(e, e.__traceback__)
         result_queue.put(_ResultItem(work_id, exception=exc,
-                                     exit_pid=exit_pid))
+                                     exit_pid=exit_pid, pid=pid,
+                                     run_time=run_time))
 
 
 def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None):
@@ -242,27 +277,31 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             return
     num_tasks = 0
     exit_pid = None
+    pid = os.getpid()
     while True:
         call_item = call_queue.get(block=True)
         if call_item is None:
             # Wake up queue management thread
-            result_queue.put(os.getpid())
+            result_queue.put(pid)
             return
 
         if max_tasks is not None:
             num_tasks += 1
             if num_tasks >= max_tasks:
-                exit_pid = os.getpid()
+                exit_pid = pid
 
+        start_time = time.monotonic()
         try:
             r = call_item.fn(*call_item.args, **call_item.kwargs)
         except BaseException as e:
             exc = _ExceptionWithTraceback(e, e.__traceback__)
             _sendback_result(result_queue, call_item.work_id, exception=exc,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid, pid=pid,
+                             run_time=time.monotonic() - start_time)
         else:
             _sendback_result(result_queue, call_item.work_id, result=r,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid, pid=pid,
+                             run_time=time.monotonic() - start_time)
             del r
 
         # Liberate the resource as soon as possible, to avoid holding onto
@@ -330,6 +369,9 @@ def weakref_cb(_,
         #     {5: <_WorkItem...>, 6: <_WorkItem...>, ...}
         self.pending_work_items = executor._pending_work_items
 
+        # A dict of counters reported by ProcessPoolExecutor.stats().
+        self.stats = executor._stats
+
         super().__init__()
 
     def run(self):
@@ -350,6 +392,7 @@ def run(self):
                 if process_exited:
                     p = self.processes.pop(result_item.exit_pid)
                     p.join()
+                    self.stats['worker_restarts'] += 1
 
                 # Delete reference to result_item to avoid keeping references
                 # while waiting on new results.
@@ -418,7 +461,10 @@ def wait_result_broken_or_wakeup(self):
         result_item = None
         if result_reader in ready:
             try:
-                result_item = result_reader.recv()
+                data = result_reader.recv_bytes()
+                self.stats['bytes_received'] += len(data)
+                result_item = ForkingPickler.loads(data)
+                del data
                 is_broken = False
             except BaseException as e:
                 cause = format_exception(type(e), e, e.__traceback__)
@@ -447,8 +493,17 @@ def process_result_item(self, result_item):
         else:
             # Received a _ResultItem so mark the future as completed.
             work_item = self.pending_work_items.pop(result_item.work_id, None)
+            stats = self.stats
+            tasks_done = stats['tasks_done']
+            tasks_done[result_item.pid] = tasks_done.get(result_item.pid, 0) + 1
+            stats['run_time'] += result_item.run_time
             # work_item can be None if another process terminated (see above)
             if work_item is not None:
+                # Everything but running the call: waiting in the queues,
+                # pickling and transferring the call and its result.
+                stats['wait_time'] += max(0.0, time.monotonic()
+                                          - work_item.submit_time
+                                          - result_item.run_time)
                 if result_item.exception:
                     work_item.future.set_exception(result_item.exception)
                 else:
@@ -616,7 +671,8 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=(), *, max_tasks_per_child=None):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None,
+                 shared_memory_threshold=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -634,6 +690,10 @@ def __init__(self, max_workers=None, mp_context=None,
                 live as long as the executor. Requires a non-'fork' mp_context
                 start method. When given, we default to using 'spawn' if no
                 mp_context is supplied.
+            shared_memory_threshold: If not None, the out-of-band buffers of
+                at least this many bytes in the calls and results, such as
+                pickle.PickleBuffer objects and the contents of arrays, are
+                passed through shared memory instead of being pickled.
         """
         _check_system_limits()
 
@@ -694,6 +754,14 @@ def __init__(self, max_workers=None, mp_context=None,
         self._queue_count = 0
         self._pending_work_items = {}
         self._cancel_pending_futures = False
+        self._stats = {
+            'tasks_done': {},
+            'bytes_sent': 0,
+            'bytes_received': 0,
+            'run_time': 0.0,
+            'wait_time': 0.0,
+            'worker_restarts': 0,
+        }
 
         # _ThreadWakeup is a communication channel used to interrupt the wait
         # of the main loop of executor_manager_thread from another thread (e.g.
@@ -714,12 +782,18 @@ def __init__(self, max_workers=None, mp_context=None,
             max_size=queue_size, ctx=self._mp_context,
             pending_work_items=self._pending_work_items,
             shutdown_lock=self._shutdown_lock,
-            thread_wakeup=self._executor_manager_thread_wakeup)
+            thread_wakeup=self._executor_manager_thread_wakeup,
+            stats=self._stats,
+            shared_memory_threshold=shared_memory_threshold)
         # Killed worker processes can produce spurious "broken pipe"
         # tracebacks in the queue's own worker thread. But we detect killed
         # processes anyway, so silence the tracebacks.
         self._call_queue._ignore_epipe = True
-        self._result_queue = mp_context.SimpleQueue()
+        if shared_memory_threshold is None:
+            self._result_queue = mp_context.SimpleQueue()
+        else:
+            self._result_queue = mp_context.SimpleQueue(
+                shared_memory_threshold=shared_memory_threshold)
         self._work_ids = queue.Queue()
 
     def _start_executor_manager_thread(self):
@@ -791,7 +865,7 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -802,6 +876,11 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+            buffersize: The number of submitted chunks whose results have not
+                yet been yielded. If the buffer is full, iteration over the
+                iterables pauses until a result is yielded from the buffer.
+                If None, all input elements are eagerly collected, and a task
+                is submitted for each chunk.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -817,9 +896,119 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
 
         results = super().map(partial(_process_chunk, fn),
                               _get_chunks(*iterables, chunksize=chunksize),
-                              timeout=timeout)
+                              timeout=timeout,
+                              buffersize=buffersize)
         return _chain_from_iterable_of_lists(results)
 
+    def map_unordered(self, fn, *iterables, timeout=None, chunksize=1,
+                      buffersize=None):
+        """Returns an iterator over fn(*args) in order of completion.
+
+        Args:
+            fn: A callable that will take as many arguments as there are
+                passed iterables.
+            timeout: The maximum number of seconds to wait. If None, then there
+                is no limit on the wait time.
+            chunksize: If greater than one, the iterables will be chopped into
+                chunks of size chunksize and submitted to the process pool.
+                If set to one, the items in the list will be sent one at a time.
+            buffersize: The number of submitted chunks whose results have not
+                yet been yielded. If the buffer is full, iteration over the
+                iterables pauses until a chunk completes. If None, all input
+                elements are eagerly collected, and a task is submitted for
+                each chunk.
+
+        Returns:
+            An iterator yielding the same values as map(func, *iterables),
+            but in the order in which their chunks complete. The results
+            of a chunk are yielded together, in input order.
+
+        Raises:
+            TimeoutError: If the entire result iterator could not be generated
+                before the given timeout.
+            Exception: If fn(*args) raises for any values.
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1.")
+        if buffersize is not None and not isinstance(buffersize, int):
+            raise TypeError("buffersize must be an integer or None")
+        if buffersize is not None and buffersize < 1:
+            raise ValueError("buffersize must be None or > 0")
+
+        if timeout is not None:
+            end_time = timeout + time.monotonic()
+
+        chunk_fn = partial(_process_chunk, fn)
+        chunks = _get_chunks(*iterables, chunksize=chunksize)
+        # Futures are put in this queue by their done callback.
+        done = queue.SimpleQueue()
+        fs = set()
+
+        def submit(executor, chunk):
+            f = executor.submit(chunk_fn, chunk)
+            fs.add(f)
+            f.add_done_callback(done.put)
+
+        for chunk in itertools.islice(chunks, buffersize):
+            submit(self, chunk)
+
+        # Use a weak reference to ensure that the executor can be garbage
+        # collected independently of the result_iterator closure.
+        executor_weakref = weakref.ref(self)
+
+        # Yield must be hidden in closure so that the futures are submitted
+        # before the first iterator value is required.
+        def result_iterator():
+            try:
+                while fs:
+                    if timeout is None:
+                        f = done.get()
+                    else:
+                        try:
+                            f = done.get(
+                                timeout=max(0, end_time - time.monotonic()))
+                        except queue.Empty:
+                            raise _base.TimeoutError from None
+                    fs.remove(f)
+                    if buffersize and (executor := executor_weakref()):
+                        chunk = next(chunks, None)
+                        if chunk is not None:
+                            submit(executor, chunk)
+                        del executor
+                    try:
+                        results = f.result()
+                    finally:
+                        # Break a reference cycle with the exception
+                        del f
+                    results.reverse()
+                    while results:
+                        yield results.pop()
+            finally:
+                for f in fs:
+                    f.cancel()
+        return result_iterator()
+
+    def stats(self):
+        """Returns a dict of counters describing the work of the pool.
+
+        The counters are updated as results come back from the workers:
+
+        - 'tasks_done': Dict mapping the pid of each worker process,
+          including the ones which exited, to the number of tasks it ran;
+        - 'bytes_sent': Size of the pickled calls sent to the workers;
+        - 'bytes_received': Size of the pickled results received from
+          the workers;
+        - 'run_time': Seconds spent by the workers running the calls;
+        - 'wait_time': Seconds from the submission of the calls to the
+          reception of their results, other than running them: waiting
+          in the queues, pickling and transferring the data;
+        - 'worker_restarts': Number of workers which exited after running
+          max_tasks_per_child tasks.
+        """
+        stats = dict(self._stats)
+        stats['tasks_done'] = dict(stats['tasks_done'])
+        return stats
+
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
             self._cancel_pending_futures = cancel_futures
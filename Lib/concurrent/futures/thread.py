@@ -6,6 +6,7 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 from concurrent.futures import _base
+import collections
 import itertools
 import queue
 import threading
@@ -66,7 +67,31 @@ def run(self):
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
-def _worker(executor_reference, work_queue, initializer, initargs):
+def _get_work_item(executor_reference, work_queue, local_queue):
+    # Return a work item without blocking, or raise queue.Empty.  A worker
+    # with a local queue takes the last item pushed to it, then the items
+    # submitted from outside the pool, then steals the oldest item of
+    # another worker's local queue.
+    if local_queue is None:
+        return work_queue.get_nowait()
+    try:
+        return local_queue.pop()
+    except IndexError:
+        pass
+    try:
+        return work_queue.get_nowait()
+    except queue.Empty:
+        pass
+    executor = executor_reference()
+    if executor is not None:
+        work_item = executor._steal_work_item(local_queue)
+        if work_item is not None:
+            return work_item
+    raise queue.Empty
+
+
+def _worker(executor_reference, work_queue, initializer, initargs,
+            idle_timeout=None, local_queue=None):
     if initializer is not None:
         try:
             initializer(*initargs)
@@ -76,17 +101,43 @@ def _worker(executor_reference, work_queue, initializer, initargs):
             if executor is not None:
                 executor._initializer_failed()
             return
+    if local_queue is not None:
+        executor = executor_reference()
+        if executor is not None:
+            executor._worker_local.queue = local_queue
+        del executor
     try:
         while True:
             try:
-                work_item = work_queue.get_nowait()
+                work_item = _get_work_item(executor_reference, work_queue,
+                                           local_queue)
             except queue.Empty:
                 # attempt to increment idle count if queue is empty
                 executor = executor_reference()
                 if executor is not None:
                     executor._idle_semaphore.release()
+                    if local_queue is not None:
+                        # An item pushed to a local queue before the idle
+                        # count was incremented woke up no thread: look for
+                        # one again.
+                        work_item = executor._steal_work_item(local_queue)
+                        if work_item is not None:
+                            executor._idle_semaphore.acquire(timeout=0)
+                            del executor
+                            work_item.run()
+                            del work_item
+                            continue
                 del executor
-                work_item = work_queue.get(block=True)
+                try:
+                    work_item = work_queue.get(block=True,
+                                               timeout=idle_timeout)
+                except queue.Empty:
+                    # The thread was idle for idle_timeout seconds.
+                    executor = executor_reference()
+                    if executor is None or executor._retire_worker(local_queue):
+                        return
+                    del executor
+                    continue
 
             if work_item is not None:
                 work_item.run()
@@ -104,6 +155,16 @@ def _worker(executor_reference, work_queue, initializer, initargs):
                 # is not gc-ed yet.
                 if executor is not None:
                     executor._shutdown = True
+                    if local_queue is not None:
+                        # Run the items left in the local queues of busy
+                        # workers, which may be waiting for them.
+                        work_item = executor._steal_work_item(local_queue)
+                        if work_item is not None:
+                            del executor
+                            work_queue.put(None)
+                            work_item.run()
+                            del work_item
+                            continue
                 # Notice other workers
                 work_queue.put(None)
                 return
@@ -124,7 +185,8 @@ class ThreadPoolExecutor(_base.Executor):
     _counter = itertools.count().__next__
 
     def __init__(self, max_workers=None, thread_name_prefix='',
-                 initializer=None, initargs=()):
+                 initializer=None, initargs=(), *, work_stealing=False,
+                 idle_timeout=None):
         """Initializes a new ThreadPoolExecutor instance.
 
         Args:
@@ -133,6 +195,12 @@ def __init__(self, max_workers=None, thread_name_prefix='',
             thread_name_prefix: An optional name prefix to give our threads.
             initializer: A callable used to initialize worker threads.
             initargs: A tuple of arguments to pass to the initializer.
+            work_stealing: If true, each worker thread has a local queue
+                receiving the calls submitted by the thread, and idle
+                threads steal calls from the local queues of busy threads.
+            idle_timeout: The number of seconds after which an idle worker
+                thread exits. If None, worker threads live as long as the
+                executor.
         """
         if max_workers is None:
             # ThreadPoolExecutor is often used to:
@@ -149,9 +217,22 @@ def __init__(self, max_workers=None, thread_name_prefix='',
         if initializer is not None and not callable(initializer):
             raise TypeError("initializer must be a callable")
 
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be greater than 0")
+
         self._max_workers = max_workers
         self._work_queue = queue.SimpleQueue()
         self._idle_semaphore = threading.Semaphore(0)
+        self._idle_timeout = idle_timeout
+        self._work_stealing = work_stealing
+        # Local queues of the worker threads, replaced rather than mutated
+        # so that the workers can iterate over them without locking.
+        self._local_queues = ()
+        self._worker_local = threading.local()
+        self._steals = 0
+        self._steals_lock = threading.Lock()
+        self._threads_retired = 0
+        self._thread_index = itertools.count().__next__
         self._threads = set()
         self._broken = False
         self._shutdown = False
@@ -175,14 +256,23 @@ def submit(self, fn, /, *args, **kwargs):
             f = _base.Future()
             w = _WorkItem(f, fn, args, kwargs)
 
-            self._work_queue.put(w)
-            self._adjust_thread_count()
+            local_queue = getattr(self._worker_local, 'queue', None)
+            if local_queue is not None:
+                # Submitted by a worker thread: an idle thread is woken up
+                # to steal the item if the worker does not get to it first.
+                local_queue.append(w)
+                self._adjust_thread_count(wake_up=True)
+            else:
+                self._work_queue.put(w)
+                self._adjust_thread_count()
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def _adjust_thread_count(self):
+    def _adjust_thread_count(self, wake_up=False):
         # if idle threads are available, don't spin new threads
         if self._idle_semaphore.acquire(timeout=0):
+            if wake_up:
+                self._work_queue.put(None)
             return
 
         # When the executor gets lost, the weakref callback will wake up
@@ -193,28 +283,108 @@ def weakref_cb(_, q=self._work_queue):
         num_threads = len(self._threads)
         if num_threads < self._max_workers:
             thread_name = '%s_%d' % (self._thread_name_prefix or self,
-                                     num_threads)
+                                     self._thread_index())
+            local_queue = None
+            if self._work_stealing:
+                local_queue = collections.deque()
+                self._local_queues += (local_queue,)
             t = threading.Thread(name=thread_name, target=_worker,
                                  args=(weakref.ref(self, weakref_cb),
                                        self._work_queue,
                                        self._initializer,
-                                       self._initargs))
+                                       self._initargs,
+                                       self._idle_timeout,
+                                       local_queue))
             t.start()
             self._threads.add(t)
             _threads_queues[t] = self._work_queue
 
+    def _steal_work_item(self, local_queue):
+        # Return the oldest item of another worker's local queue, or None.
+        for other_queue in self._local_queues:
+            if other_queue is not local_queue:
+                try:
+                    work_item = other_queue.popleft()
+                except IndexError:
+                    continue
+                with self._steals_lock:
+                    self._steals += 1
+                return work_item
+        return None
+
+    def _retire_worker(self, local_queue):
+        # Called by a worker thread which was idle for idle_timeout seconds.
+        # Return True if it must exit.
+        with self._shutdown_lock, _global_shutdown_lock:
+            if self._shutdown or _shutdown:
+                return False
+            # The idle count was incremented by the thread before waiting:
+            # a submit() which decremented it counts on the thread.
+            if not self._idle_semaphore.acquire(timeout=0):
+                return False
+            if (not self._work_queue.empty()
+                    or any(self._local_queues)):
+                return False
+            t = threading.current_thread()
+            self._threads.discard(t)
+            _threads_queues.pop(t, None)
+            if local_queue is not None:
+                self._local_queues = tuple(q for q in self._local_queues
+                                           if q is not local_queue)
+            self._threads_retired += 1
+            return True
+
+    def _drain_work_items(self):
+        # Remove and return the work items which were not started.
+        work_items = []
+        while True:
+            try:
+                work_item = self._work_queue.get_nowait()
+            except queue.Empty:
+                break
+            if work_item is not None:
+                work_items.append(work_item)
+        for local_queue in self._local_queues:
+            while True:
+                try:
+                    work_items.append(local_queue.popleft())
+                except IndexError:
+                    break
+        return work_items
+
+    def stats(self):
+        """Returns a dict describing the threads and queues of the pool.
+
+        The values are approximate, since the workers update them
+        concurrently:
+
+        - 'threads': Number of worker threads;
+        - 'idle_threads': Number of worker threads waiting for work;
+        - 'queue_depth': Number of calls submitted from outside the pool
+          which were not started;
+        - 'local_queue_depths': List of the numbers of calls in the local
+          queue of each worker thread, with work_stealing;
+        - 'steals': Number of calls run by another thread than the one
+          which submitted them, with work_stealing;
+        - 'threads_retired': Number of worker threads which exited after
+          being idle for idle_timeout seconds.
+        """
+        return {
+            'threads': len(self._threads),
+            'idle_threads': self._idle_semaphore._value,
+            'queue_depth': self._work_queue.qsize(),
+            'local_queue_depths': [len(q) for q in self._local_queues],
+            'steals': self._steals,
+            'threads_retired': self._threads_retired,
+        }
+
     def _initializer_failed(self):
         with self._shutdown_lock:
             self._broken = ('A thread initializer failed, the thread pool '
                             'is not usable anymore')
             # Drain work queue and mark pending futures failed
-            while True:
-                try:
-                    work_item = self._work_queue.get_nowait()
-                except queue.Empty:
-                    break
-                if work_item is not None:
-                    work_item.future.set_exception(BrokenThreadPool(self._broken))
+            for work_item in self._drain_work_items():
+                work_item.future.set_exception(BrokenThreadPool(self._broken))
 
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
@@ -222,13 +392,8 @@ def shutdown(self, wait=True, *, cancel_futures=False):
             if cancel_futures:
                 # Drain all work items from the queue, and then cancel their
                 # associated futures.
-                while True:
-                    try:
-                        work_item = self._work_queue.get_nowait()
-                    except queue.Empty:
-                        break
-                    if work_item is not None:
-                        work_item.future.cancel()
+                for work_item in self._drain_work_items():
+                    work_item.future.cancel()
 
             # Send a wake-up to prevent threads calling
             # _work_queue.get(block=True) from permanently blocking.
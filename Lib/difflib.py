@@ -4,6 +4,10 @@
 Function get_close_matches(word, possibilities, n=3, cutoff=0.6):
     Use SequenceMatcher to return list of the best "good enough" matches.
 
+Class CloseMatchIndex:
+    Like get_close_matches(), for repeated queries against the same
+    possibilities.
+
 Function context_diff(a, b):
     For two lists of strings, return a delta in context diff format.
 
@@ -28,10 +32,12 @@
 
 __all__ = ['get_close_matches', 'ndiff', 'restore', 'SequenceMatcher',
            'Differ','IS_CHARACTER_JUNK', 'IS_LINE_JUNK', 'context_diff',
-           'unified_diff', 'diff_bytes', 'HtmlDiff', 'Match']
+           'unified_diff', 'diff_bytes', 'HtmlDiff', 'Match',
+           'CloseMatchIndex']
 
+from bisect import bisect_left as _bisect_left
 from heapq import nlargest as _nlargest
-from collections import namedtuple as _namedtuple
+from collections import Counter as _Counter, namedtuple as _namedtuple
 from types import GenericAlias
 
 Match = _namedtuple('Match', 'a b size')
@@ -41,6 +47,12 @@ def _calculate_ratio(matches, length):
         return 2.0 * matches / length
     return 1.0
 
+_ALGORITHMS = (None, 'patience')
+
+def _check_algorithm(algorithm):
+    if algorithm not in _ALGORITHMS:
+        raise ValueError('unknown diff algorithm: %r' % (algorithm,))
+
 class SequenceMatcher:
 
     """
@@ -115,9 +127,17 @@ class SequenceMatcher:
     case.  SequenceMatcher is quadratic time for the worst case and has
     expected-case behavior dependent in a complicated way on how many
     elements the sequences have in common; best case time is linear.
+
+    With algorithm='patience', matches are first anchored on the elements
+    which appear exactly once in both sequences, as done by "patience
+    diff", and the default method is only applied to the regions between
+    these anchors which have none.  This is close to linear time on
+    typical inputs such as large files where most lines are unique, and
+    tends to produce diffs which follow the structure of source code.
     """
 
-    def __init__(self, isjunk=None, a='', b='', autojunk=True):
+    def __init__(self, isjunk=None, a='', b='', autojunk=True, *,
+                 algorithm=None):
         """Construct a SequenceMatcher.
 
         Optional arg isjunk is None (the default), or a one-argument
@@ -139,6 +159,11 @@ def __init__(self, isjunk=None, a='', b='', autojunk=True):
         Optional arg autojunk should be set to False to disable the
         "automatic junk heuristic" that treats popular elements as junk
         (see module documentation for more information).
+
+        Optional keyword arg algorithm selects how matching blocks are
+        found: None (the default) for the method described above, or
+        'patience' to anchor the matches on elements that are unique in
+        both sequences first.
         """
 
         # Members:
@@ -175,10 +200,14 @@ def __init__(self, isjunk=None, a='', b='', autojunk=True):
         #      the items in b for which isjunk is True.
         # bpopular
         #      nonjunk items in b treated as junk by the heuristic (if used).
+        # algorithm
+        #      None or 'patience', see get_matching_blocks()
 
+        _check_algorithm(algorithm)
         self.isjunk = isjunk
         self.a = self.b = None
         self.autojunk = autojunk
+        self.algorithm = algorithm
         self.set_seqs(a, b)
 
     def set_seqs(self, a, b):
@@ -449,8 +478,15 @@ def get_matching_blocks(self):
         # at the end.
         queue = [(0, la, 0, lb)]
         matching_blocks = []
+        patience = self.algorithm == 'patience'
         while queue:
             alo, ahi, blo, bhi = queue.pop()
+            if patience:
+                rest = self.__patience_match(alo, ahi, blo, bhi,
+                                             queue, matching_blocks)
+                if rest is None:
+                    continue
+                alo, ahi, blo, bhi = rest
             i, j, k = x = self.find_longest_match(alo, ahi, blo, bhi)
             # a[alo:i] vs b[blo:j] unknown
             # a[i:i+k] same as b[j:j+k]
@@ -489,6 +525,81 @@ def get_matching_blocks(self):
         self.matching_blocks = list(map(Match._make, non_adjacent))
         return self.matching_blocks
 
+    def __patience_match(self, alo, ahi, blo, bhi, queue, matching_blocks):
+        # Patience diff:  match the common prefix and suffix of a[alo:ahi]
+        # and b[blo:bhi], then the longest run of elements appearing exactly
+        # once in both ranges in the same order, and queue the regions left
+        # between those anchors.  If there are no anchors, return what
+        # remains of the ranges for find_longest_match(), else None.
+        a, b, b2j = self.a, self.b, self.b2j
+        i, j = alo, blo
+        while i < ahi and j < bhi and a[i] == b[j]:
+            i, j = i+1, j+1
+        if i > alo:
+            matching_blocks.append((alo, blo, i-alo))
+            alo, blo = i, j
+        i, j = ahi, bhi
+        while i > alo and j > blo and a[i-1] == b[j-1]:
+            i, j = i-1, j-1
+        if i < ahi:
+            matching_blocks.append((i, j, ahi-i))
+            ahi, bhi = i, j
+        if alo == ahi or blo == bhi:
+            return None
+
+        # Find the elements unique in a[alo:ahi], then look them up in the
+        # b2j index built by set_seq2(), which leaves out junk and popular
+        # elements, to keep those also unique in b[blo:bhi].
+        a2i = {}
+        for i in range(alo, ahi):
+            elt = a[i]
+            a2i[elt] = -1 if elt in a2i else i
+        pairs = []
+        for elt, i in a2i.items():
+            if i < 0:
+                continue
+            indices = b2j.get(elt)
+            if indices is None:
+                continue
+            k = _bisect_left(indices, blo)
+            if k == len(indices) or indices[k] >= bhi:
+                continue
+            if k+1 < len(indices) and indices[k+1] < bhi:
+                continue
+            pairs.append((indices[k], i))
+        if not pairs:
+            return alo, ahi, blo, bhi
+        pairs.sort()
+
+        # Longest subsequence of pairs increasing in a, by patience sorting.
+        tails = []      # a index ending the best subsequence of each length
+        tailpairs = []  # position in pairs of these ends
+        backlinks = []
+        for n, (j, i) in enumerate(pairs):
+            k = _bisect_left(tails, i)
+            backlinks.append(tailpairs[k-1] if k else -1)
+            if k == len(tails):
+                tails.append(i)
+                tailpairs.append(n)
+            else:
+                tails[k] = i
+                tailpairs[k] = n
+        anchors = []
+        n = tailpairs[-1]
+        while n >= 0:
+            anchors.append(pairs[n])
+            n = backlinks[n]
+        anchors.reverse()
+
+        for j, i in anchors:
+            matching_blocks.append((i, j, 1))
+            if alo < i and blo < j:
+                queue.append((alo, i, blo, j))
+            alo, blo = i+1, j+1
+        if alo < ahi and blo < bhi:
+            queue.append((alo, ahi, blo, bhi))
+        return None
+
     def get_opcodes(self):
         """Return list of 5-tuples describing how to turn a into b.
 
@@ -663,6 +774,18 @@ def real_quick_ratio(self):
     __class_getitem__ = classmethod(GenericAlias)
 
 
+def _count_elements(seq):
+    counts = {}
+    for elt in seq:
+        counts[elt] = counts.get(elt, 0) + 1
+    return counts
+
+def _check_close_matches_args(n, cutoff):
+    if not n >  0:
+        raise ValueError("n must be > 0: %r" % (n,))
+    if not 0.0 <= cutoff <= 1.0:
+        raise ValueError("cutoff must be in [0.0, 1.0]: %r" % (cutoff,))
+
 def get_close_matches(word, possibilities, n=3, cutoff=0.6):
     """Use SequenceMatcher to return list of the best "good enough" matches.
 
@@ -690,12 +813,12 @@ def get_close_matches(word, possibilities, n=3, cutoff=0.6):
     []
     >>> get_close_matches("accept", _keyword.kwlist)
     ['except']
+
+    See also CloseMatchIndex, to look up many words in the same
+    possibilities.
     """
 
-    if not n >  0:
-        raise ValueError("n must be > 0: %r" % (n,))
-    if not 0.0 <= cutoff <= 1.0:
-        raise ValueError("cutoff must be in [0.0, 1.0]: %r" % (cutoff,))
+    _check_close_matches_args(n, cutoff)
     result = []
     s = SequenceMatcher()
     s.set_seq2(word)
@@ -712,6 +835,105 @@ def get_close_matches(word, possibilities, n=3, cutoff=0.6):
     return [x for score, x in result]
 
 
+class CloseMatchIndex:
+    """Index of possibilities for repeated get_close_matches() queries.
+
+    get_close_matches() runs a SequenceMatcher against every possibility.
+    CloseMatchIndex groups the possibilities by length and keeps, for each
+    group, an inverted index from elements to the possibilities containing
+    them.  A query skips the groups whose length alone rules them out, and
+    uses the inverted index to compute the quick_ratio() upper bound of
+    the possibilities of the other groups all at once; only the few
+    remaining candidates go through the expensive ratio().  The results
+    are the same as get_close_matches().
+
+    >>> import keyword as _keyword
+    >>> index = CloseMatchIndex(_keyword.kwlist)
+    >>> index.get_close_matches("wheel")
+    ['while']
+    >>> index.get_close_matches("accept")
+    ['except']
+    """
+
+    def __init__(self, possibilities):
+        """Build the index from possibilities, a list of sequences
+        (typically a list of strings).  Their elements must be hashable.
+        """
+        # Map each length to a pair (entries, postings), where entries is
+        # the list of (position, possibility) of the possibilities with
+        # that length, and postings[elt][r] the list of the indices in
+        # entries of the possibilities containing elt more than r times.
+        self._buckets = buckets = {}
+        for i, x in enumerate(possibilities):
+            bucket = buckets.get(len(x))
+            if bucket is None:
+                bucket = buckets[len(x)] = ([], {})
+            entries, postings = bucket
+            k = len(entries)
+            entries.append((i, x))
+            for elt, num in _count_elements(x).items():
+                levels = postings.setdefault(elt, [])
+                while len(levels) < num:
+                    levels.append([])
+                for r in range(num):
+                    levels[r].append(k)
+
+    def __len__(self):
+        return sum(len(entries) for entries, postings
+                   in self._buckets.values())
+
+    def get_close_matches(self, word, n=3, cutoff=0.6):
+        """Return a list of the best "good enough" matches for word.
+
+        The arguments and the result are the same as for the module-level
+        get_close_matches() with the possibilities of the index.
+        """
+
+        _check_close_matches_args(n, cutoff)
+        lw = len(word)
+        wordcounts = _count_elements(word).items()
+        candidates = []
+        for lx, (entries, postings) in self._buckets.items():
+            # Find the number of matches needed to reach cutoff, computed
+            # the same way as the ratios.  If more matches than the length
+            # of the shortest sequence are needed, real_quick_ratio() rules
+            # out the whole group.
+            for need in range(min(lx, lw) + 1):
+                if _calculate_ratio(need, lx + lw) >= cutoff:
+                    break
+            else:
+                continue
+            if not need:
+                candidates.extend(entries)
+                continue
+            # The number of matches counted by quick_ratio() is the size of
+            # the multiset intersection of the sequences.
+            matches = _Counter()
+            for elt, numw in wordcounts:
+                levels = postings.get(elt)
+                if levels is not None:
+                    for indices in levels[:numw]:
+                        matches.update(indices)
+            candidates.extend(entries[k] for k, m in matches.items()
+                              if m >= need)
+        # Keep the order of the possibilities, as get_close_matches().
+        candidates.sort(key=lambda entry: entry[0])
+
+        result = []
+        s = SequenceMatcher()
+        s.set_seq2(word)
+        for i, x in candidates:
+            s.set_seq1(x)
+            ratio = s.ratio()
+            if ratio >= cutoff:
+                result.append((ratio, x))
+
+        # Move the best scorers to head of list
+        result = _nlargest(n, result)
+        # Strip scores for the best n matches
+        return [x for score, x in result]
+
+
 def _keep_original_ws(s, tag_s):
     """Replace whitespace with the original whitespace characters in `s`"""
     return ''.join(
@@ -807,7 +1029,7 @@ class Differ:
     +   5. Flat is better than nested.
     """
 
-    def __init__(self, linejunk=None, charjunk=None):
+    def __init__(self, linejunk=None, charjunk=None, *, algorithm=None):
         """
         Construct a text differencer, with optional filters.
 
@@ -825,10 +1047,16 @@ def __init__(self, linejunk=None, charjunk=None):
           module-level function `IS_CHARACTER_JUNK` may be used to filter out
           whitespace characters (a blank or tab; **note**: bad idea to include
           newline in this!).  Use of IS_CHARACTER_JUNK is recommended.
+
+        The optional keyword parameter `algorithm` is passed to the
+        SequenceMatcher comparing the sequences of lines; 'patience' is much
+        faster on large inputs where most lines are unique.
         """
 
+        _check_algorithm(algorithm)
         self.linejunk = linejunk
         self.charjunk = charjunk
+        self.algorithm = algorithm
 
     def compare(self, a, b):
         r"""
@@ -856,7 +1084,8 @@ def compare(self, a, b):
         + emu
         """
 
-        cruncher = SequenceMatcher(self.linejunk, a, b)
+        cruncher = SequenceMatcher(self.linejunk, a, b,
+                                   algorithm=self.algorithm)
         for tag, alo, ahi, blo, bhi in cruncher.get_opcodes():
             if tag == 'replace':
                 g = self._fancy_replace(a, alo, ahi, b, blo, bhi)
@@ -1093,7 +1322,7 @@ def _format_range_unified(start, stop):
     return '{},{}'.format(beginning, length)
 
 def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
-                 tofiledate='', n=3, lineterm='\n'):
+                 tofiledate='', n=3, lineterm='\n', *, algorithm=None):
     r"""
     Compare two sequences of lines; generate the delta as a unified diff.
 
@@ -1115,6 +1344,9 @@ def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
     'fromfile', 'tofile', 'fromfiledate', and 'tofiledate'.
     The modification times are normally expressed in the ISO 8601 format.
 
+    The 'algorithm' keyword argument is passed to SequenceMatcher; set it
+    to 'patience' to speed up the comparison of large files.
+
     Example:
 
     >>> for line in unified_diff('one two three four'.split(),
@@ -1135,7 +1367,8 @@ def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
 
     _check_types(a, b, fromfile, tofile, fromfiledate, tofiledate, lineterm)
     started = False
-    for group in SequenceMatcher(None,a,b).get_grouped_opcodes(n):
+    matcher = SequenceMatcher(None, a, b, algorithm=algorithm)
+    for group in matcher.get_grouped_opcodes(n):
         if not started:
             started = True
             fromdate = '\t{}'.format(fromfiledate) if fromfiledate else ''
@@ -1178,7 +1411,8 @@ def _format_range_context(start, stop):
 
 # See http://www.unix.org/single_unix_specification/
 def context_diff(a, b, fromfile='', tofile='',
-                 fromfiledate='', tofiledate='', n=3, lineterm='\n'):
+                 fromfiledate='', tofiledate='', n=3, lineterm='\n', *,
+                 algorithm=None):
     r"""
     Compare two sequences of lines; generate the delta as a context diff.
 
@@ -1201,6 +1435,9 @@ def context_diff(a, b, fromfile='', tofile='',
     The modification times are normally expressed in the ISO 8601 format.
     If not specified, the strings default to blanks.
 
+    The 'algorithm' keyword argument is passed to SequenceMatcher; set it
+    to 'patience' to speed up the comparison of large files.
+
     Example:
 
     >>> print(''.join(context_diff('one\ntwo\nthree\nfour\n'.splitlines(True),
@@ -1224,7 +1461,8 @@ def context_diff(a, b, fromfile='', tofile='',
     _check_types(a, b, fromfile, tofile, fromfiledate, tofiledate, lineterm)
     prefix = dict(insert='+ ', delete='- ', replace='! ', equal='  ')
     started = False
-    for group in SequenceMatcher(None,a,b).get_grouped_opcodes(n):
+    matcher = SequenceMatcher(None, a, b, algorithm=algorithm)
+    for group in matcher.get_grouped_opcodes(n):
         if not started:
             started = True
             fromdate = '\t{}'.format(fromfiledate) if fromfiledate else ''
@@ -1300,7 +1538,7 @@ def decode(s):
     for line in lines:
         yield line.encode('ascii', 'surrogateescape')
 
-def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
+def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK, *, algorithm=None):
     r"""
     Compare `a` and `b` (lists of strings); return a `Differ`-style delta.
 
@@ -1318,6 +1556,9 @@ def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
       whitespace characters (a blank or tab; note: it's a bad idea to
       include newline in this!).
 
+    Optional keyword parameter `algorithm` selects the SequenceMatcher
+    algorithm used to compare the sequences of lines, see Differ.
+
     Tools/scripts/ndiff.py is a command-line front-end to this function.
 
     Example:
@@ -1335,7 +1576,7 @@ def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
     + tree
     + emu
     """
-    return Differ(linejunk, charjunk).compare(a, b)
+    return Differ(linejunk, charjunk, algorithm=algorithm).compare(a, b)
 
 def _mdiff(fromlines, tolines, context=None, linejunk=None,
            charjunk=IS_CHARACTER_JUNK):
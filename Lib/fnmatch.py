@@ -8,13 +8,16 @@
 
 The function translate(PATTERN) returns a regular expression
 corresponding to PATTERN.  (It does not compile it.)
+
+The function compile_many(PATTERNS) returns a function testing whether a
+name matches any of several patterns at once.
 """
 import os
 import posixpath
 import re
 import functools
 
-__all__ = ["filter", "fnmatch", "fnmatchcase", "translate"]
+__all__ = ["filter", "fnmatch", "fnmatchcase", "translate", "compile_many"]
 
 def fnmatch(name, pat):
     """Test whether FILENAME matches PATTERN.
@@ -45,11 +48,99 @@ def _compile_pattern(pat):
         res = translate(pat)
     return re.compile(res).match
 
+_MAGIC_CHARS = frozenset('*?[')
+
+@functools.lru_cache(maxsize=32768, typed=True)
+def _compile_many(patterns):
+    # Patterns without wildcards are looked up in a set, and patterns with
+    # a single leading or trailing '*' are checked with str.endswith() or
+    # str.startswith().  All other patterns are joined in one regular
+    # expression.
+    if not patterns:
+        return lambda name: False
+    is_bytes = isinstance(patterns[0], bytes)
+    name_type = bytes if is_bytes else str
+    pat_strs = []
+    literals = set()
+    prefixes = []
+    suffixes = []
+    regexes = []
+    for pat in patterns:
+        if isinstance(pat, bytes) != is_bytes:
+            raise TypeError("cannot mix str and bytes patterns")
+        pat_str = str(pat, 'ISO-8859-1') if is_bytes else pat
+        pat_strs.append(pat_str)
+        if _MAGIC_CHARS.isdisjoint(pat_str):
+            literals.add(pat)
+        elif pat_str[0] == '*' and _MAGIC_CHARS.isdisjoint(pat_str[1:]):
+            suffixes.append(pat[1:])
+        elif pat_str[-1] == '*' and _MAGIC_CHARS.isdisjoint(pat_str[:-1]):
+            prefixes.append(pat[:-1])
+        else:
+            regexes.append(translate(pat_str))
+    prefixes = tuple(prefixes)
+    suffixes = tuple(suffixes)
+
+    def compile_regex(regexes):
+        res = '|'.join(regexes)
+        if is_bytes:
+            res = bytes(res, 'ISO-8859-1')
+        return re.compile(res).match
+
+    regex_match = compile_regex(regexes) if regexes else None
+    all_regex_match = None
+
+    def match_other_type(name):
+        # A name which is not a str (or bytes) goes through a regular
+        # expression of all the patterns: it raises TypeError for the other
+        # type, and supports bytes-like objects.
+        nonlocal all_regex_match
+        if all_regex_match is None:
+            all_regex_match = compile_regex(map(translate, pat_strs))
+        return all_regex_match(name) is not None
+
+    if not prefixes and not suffixes and regex_match is None:
+        def match(name):
+            if not isinstance(name, name_type):
+                return match_other_type(name)
+            return name in literals
+        return match
+    if not literals and not prefixes and regex_match is None:
+        def match(name):
+            if not isinstance(name, name_type):
+                return match_other_type(name)
+            return name.endswith(suffixes)
+        return match
+    def match(name):
+        if not isinstance(name, name_type):
+            return match_other_type(name)
+        if name in literals:
+            return True
+        if suffixes and name.endswith(suffixes):
+            return True
+        if prefixes and name.startswith(prefixes):
+            return True
+        return regex_match is not None and regex_match(name) is not None
+    return match
+
+def compile_many(patterns):
+    """Return a function testing whether a name matches any of PATTERNS.
+
+    PATTERNS is an iterable of shell patterns, all str or all bytes.  The
+    returned function takes a name and returns True if it matches at
+    least one of the patterns, like fnmatchcase() would, but much faster
+    than trying each pattern in turn: patterns without wildcards and
+    patterns like '*.ext' or 'prefix*' are checked with set lookups and
+    string methods, and all others are combined into a single regular
+    expression.  Names and patterns are not case-normalized.
+    """
+    return _compile_many(tuple(patterns))
+
 def filter(names, pat):
     """Construct a list from those elements of the iterable NAMES that match PAT."""
     result = []
     pat = os.path.normcase(pat)
-    match = _compile_pattern(pat)
+    match = _compile_many((pat,))
     if os.path is posixpath:
         # normcase on posix is NOP. Optimize it away from the loop.
         for name in names:
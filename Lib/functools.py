@@ -15,10 +15,11 @@
            'cached_property']
 
 from abc import get_cache_token
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 # import types, weakref  # Deferred to single_dispatch()
 from reprlib import recursive_repr
 from _thread import RLock
+from time import monotonic as _monotonic
 from types import GenericAlias
 
 
@@ -428,6 +429,8 @@ def _unwrap_partial(func):
 ################################################################################
 
 _CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+_PolicyCacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize",
+                                            "evictions", "expirations"])
 
 class _HashedSeq(list):
     """ This class guarantees that hash() will be called no more than once
@@ -476,7 +479,7 @@ def _make_key(args, kwds, typed,
         return key[0]
     return _HashedSeq(key)
 
-def lru_cache(maxsize=128, typed=False):
+def lru_cache(maxsize=128, typed=False, *, ttl=None, weigher=None):
     """Least-recently-used cache decorator.
 
     If *maxsize* is set to None, the LRU features are disabled and the cache
@@ -487,11 +490,18 @@ def lru_cache(maxsize=128, typed=False):
     distinct calls with distinct results. Some types such as str and int may
     be cached separately even when typed is false.
 
+    If *ttl* is set, results are discarded *ttl* seconds after they were
+    computed.  If *weigher* is set, it is called with each result and must
+    return a non-negative number; *maxsize* then bounds the total weight of
+    the cached results rather than their number.
+
     Arguments to the cached function must be hashable.
 
     View the cache statistics named tuple (hits, misses, maxsize, currsize)
     with f.cache_info().  Clear the cache and statistics with f.cache_clear().
-    Access the underlying function with f.__wrapped__.
+    Access the underlying function with f.__wrapped__.  If *ttl* or *weigher*
+    is set, the statistics also include the number of evictions and
+    expirations, and currsize is the total weight of the cached results.
 
     See:  https://en.wikipedia.org/wiki/Cache_replacement_policies#Least_recently_used_(LRU)
 
@@ -502,6 +512,11 @@ def lru_cache(maxsize=128, typed=False):
     # The internals of the lru_cache are encapsulated for thread safety and
     # to allow the implementation to change (including a possible C version).
 
+    if ttl is not None and not ttl > 0:
+        raise ValueError('ttl must be a positive number or None')
+    if weigher is not None and not callable(weigher):
+        raise TypeError('weigher must be a callable or None')
+
     if isinstance(maxsize, int):
         # Negative maxsize is treated as 0
         if maxsize < 0:
@@ -509,20 +524,27 @@ def lru_cache(maxsize=128, typed=False):
     elif callable(maxsize) and isinstance(typed, bool):
         # The user_function was passed in directly via the maxsize argument
         user_function, maxsize = maxsize, 128
-        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo)
-        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed}
-        return update_wrapper(wrapper, user_function)
+        return _make_lru_cache(user_function, maxsize, typed, ttl, weigher)
     elif maxsize is not None:
         raise TypeError(
             'Expected first argument to be an integer, a callable, or None')
 
     def decorating_function(user_function):
-        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo)
-        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed}
-        return update_wrapper(wrapper, user_function)
+        return _make_lru_cache(user_function, maxsize, typed, ttl, weigher)
 
     return decorating_function
 
+def _make_lru_cache(user_function, maxsize, typed, ttl, weigher):
+    if ttl is None and weigher is None:
+        wrapper = _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo)
+        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed}
+    else:
+        wrapper = _lru_cache_policy_wrapper(user_function, maxsize, typed,
+                                            ttl, weigher, _PolicyCacheInfo)
+        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed,
+                                             'ttl': ttl, 'weigher': weigher}
+    return update_wrapper(wrapper, user_function)
+
 def _lru_cache_wrapper(user_function, maxsize, typed, _CacheInfo):
     # Constants shared by all lru cache instances:
     sentinel = object()          # unique object used to signal cache misses
@@ -644,6 +666,102 @@ def cache_clear():
 except ImportError:
     pass
 
+def _lru_cache_policy_wrapper(user_function, maxsize, typed, ttl, weigher,
+                              _CacheInfo):
+    # Variant of _lru_cache_wrapper() evicting results by total weight and
+    # by age.  Each link is a list [KEY, RESULT, WEIGHT, EXPIRES].  The
+    # cache dictionary is kept in recency order, and the expiry dictionary
+    # in insertion order, which is also the order of expiration since all
+    # results share the same ttl.
+    make_key = _make_key
+    timer = _monotonic
+    KEY, RESULT, WEIGHT, EXPIRES = 0, 1, 2, 3   # names for the link fields
+
+    cache = OrderedDict()
+    expiry = OrderedDict()
+    hits = misses = evictions = expirations = 0
+    weight = 0
+    cache_get = cache.get
+    move_to_end = cache.move_to_end
+    lock = RLock()
+
+    def expire(now):
+        # Discard the results older than ttl.  Called with the lock held.
+        nonlocal weight, expirations
+        while expiry:
+            link = next(iter(expiry.values()))
+            if link[EXPIRES] > now:
+                break
+            expiry.popitem(last=False)
+            del cache[link[KEY]]
+            weight -= link[WEIGHT]
+            expirations += 1
+
+    def wrapper(*args, **kwds):
+        nonlocal hits, misses, weight, evictions
+        key = make_key(args, kwds, typed)
+        with lock:
+            if ttl is not None:
+                expire(timer())
+            link = cache_get(key)
+            if link is not None:
+                move_to_end(key)
+                hits += 1
+                return link[RESULT]
+            misses += 1
+        result = user_function(*args, **kwds)
+        cost = 1 if weigher is None else weigher(result)
+        if cost < 0:
+            raise ValueError('weigher returned a negative weight')
+        if maxsize is not None and cost > maxsize:
+            # Too heavy to ever fit in the cache.
+            return result
+        with lock:
+            if key in cache:
+                # Getting here means that this same key was added to the
+                # cache while the lock was released.
+                return result
+            # Keep references to the evicted links so that their results
+            # are not cleaned up while we are still updating the cache.
+            evicted = []
+            if maxsize is not None:
+                while weight + cost > maxsize:
+                    _, oldlink = cache.popitem(last=False)
+                    if ttl is not None:
+                        del expiry[oldlink[KEY]]
+                    weight -= oldlink[WEIGHT]
+                    evicted.append(oldlink)
+                    evictions += 1
+            expires = None if ttl is None else timer() + ttl
+            link = [key, result, cost, expires]
+            weight += cost
+            if ttl is not None:
+                expiry[key] = link
+            cache[key] = link
+        del evicted
+        return result
+
+    def cache_info():
+        """Report cache statistics"""
+        with lock:
+            if ttl is not None:
+                expire(timer())
+            return _CacheInfo(hits, misses, maxsize, weight,
+                              evictions, expirations)
+
+    def cache_clear():
+        """Clear the cache and cache statistics"""
+        nonlocal hits, misses, weight, evictions, expirations
+        with lock:
+            cache.clear()
+            expiry.clear()
+            hits = misses = evictions = expirations = 0
+            weight = 0
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
 
 ################################################################################
 ### cache -- simplified access to the infinity cache
@@ -798,6 +916,9 @@ def _find_impl(cls, registry):
             match = t
     return registry.get(match)
 
+_DispatchStats = namedtuple("DispatchStats", ["misses", "revalidations",
+                                              "invalidations", "currsize"])
+
 def singledispatch(func):
     """Single-dispatch generic function decorator.
 
@@ -815,6 +936,29 @@ def singledispatch(func):
     registry = {}
     dispatch_cache = weakref.WeakKeyDictionary()
     cache_token = None
+    # The ABCs in the registry, and for each class resolved while there were
+    # some, the implementation found and which of these ABCs the classes in
+    # its MRO are subclasses of.  When an ABC registration anywhere changes
+    # the cache token, the entries of dispatch_cache are only resolved again
+    # if this signature changed.
+    abcs = ()
+    abc_signatures = weakref.WeakKeyDictionary()
+    misses = revalidations = invalidations = 0
+    ref = weakref.ref
+    # Look up the dictionary underlying dispatch_cache directly, sparing
+    # a call to WeakKeyDictionary.__getitem__() on every dispatch.
+    cache_get = dispatch_cache.data.get
+
+    def abc_signature(cls):
+        mro = cls.__mro__
+        signature = tuple([issubclass(typ, abc) for typ in mro for abc in abcs])
+        # Several implicit ABCs may be ordered by their other subclasses,
+        # which the signature does not cover.
+        implicit = 0
+        for abc, match in zip(abcs, signature):
+            if match and abc not in mro:
+                implicit += 1
+        return signature if implicit < 2 else None
 
     def dispatch(cls):
         """generic_func.dispatch(cls) -> <function implementation>
@@ -832,13 +976,48 @@ def dispatch(cls):
         try:
             impl = dispatch_cache[cls]
         except KeyError:
+            impl = resolve(cls)
+            dispatch_cache[cls] = impl
+        return impl
+
+    def resolve(cls):
+        nonlocal misses, revalidations, invalidations
+        if abcs:
+            signature = abc_signature(cls)
             try:
-                impl = registry[cls]
+                impl, old_signature = abc_signatures[cls]
             except KeyError:
-                impl = _find_impl(cls, registry)
-            dispatch_cache[cls] = impl
+                pass
+            else:
+                if signature is not None and signature == old_signature:
+                    revalidations += 1
+                    return impl
+                invalidations += 1
+        misses += 1
+        try:
+            impl = registry[cls]
+        except KeyError:
+            impl = _find_impl(cls, registry)
+        if abcs:
+            abc_signatures[cls] = impl, signature
         return impl
 
+    def clear_cache():
+        dispatch_cache.clear()
+        abc_signatures.clear()
+
+    def dispatch_stats():
+        """generic_func.dispatch_stats() -> DispatchStats
+
+        Reports the number of cache misses which resolved an implementation
+        from the registry, the number of cached implementations kept or
+        discarded after an ABC registration changed the cache token, and the
+        current number of cached classes.
+
+        """
+        return _DispatchStats(misses, revalidations, invalidations,
+                              len(dispatch_cache))
+
     def _is_union_type(cls):
         from typing import get_origin, Union
         return get_origin(cls) in {Union, types.UnionType}
@@ -856,7 +1035,7 @@ def register(cls, func=None):
         Registers a new implementation for the given *cls* on a *generic_func*.
 
         """
-        nonlocal cache_token
+        nonlocal cache_token, abcs
         if _is_valid_dispatch_type(cls):
             if func is None:
                 return lambda f: register(cls, f)
@@ -899,7 +1078,9 @@ def register(cls, func=None):
             registry[cls] = func
         if cache_token is None and hasattr(cls, '__abstractmethods__'):
             cache_token = get_cache_token()
-        dispatch_cache.clear()
+        abcs = tuple([typ for typ in registry
+                      if hasattr(typ, '__abstractmethods__')])
+        clear_cache()
         return func
 
     def wrapper(*args, **kw):
@@ -907,14 +1088,21 @@ def wrapper(*args, **kw):
             raise TypeError(f'{funcname} requires at least '
                             '1 positional argument')
 
-        return dispatch(args[0].__class__)(*args, **kw)
+        cls = args[0].__class__
+        # Inlined fast path of dispatch() for classes already in the cache.
+        if cache_token is None or cache_token == get_cache_token():
+            impl = cache_get(ref(cls))
+            if impl is not None:
+                return impl(*args, **kw)
+        return dispatch(cls)(*args, **kw)
 
     funcname = getattr(func, '__name__', 'singledispatch function')
     registry[object] = func
     wrapper.register = register
     wrapper.dispatch = dispatch
     wrapper.registry = types.MappingProxyType(registry)
-    wrapper._clear_cache = dispatch_cache.clear
+    wrapper.dispatch_stats = dispatch_stats
+    wrapper._clear_cache = clear_cache
     update_wrapper(wrapper, func)
     return wrapper
 
@@ -942,20 +1130,75 @@ def register(self, cls, method=None):
         return self.dispatcher.register(cls, func=method)
 
     def __get__(self, obj, cls=None):
-        def _method(*args, **kwargs):
-            method = self.dispatcher.dispatch(args[0].__class__)
-            return method.__get__(obj, cls)(*args, **kwargs)
-
-        _method.__isabstractmethod__ = self.__isabstractmethod__
-        _method.register = self.register
-        update_wrapper(_method, self.func)
-        return _method
+        return _singledispatchmethod_get(self, obj, cls)
 
     @property
     def __isabstractmethod__(self):
         return getattr(self.func, '__isabstractmethod__', False)
 
 
+class _singledispatchmethod_get:
+    """Bound version of a singledispatchmethod.
+
+    Other attributes are looked up on the wrapped function, the same as if
+    update_wrapper() had been called, so that __get__() does not have to
+    copy them for every attribute access on the class or instance.
+    """
+
+    def __init__(self, unbound, obj, cls):
+        self._unbound = unbound
+        self._dispatch = unbound.dispatcher.dispatch
+        self._obj = obj
+        self._cls = cls
+        # These attributes exist on every object, so __getattr__() is not
+        # called for them.
+        func = unbound.func
+        try:
+            self.__module__ = func.__module__
+        except AttributeError:
+            pass
+        try:
+            self.__doc__ = func.__doc__
+        except AttributeError:
+            pass
+
+    def __repr__(self):
+        try:
+            name = self.__qualname__
+        except AttributeError:
+            try:
+                name = self.__name__
+            except AttributeError:
+                name = '?'
+        if self._obj is not None:
+            return f'<bound method {name} of {self._obj!r}>'
+        elif self._cls is not None:
+            return f'<function {name} of {self._cls!r}>'
+        else:
+            return f'<function {name}>'
+
+    def __call__(self, /, *args, **kwargs):
+        method = self._dispatch(args[0].__class__)
+        return method.__get__(self._obj, self._cls)(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith('_') and not name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self._unbound.func, name)
+
+    @property
+    def __wrapped__(self):
+        return self._unbound.func
+
+    @property
+    def __isabstractmethod__(self):
+        return self._unbound.__isabstractmethod__
+
+    @property
+    def register(self):
+        return self._unbound.register
+
+
 ################################################################################
 ### cached_property() - computed once per instance, cached as attribute
 ################################################################################
@@ -2,6 +2,7 @@
 
 import contextlib
 import os
+import posixpath
 import re
 import fnmatch
 import itertools
@@ -59,6 +60,12 @@ def iglob(pathname, *, root_dir=None, dir_fd=None, recursive=False,
 
 def _iglob(pathname, root_dir, dir_fd, recursive, dironly,
            include_hidden=False):
+    if recursive and not dironly:
+        head, parts = _split_recursive(pathname)
+        if parts:
+            yield from _iglob_walk(head, parts, root_dir, dir_fd,
+                                   include_hidden)
+            return
     dirname, basename = os.path.split(pathname)
     if not has_magic(pathname):
         assert not dironly
@@ -98,6 +105,77 @@ def _iglob(pathname, root_dir, dir_fd, recursive, dironly,
                                include_hidden=include_hidden):
             yield os.path.join(dirname, name)
 
+# Split a pattern before its first '**' component.  Returns the head and
+# the list of components from the '**' on, or an empty list if the pattern
+# is better handled component by component: if nothing but '**' and a
+# trailing separator follows, or if '.' or '..' components follow, which
+# scandir() does not list.
+def _split_recursive(pathname):
+    parts = []
+    head = pathname
+    split = None
+    while True:
+        dirname, basename = os.path.split(head)
+        if dirname == head:
+            break
+        parts.append(basename)
+        head = dirname
+        if _isrecursive(basename):
+            split = head, len(parts)
+        if not head:
+            break
+    if split is None:
+        return pathname, []
+    head, count = split
+    parts = parts[count-1::-1]
+    special = (os.curdir, os.pardir)
+    if isinstance(pathname, bytes):
+        special = tuple(map(os.fsencode, special))
+    if any(part in special for part in parts):
+        return pathname, []
+    if all(not part or _isrecursive(part) for part in parts):
+        return pathname, []
+    return head, parts
+
+# Yields the paths matching all components of PARTS, which starts with a
+# '**' component, below the directories matching HEAD.  Every directory is
+# only scanned once, whatever the number of components.
+def _iglob_walk(head, parts, root_dir, dir_fd, include_hidden):
+    if has_magic(head):
+        dirs = _iglob(head, root_dir, dir_fd, True, True,
+                      include_hidden=include_hidden)
+    else:
+        dirs = [head]
+    dir_only = not parts[-1]
+    if dir_only:
+        del parts[-1]
+    join = _join
+    if dir_fd is not None and isinstance(head, bytes):
+        # scandir() of a file descriptor always returns str names.
+        parts = [os.fsdecode(part) for part in parts]
+        join = lambda dirname, name: _join(dirname, os.fsencode(name))
+    compile = lambda pattern: _compile_name_pattern(pattern, include_hidden)
+    scandir = lambda dirname: _scandir(_join(root_dir, dirname), dir_fd)
+    walker = _GlobWalker(parts, compile, scandir, join, dir_only=dir_only,
+                         recurse_hidden=include_hidden)
+    for dirname in dirs:
+        for path, zero in walker.walk(dirname):
+            if zero:
+                path = os.path.join(path, path[:0])
+            yield path
+
+# Returns a function testing a name against a pattern component the way
+# _glob0() and _glob1() would.
+def _compile_name_pattern(pattern, include_hidden):
+    match = fnmatch.compile_many((os.path.normcase(pattern),))
+    if not include_hidden and has_magic(pattern) and not _ishidden(pattern):
+        unfiltered = match
+        match = lambda name: not _ishidden(name) and unfiltered(name)
+    if os.path is not posixpath:
+        casefolded = match
+        match = lambda name: casefolded(os.path.normcase(name))
+    return match
+
 # These 2 helper functions non-recursively glob inside a literal directory.
 # They return a list of basenames.  _glob1 accepts a pattern while _glob0
 # takes a literal basename (so it only has to check for its existence).
@@ -136,39 +214,46 @@ def _glob2(dirname, pattern, dir_fd, dironly, include_hidden=False):
     yield from _rlistdir(dirname, dir_fd, dironly,
                          include_hidden=include_hidden)
 
+# Context manager returning an iterator of os.DirEntry objects for a
+# directory, relative to dir_fd if it is not None.
+@contextlib.contextmanager
+def _scandir(dirname, dir_fd):
+    fd = None
+    if dir_fd is not None:
+        if dirname:
+            fd = arg = os.open(dirname, _dir_open_flags, dir_fd=dir_fd)
+        else:
+            arg = dir_fd
+    elif dirname:
+        arg = dirname
+    elif isinstance(dirname, bytes):
+        arg = bytes(os.curdir, 'ASCII')
+    else:
+        arg = os.curdir
+    try:
+        with os.scandir(arg) as it:
+            yield it
+    finally:
+        if fd is not None:
+            os.close(fd)
+
 # If dironly is false, yields all file names inside a directory.
 # If dironly is true, yields only directory names.
 def _iterdir(dirname, dir_fd, dironly):
+    fsencode = None
+    if dir_fd is not None and isinstance(dirname, bytes):
+        fsencode = os.fsencode
     try:
-        fd = None
-        fsencode = None
-        if dir_fd is not None:
-            if dirname:
-                fd = arg = os.open(dirname, _dir_open_flags, dir_fd=dir_fd)
-            else:
-                arg = dir_fd
-            if isinstance(dirname, bytes):
-                fsencode = os.fsencode
-        elif dirname:
-            arg = dirname
-        elif isinstance(dirname, bytes):
-            arg = bytes(os.curdir, 'ASCII')
-        else:
-            arg = os.curdir
-        try:
-            with os.scandir(arg) as it:
-                for entry in it:
-                    try:
-                        if not dironly or entry.is_dir():
-                            if fsencode is not None:
-                                yield fsencode(entry.name)
-                            else:
-                                yield entry.name
-                    except OSError:
-                        pass
-        finally:
-            if fd is not None:
-                os.close(fd)
+        with _scandir(dirname, dir_fd) as it:
+            for entry in it:
+                try:
+                    if not dironly or entry.is_dir():
+                        if fsencode is not None:
+                            yield fsencode(entry.name)
+                        else:
+                            yield entry.name
+                except OSError:
+                    pass
     except OSError:
         return
 
@@ -188,6 +273,138 @@ def _rlistdir(dirname, dir_fd, dironly, include_hidden=False):
                 yield _join(x, y)
 
 
+class _GlobWalker:
+    """Match pattern segments against a single walk of a directory tree.
+
+    *parts* is a list of pattern segments where '**' matches zero or more
+    directories.  Each directory is scanned once, and the set of segments
+    that may match its entries is carried down to its subdirectories, so
+    a pattern like 'src/**/test_*/**/*.py' does not rescan directories
+    once for every segment, and directory entries are only tested with
+    the type information that os.scandir() already returned.
+
+    *compile* turns a segment other than '**' into a function testing a
+    name, or None if the segment matches every name.  *scandir* takes a
+    directory and returns a context manager iterating over its
+    os.DirEntry objects, and *join* takes a directory and a name and
+    returns the path of the child.  If *dir_only* is true, only
+    directories match.  Symbolic links to directories are followed when
+    matching segments if *follow_symlinks* is true, and expanded by '**'
+    if *recurse_symlinks* is true.  If *recurse_hidden* is false, '**'
+    does not match names starting with a dot.
+    """
+
+    def __init__(self, parts, compile, scandir, join, *, dir_only=False,
+                 follow_symlinks=True, recurse_symlinks=True,
+                 recurse_hidden=True):
+        self.recursive = []
+        self.matchers = []
+        for part in parts:
+            if _isrecursive(part):
+                # Adjacent '**' segments match the same paths as one.
+                if self.recursive and self.recursive[-1]:
+                    continue
+                self.recursive.append(True)
+                self.matchers.append(None)
+            else:
+                self.recursive.append(False)
+                self.matchers.append(compile(part))
+        # A '**' segment may also match zero directories, in which case the
+        # next segment is tried at the same level.
+        self.closure = [(i, i + 1) if rec else (i,)
+                        for i, rec in enumerate(self.recursive)]
+        self.closure.append((len(self.recursive),))
+        self.scandir = scandir
+        self.join = join
+        self.dir_only = dir_only
+        self.follow_symlinks = follow_symlinks
+        self.recurse_symlinks = recurse_symlinks
+        self.recurse_hidden = recurse_hidden
+
+    def walk(self, path):
+        """Yield (path, zero) pairs for paths below *path* matching all
+        segments.  *zero* is true if a trailing '**' segment matched zero
+        directories, or if *dir_only* is true.
+        """
+        stack = [(path, frozenset(self.closure[0]))]
+        while stack:
+            path, states = stack.pop()
+            matched = {}
+            subdirs = {}
+            try:
+                # We must close the scandir() object before proceeding to
+                # avoid exhausting file descriptors when globbing deep trees.
+                with self.scandir(path) as scandir_it:
+                    entries = list(scandir_it)
+                    self._select(entries, states, matched, subdirs)
+            except OSError:
+                continue
+            for name, zero in matched.items():
+                yield self.join(path, name), zero
+            stack.extend([(self.join(path, name), substates)
+                          for name, substates in reversed(subdirs.items())])
+
+    def _select(self, entries, states, matched, subdirs):
+        # Fill *matched* with the names of entries matching all segments,
+        # and *subdirs* with the names of subdirectories to walk mapped to
+        # the indices of the segments to match their entries against.
+        end = len(self.recursive)
+        for i in states:
+            if i == end:
+                continue
+            closure = self.closure[i + 1] if i + 1 < end else ()
+            if self.recursive[i]:
+                candidates = entries
+                if not self.recurse_hidden:
+                    candidates = [e for e in entries if not _ishidden(e.name)]
+                dirs = self._dirs(candidates, self.recurse_symlinks)
+                self._add_subdirs(subdirs, dirs, (i,) + closure)
+                if i + 1 == end:
+                    for entry in dirs if self.dir_only else candidates:
+                        matched[entry.name] = self.dir_only
+                continue
+            match = self.matchers[i]
+            if match is None:
+                candidates = entries
+            else:
+                candidates = [e for e in entries if match(e.name)]
+            if i + 1 == end:
+                if self.dir_only:
+                    candidates = self._dirs(candidates, self.follow_symlinks)
+                for entry in candidates:
+                    matched[entry.name] = self.dir_only
+                continue
+            dirs = self._dirs(candidates, self.follow_symlinks)
+            self._add_subdirs(subdirs, dirs, closure)
+            if end in closure:
+                # A trailing '**' segment matching zero directories.
+                for entry in dirs:
+                    matched.setdefault(entry.name, True)
+
+    def _add_subdirs(self, subdirs, dirs, states):
+        states = frozenset(states).difference((len(self.recursive),))
+        for entry in dirs:
+            name = entry.name
+            if name in subdirs:
+                subdirs[name] = subdirs[name] | states
+            else:
+                subdirs[name] = states
+
+    @staticmethod
+    def _dirs(entries, follow_symlinks):
+        try:
+            return [e for e in entries if e.is_dir(follow_symlinks=follow_symlinks)]
+        except OSError:
+            pass
+        dirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    dirs.append(entry)
+            except OSError:
+                pass
+        return dirs
+
 def _lexists(pathname, dir_fd):
     # Same as os.path.lexists(), but with dir_fd
     if dir_fd is None:
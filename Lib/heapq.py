@@ -127,7 +127,7 @@
 """
 
 __all__ = ['heappush', 'heappop', 'heapify', 'heapreplace', 'merge',
-           'nlargest', 'nsmallest', 'heappushpop']
+           'nlargest', 'nsmallest', 'heappushpop', 'external_sort']
 
 def heappush(heap, item):
     """Push item onto heap, maintaining the heap invariant."""
@@ -313,7 +313,7 @@ def _siftup_max(heap, pos):
     heap[pos] = newitem
     _siftdown_max(heap, startpos, pos)
 
-def merge(*iterables, key=None, reverse=False):
+def merge(*iterables, key=None, reverse=False, batch=None):
     '''Merge multiple sorted inputs into a single sorted output.
 
     Similar to sorted(itertools.chain(*iterables)) but returns a generator,
@@ -329,8 +329,19 @@ def merge(*iterables, key=None, reverse=False):
     >>> list(merge(['dog', 'horse'], ['cat', 'fish', 'kangaroo'], key=len))
     ['dog', 'cat', 'fish', 'horse', 'kangaroo']
 
+    If *batch* is not None, up to *batch* elements are read ahead from each
+    input at a time and their keys computed together, and runs of consecutive
+    output elements coming from the same input are found by bisection and
+    output at once.  This is much faster when the inputs contribute long
+    runs, but slower when they interleave element by element, and keeps up
+    to *batch* elements of each input in memory.
+
     '''
 
+    if batch is not None:
+        yield from _merge_batched(iterables, key, reverse, batch)
+        return
+
     h = []
     h_append = h.append
 
@@ -394,6 +405,165 @@ def merge(*iterables, key=None, reverse=False):
         yield from next.__self__
 
 
+def _bisect_descending(a, x, lo, ties):
+    # Return the index of the first item of a[lo:], a list sorted from
+    # largest to smallest, which is smaller than x, or not larger than x
+    # if ties is false.  Like the rest of the module, only uses "<".
+    hi = len(a)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if (not a[mid] < x) if ties else (x < a[mid]):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def _merge_batched(iterables, key, reverse, batch):
+    # Implementation of merge() with a batch size.  Each heap entry is a
+    # list [head key, order, keys, values, position, iterator] for an input,
+    # where keys and values are its current block of elements and position
+    # the index of the head in them.  The elements of the block on top of the
+    # heap which come before the head of the runner-up input are found by
+    # bisection and output as a single slice.
+    from bisect import bisect_left, bisect_right
+    from itertools import islice
+    from operator import index
+
+    batch = index(batch)
+    if batch <= 0:
+        raise ValueError('batch must be a positive integer')
+
+    h = []
+    if reverse:
+        _heapify = _heapify_max
+        _heappop = _heappop_max
+        _heapreplace = _heapreplace_max
+        runner_up = max
+        direction = -1
+    else:
+        _heapify = heapify
+        _heappop = heappop
+        _heapreplace = heapreplace
+        runner_up = min
+        direction = 1
+
+    for order, it in enumerate(map(iter, iterables)):
+        values = list(islice(it, batch))
+        if values:
+            keys = values if key is None else list(map(key, values))
+            h.append([keys[0], order * direction, keys, values, 0, it])
+    _heapify(h)
+    while len(h) > 1:
+        s = h[0]
+        r = h[1] if len(h) == 2 else runner_up(h[1], h[2])
+        bound = r[0]
+        # Whether the top input comes first when its head ties with bound.
+        ties = s[1] < r[1] if direction == 1 else s[1] > r[1]
+        keys = s[2]
+        values = s[3]
+        pos = s[4]
+        end = pos + 1
+        if end < len(keys):
+            # Check the next element before bisecting, since inputs often
+            # interleave one element at a time.
+            k = keys[end]
+            if reverse:
+                after = (k < bound) if ties else not (bound < k)
+            else:
+                after = (bound < k) if ties else not (k < bound)
+            if not after:
+                if reverse:
+                    end = _bisect_descending(keys, bound, end + 1, ties)
+                elif ties:
+                    end = bisect_right(keys, bound, end + 1)
+                else:
+                    end = bisect_left(keys, bound, end + 1)
+        if end == pos + 1:
+            yield values[pos]
+        elif pos == 0 and end == len(values):
+            yield from values
+        else:
+            yield from values[pos:end]
+        if end == len(values):
+            values = list(islice(s[5], batch))
+            if not values:
+                _heappop(h)             # remove empty iterator
+                continue
+            keys = values if key is None else list(map(key, values))
+            s[2] = keys
+            s[3] = values
+            end = 0
+        s[0] = keys[end]
+        s[4] = end
+        _heapreplace(h, s)              # restore heap condition
+    if h:
+        # fast case when only a single iterator remains
+        _, _, _, values, pos, it = h[0]
+        yield from values[pos:]
+        yield from it
+
+def _read_run(file):
+    # Yield the elements of a run written by external_sort().
+    from pickle import load
+    while True:
+        try:
+            chunk = load(file)
+        except EOFError:
+            return
+        yield from chunk
+
+_RUN_CHUNK_SIZE = 1024
+
+def external_sort(iterable, *, key=None, reverse=False, run_size=1_000_000,
+                  dir=None):
+    """Sort the elements of *iterable* using temporary files.
+
+    Returns a generator of the elements of *iterable* in sorted order, like
+    iter(sorted(iterable, key=key, reverse=reverse)), but keeps at most about
+    *run_size* elements in memory.  Larger inputs are split into sorted runs
+    of *run_size* elements, which are pickled to temporary files created in
+    *dir* (see tempfile.TemporaryFile()) and merged.  The files are removed
+    when the generator is exhausted or closed.
+
+    >>> list(external_sort([5, 3, 8, 1, 9, 2], run_size=2))
+    [1, 2, 3, 5, 8, 9]
+
+    """
+    from itertools import islice
+    from operator import index
+    from pickle import dump, HIGHEST_PROTOCOL
+    from tempfile import TemporaryFile
+
+    run_size = index(run_size)
+    if run_size <= 0:
+        raise ValueError('run_size must be a positive integer')
+    it = iter(iterable)
+    files = []
+    try:
+        while True:
+            run = list(islice(it, run_size))
+            run.sort(key=key, reverse=reverse)
+            if len(run) < run_size:
+                # The last run stays in memory.
+                break
+            file = TemporaryFile(dir=dir)
+            files.append(file)
+            for i in range(0, len(run), _RUN_CHUNK_SIZE):
+                dump(run[i:i+_RUN_CHUNK_SIZE], file, HIGHEST_PROTOCOL)
+            file.seek(0)
+            del run
+        if not files:
+            yield from run
+            return
+        runs = [_read_run(file) for file in files]
+        runs.append(run)
+        del run
+        yield from merge(*runs, key=key, reverse=reverse)
+    finally:
+        for file in files:
+            file.close()
+
+
 # Algorithm notes for nlargest() and nsmallest()
 # ==============================================
 #
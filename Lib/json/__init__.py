@@ -54,6 +54,14 @@
     >>> json.load(io)[0] == 'streaming API'
     True
 
+Decoding the elements of a large JSON array one by one::
+
+    >>> import json
+    >>> from io import StringIO
+    >>> io = StringIO('[{"id": 1}, {"id": 2}]')
+    >>> [item['id'] for item in json.iterload(io, depth=1)]
+    [1, 2]
+
 Specializing JSON object decoding::
 
     >>> import json
@@ -97,15 +105,19 @@
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
-    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
+    'dump', 'dumps', 'load', 'loads', 'iterload',
+    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder', 'JSONPullParser',
+    'TypedDecoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, JSONPullParser
 from .encoder import JSONEncoder
+from .typed import TypedDecoder
 import codecs
+import errno
+import io
 
 _default_encoder = JSONEncoder(
     skipkeys=False,
@@ -119,10 +131,14 @@
 
 def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         allow_nan=True, cls=None, indent=None, separators=None,
-        default=None, sort_keys=False, **kw):
+        default=None, sort_keys=False, buffer_size=65536, **kw):
     """Serialize ``obj`` as a JSON formatted stream to ``fp`` (a
     ``.write()``-supporting file-like object).
 
+    If ``fp`` is a binary file (an instance of ``io.RawIOBase`` or
+    ``io.BufferedIOBase``), the JSON text is encoded to UTF-8.  The output
+    is written in chunks of about ``buffer_size`` characters or bytes.
+
     If ``skipkeys`` is true then ``dict`` keys that are not basic types
     (``str``, ``int``, ``float``, ``bool``, ``None``) will be skipped
     instead of raising a ``TypeError``.
@@ -166,16 +182,30 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
+            default=default, sort_keys=sort_keys, **kw)
+    if isinstance(fp, io.RawIOBase):
+        for chunk in encoder.iterencode_bytes(obj, buffer_size=buffer_size):
+            # Unlike the write() method of buffered files, the one of raw
+            # files can write only part of the data.
+            view = memoryview(chunk)
+            while view:
+                n = fp.write(view)
+                if n is None:
+                    raise BlockingIOError(errno.EAGAIN, 'write could not '
+                                          'complete without blocking')
+                view = view[n:]
+        return
+    if isinstance(fp, io.BufferedIOBase):
+        iterable = encoder.iterencode_bytes(obj, buffer_size=buffer_size)
+    else:
+        iterable = encoder._iterencode_buffered(obj, buffer_size)
     for chunk in iterable:
         fp.write(chunk)
 
@@ -357,3 +387,69 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
     if parse_constant is not None:
         kw['parse_constant'] = parse_constant
     return cls(**kw).decode(s)
+
+
+def iterload(fp, *, depth=0, chunk_size=65536, max_buffer_size=None,
+        cls=None, object_hook=None, parse_float=None, parse_int=None,
+        parse_constant=None, object_pairs_hook=None, **kw):
+    """Incrementally deserialize ``fp`` (a ``.read()``-supporting file-like
+    object containing JSON text) to an iterator of Python objects.
+
+    ``fp`` is read in chunks of ``chunk_size`` characters or bytes, and
+    each value at nesting level ``depth`` is yielded as soon as it is
+    complete.  With the default ``depth`` of 0, each of the top-level
+    values of the stream is yielded, which supports newline-delimited
+    JSON.  With a ``depth`` of 1, the elements of a top-level array (or
+    the values of a top-level object) are yielded one by one, so that the
+    whole document is never held in memory.
+
+    If ``max_buffer_size`` is not None, a ``JSONDecodeError`` is raised if
+    a single value needs more characters than that to be buffered.
+
+    Binary files are decoded with the encoding detected as for ``loads()``.
+
+    The other arguments have the same meaning as in ``load()``.  Use
+    ``JSONPullParser`` directly to also get the path of each value.
+    """
+    if (cls is None and object_hook is None and
+            parse_int is None and parse_float is None and
+            parse_constant is None and object_pairs_hook is None and not kw):
+        decoder = _default_decoder
+    else:
+        if cls is None:
+            cls = JSONDecoder
+        if object_hook is not None:
+            kw['object_hook'] = object_hook
+        if object_pairs_hook is not None:
+            kw['object_pairs_hook'] = object_pairs_hook
+        if parse_float is not None:
+            kw['parse_float'] = parse_float
+        if parse_int is not None:
+            kw['parse_int'] = parse_int
+        if parse_constant is not None:
+            kw['parse_constant'] = parse_constant
+        decoder = cls(**kw)
+    parser = JSONPullParser(depth=depth, decoder=decoder,
+                            max_buffer_size=max_buffer_size)
+    read_events = parser.read_events
+    decode = None
+    while chunk := fp.read(chunk_size):
+        if not isinstance(chunk, str):
+            if decode is None:
+                if not isinstance(chunk, (bytes, bytearray)):
+                    raise TypeError(f'the JSON object must be str, bytes or '
+                                    f'bytearray, not {chunk.__class__.__name__}')
+                # The encoding is detected from the first bytes.
+                while len(chunk) < 4 and (more := fp.read(chunk_size)):
+                    chunk += more
+                decode = codecs.getincrementaldecoder(
+                    detect_encoding(chunk))('surrogatepass').decode
+            chunk = decode(chunk)
+        parser.feed(chunk)
+        for path, value in read_events():
+            yield value
+    if decode is not None:
+        parser.feed(decode(b'', True))
+    parser.close()
+    for path, value in read_events():
+        yield value
@@ -1,5 +1,6 @@
 """Implementation of JSONDecoder
 """
+import collections
 import re
 
 from json import scanner
@@ -8,7 +9,7 @@
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONPullParser']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -354,3 +355,301 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+
+
+# Characters which can start or end a nested value or a string.
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+# Text which can continue a number or a literal.
+_SCALAR = re.compile(r'[^ \t\n\r,:\[\]{}"]*')
+
+# Parser states for the containers enclosing the values to report.
+_FIRST = 0      # after '[' or '{'
+_VALUE = 1      # after ',' in an array, or after ':' in an object
+_KEY = 2        # after ',' in an object
+_COLON = 3      # after a key
+_COMMA = 4      # after a value
+
+
+class JSONPullParser(object):
+    """Incremental parser for a stream of JSON text
+
+    Text is passed to feed() in chunks of any size, and the values found
+    at nesting level *depth* are returned by read_events() as soon as they
+    are complete, together with their path: the tuple of array indices and
+    object keys leading to them.  With the default *depth* of 0, each
+    top-level value is reported, which supports streams of several JSON
+    documents, such as newline-delimited JSON.  With a *depth* of 1, the
+    elements of a top-level array are reported one by one, without having
+    the whole array in memory.
+
+    The values are decoded with the scanner of *decoder*, a JSONDecoder
+    instance.  If *max_buffer_size* is not None, a JSONDecodeError is
+    raised if a single value needs more characters than that to be
+    buffered.
+    """
+
+    def __init__(self, *, depth=0, decoder=None, max_buffer_size=None):
+        if depth < 0:
+            raise ValueError('depth must be non-negative')
+        if decoder is None:
+            decoder = JSONDecoder()
+        self.depth = depth
+        self.max_buffer_size = max_buffer_size
+        self._scan_once = decoder.scan_once
+        self._strict = decoder.strict
+        self._buf = ''
+        self._pos = 0
+        self._stack = []    # [is_object, index_or_key, state] of containers
+        self._events = collections.deque()
+        self._started = False
+        self._closed = False
+        # When a nested value or string spans several chunks: the text
+        # buffered so far, whether to report it, its nesting level, and
+        # whether the scan stopped in a string or after a backslash.
+        self._parts = None
+        self._report = False
+        self._nesting = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, data):
+        """Feed the str *data* to the parser."""
+        if self._closed:
+            raise ValueError('feed() called after close()')
+        if not isinstance(data, str):
+            raise TypeError(f'the JSON text must be str, '
+                            f'not {data.__class__.__name__}')
+        if not self._started and data:
+            if data.startswith('\ufeff'):
+                raise JSONDecodeError(
+                    "Unexpected UTF-8 BOM (decode using utf-8-sig)", data, 0)
+            self._started = True
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+        self._parse()
+
+    def close(self):
+        """Finish feeding data to the parser.
+
+        Raise a JSONDecodeError if the text ends in the middle of a value.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._parse()
+        buf = self._buf
+        if self._parts is not None:
+            text = ''.join(self._parts)
+            # Decoding the incomplete value reports what is missing.
+            self._decode(text, 0)
+            raise JSONDecodeError("Unterminated value", text, len(text))
+        if self._pos != len(buf):
+            # The text ends in an object key.
+            self._scan_key(buf, self._pos)
+        if self._stack:
+            state = self._stack[-1][2]
+            if state == _COLON:
+                msg = "Expecting ':' delimiter"
+            elif state == _COMMA:
+                msg = "Expecting ',' delimiter"
+            elif state == _KEY:
+                msg = "Expecting property name enclosed in double quotes"
+            else:
+                msg = "Expecting value"
+            raise JSONDecodeError(msg, buf, len(buf))
+
+    def read_events(self):
+        """Return an iterator over the (path, value) pairs decoded so far."""
+        events = self._events
+        while events:
+            # Pop one at a time so that the events are not lost if the
+            # iterator is not consumed to the end.
+            yield events.popleft()
+
+    def _parse(self, _w=WHITESPACE.match):
+        buf = self._buf
+        pos = self._pos
+        stack = self._stack
+        if self._parts is not None:
+            pos = self._continue_value(buf, pos)
+            if pos < 0:
+                return
+        while True:
+            pos = _w(buf, pos).end()
+            if pos == len(buf):
+                break
+            nextchar = buf[pos]
+            if stack:
+                entry = stack[-1]
+                is_object, _, state = entry
+                closing = '}' if is_object else ']'
+                if state == _COMMA or (state == _FIRST and nextchar == closing):
+                    if nextchar == ',':
+                        if is_object:
+                            entry[2] = _KEY
+                        else:
+                            entry[1] += 1
+                            entry[2] = _VALUE
+                    elif nextchar == closing:
+                        stack.pop()
+                        if stack:
+                            stack[-1][2] = _COMMA
+                    else:
+                        raise JSONDecodeError("Expecting ',' delimiter",
+                                              buf, pos)
+                    pos += 1
+                    continue
+                if state == _COLON:
+                    if nextchar != ':':
+                        raise JSONDecodeError("Expecting ':' delimiter",
+                                              buf, pos)
+                    entry[2] = _VALUE
+                    pos += 1
+                    continue
+                if is_object and state != _VALUE:
+                    if nextchar != '"':
+                        raise JSONDecodeError(
+                            "Expecting property name enclosed in double quotes",
+                            buf, pos)
+                    if _find_string_end(buf, pos + 1) < 0:
+                        break
+                    entry[1], pos = self._scan_key(buf, pos)
+                    entry[2] = _COLON
+                    continue
+            # A value is expected.
+            if len(stack) < self.depth and nextchar in '[{':
+                stack.append([nextchar == '{', None if nextchar == '{' else 0,
+                              _FIRST])
+                pos += 1
+                continue
+            self._report = len(stack) >= self.depth
+            if nextchar in '[{"':
+                # Most values are complete in the buffer and are decoded
+                # directly.  Otherwise, wait until the end of the value is
+                # found; decoding it then reports errors.
+                try:
+                    value, pos = self._scan_once(buf, pos)
+                except (StopIteration, JSONDecodeError):
+                    pass
+                else:
+                    self._value_done(value)
+                    continue
+                self._parts = []
+                self._in_string = nextchar == '"'
+                self._nesting = 0 if self._in_string else 1
+                self._escape = False
+                self._pos = pos
+                pos = self._continue_value(buf, pos + 1)
+                if pos < 0:
+                    return
+                continue
+            end = _SCALAR.match(buf, pos).end()
+            if end == len(buf) and not self._closed:
+                break
+            value, pos = self._decode(buf, pos)
+            self._value_done(value)
+        if (self.max_buffer_size is not None and
+                len(buf) - pos > self.max_buffer_size):
+            raise JSONDecodeError("Value exceeds max_buffer_size", buf, pos)
+        self._pos = pos
+
+    def _continue_value(self, buf, pos):
+        # Scan the rest of a nested value or string which starts at
+        # self._pos or in the buffered parts.  Return the position after it
+        # once it is complete, or -1 after buffering the text.
+        parts = self._parts
+        start = self._pos
+        end = self._scan_value(buf, pos)
+        if end < 0:
+            parts.append(buf[start:])
+            self._buf = ''
+            self._pos = 0
+            if self.max_buffer_size is not None:
+                size = sum(map(len, parts))
+                if size > self.max_buffer_size:
+                    raise JSONDecodeError("Value exceeds max_buffer_size",
+                                          parts[0], 0)
+            return -1
+        self._parts = None
+        if parts:
+            parts.append(buf[start:end])
+            value, _ = self._decode(''.join(parts), 0)
+        else:
+            value, _ = self._decode(buf, start)
+        self._value_done(value)
+        return end
+
+    def _scan_value(self, buf, pos):
+        # Find the end of a nested value or string.  The scanning state is
+        # saved so that the scan resumes where it stopped when more text is
+        # fed; mismatched brackets are reported by the decoder afterwards.
+        nesting = self._nesting
+        in_string = self._in_string
+        if self._escape:
+            if pos == len(buf):
+                return -1
+            self._escape = False
+            pos += 1
+        structure = _STRUCTURE.search
+        string_special = _STRING_SPECIAL.search
+        while True:
+            if in_string:
+                m = string_special(buf, pos)
+                if m is None:
+                    break
+                pos = m.end()
+                if m.group() == '\\':
+                    if pos == len(buf):
+                        self._escape = True
+                        break
+                    pos += 1
+                    continue
+                in_string = False
+                if not nesting:
+                    return pos
+            else:
+                m = structure(buf, pos)
+                if m is None:
+                    break
+                pos = m.end()
+                c = m.group()
+                if c == '"':
+                    in_string = True
+                elif c in '[{':
+                    nesting += 1
+                else:
+                    nesting -= 1
+                    if not nesting:
+                        return pos
+        self._nesting = nesting
+        self._in_string = in_string
+        return -1
+
+    def _decode(self, s, idx):
+        try:
+            return self._scan_once(s, idx)
+        except StopIteration as err:
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+
+    def _scan_key(self, buf, pos):
+        return scanstring(buf, pos + 1, self._strict)
+
+    def _value_done(self, value):
+        stack = self._stack
+        if self._report:
+            path = tuple([entry[1] for entry in stack])
+            self._events.append((path, value))
+        if stack:
+            stack[-1][2] = _COMMA
+
+
+def _find_string_end(s, pos):
+    # Return the position after the end of the string starting at pos, or
+    # -1 if it is not terminated.
+    while (m := _STRING_SPECIAL.search(s, pos)) is not None:
+        if m.group() == '"':
+            return m.end()
+        pos = m.end() + 1
+    return -1
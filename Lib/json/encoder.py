@@ -1,5 +1,6 @@
 """Implementation of JSONEncoder
 """
+import itertools
 import re
 
 try:
@@ -34,6 +35,11 @@
 
 INFINITY = float('inf')
 
+# Nested lists and dicts holding at most this many items, counting the items
+# of the containers nested in them, are encoded in one go by the C encoder
+# when streaming; larger ones are streamed item by item.
+C_ENCODER_MAX_ITEMS = 1024
+
 def py_encode_basestring(s):
     """Return a JSON representation of a Python string
 
@@ -244,21 +250,53 @@ def floatstr(o, allow_nan=self.allow_nan,
             return text
 
 
-        if (_one_shot and c_make_encoder is not None
-                and self.indent is None):
-            _iterencode = c_make_encoder(
+        if c_make_encoder is not None and self.indent is None:
+            c_encoder = c_make_encoder(
                 markers, self.default, _encoder, self.indent,
                 self.key_separator, self.item_separator, self.sort_keys,
                 self.skipkeys, self.allow_nan)
+            if _one_shot:
+                return c_encoder(o, 0)
         else:
-            _iterencode = _make_iterencode(
-                markers, self.default, _encoder, self.indent, floatstr,
-                self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, _one_shot)
+            c_encoder = None
+        _iterencode = _make_iterencode(
+            markers, self.default, _encoder, self.indent, floatstr,
+            self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, _one_shot, c_encoder)
         return _iterencode(o, 0)
 
+    def iterencode_bytes(self, o, *, buffer_size=65536):
+        """Encode the given object to UTF-8 and yield it in chunks of
+        about *buffer_size* bytes.
+
+        This makes fewer and larger chunks than iterencode(), suitable
+        for writing to binary files or sockets::
+
+            for chunk in JSONEncoder().iterencode_bytes(bigobject):
+                mysocket.sendall(chunk)
+
+        """
+        for chunk in self._iterencode_buffered(o, buffer_size):
+            yield chunk.encode('utf-8', 'surrogatepass')
+
+    def _iterencode_buffered(self, o, buffer_size):
+        # Join the chunks of iterencode() into strings of at least
+        # buffer_size characters, except for the last one.
+        parts = []
+        size = 0
+        for chunk in self.iterencode(o):
+            parts.append(chunk)
+            size += len(chunk)
+            if size >= buffer_size:
+                yield ''.join(parts)
+                parts.clear()
+                size = 0
+        if parts:
+            yield ''.join(parts)
+
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
+        _c_encoder=None, _c_max_items=C_ENCODER_MAX_ITEMS,
         ## HACK: hand-optimized bytecode; turn globals into locals
         ValueError=ValueError,
         dict=dict,
@@ -270,11 +308,32 @@ def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         str=str,
         tuple=tuple,
         _intstr=int.__repr__,
+        _containers=(list, tuple, dict),
+        compress=itertools.compress,
+        map=map,
+        repeat=itertools.repeat,
     ):
 
     if _indent is not None and not isinstance(_indent, str):
         _indent = ' ' * _indent
 
+    def _c_encodable(value):
+        # Return true if the list, tuple or dict value holds at most
+        # _c_max_items items, including those of nested containers, so that
+        # the C encoder does not produce a single huge chunk for a small
+        # container holding a large one.
+        budget = _c_max_items
+        stack = [value]
+        while stack:
+            o = stack.pop()
+            budget -= len(o)
+            if budget < 0:
+                return False
+            if isinstance(o, dict):
+                o = o.values()
+            stack += compress(o, map(isinstance, o, repeat(_containers)))
+        return True
+
     def _iterencode_list(lst, _current_indent_level):
         if not lst:
             yield '[]'
@@ -317,7 +376,11 @@ def _iterencode_list(lst, _current_indent_level):
                 yield buf + _floatstr(value)
             else:
                 yield buf
-                if isinstance(value, (list, tuple)):
+                if (_c_encoder is not None and
+                        isinstance(value, (list, tuple, dict)) and
+                        _c_encodable(value)):
+                    chunks = _c_encoder(value, _current_indent_level)
+                elif isinstance(value, (list, tuple)):
                     chunks = _iterencode_list(value, _current_indent_level)
                 elif isinstance(value, dict):
                     chunks = _iterencode_dict(value, _current_indent_level)
@@ -397,7 +460,11 @@ def _iterencode_dict(dct, _current_indent_level):
                 # see comment for int/float in _make_iterencode
                 yield _floatstr(value)
             else:
-                if isinstance(value, (list, tuple)):
+                if (_c_encoder is not None and
+                        isinstance(value, (list, tuple, dict)) and
+                        _c_encodable(value)):
+                    chunks = _c_encoder(value, _current_indent_level)
+                elif isinstance(value, (list, tuple)):
                     chunks = _iterencode_list(value, _current_indent_level)
                 elif isinstance(value, dict):
                     chunks = _iterencode_dict(value, _current_indent_level)
@@ -0,0 +1,566 @@
+"""Decoding of JSON documents into instances of given types
+"""
+from .decoder import (JSONDecoder, JSONDecodeError, WHITESPACE,
+                      WHITESPACE_STR, scanstring)
+
+__all__ = ['TypedDecoder']
+
+
+class TypedDecoder(object):
+    """JSON decoder producing instances of a given type
+
+    The decoder is compiled from *tp*, a type which can be built from:
+
+    +----------------------------------+--------------------------------+
+    | Type                             | JSON                           |
+    +==================================+================================+
+    | dataclass                        | object with the fields as keys |
+    +----------------------------------+--------------------------------+
+    | list[T], tuple[T, ...],          | array                          |
+    | set[T], frozenset[T]             |                                |
+    +----------------------------------+--------------------------------+
+    | tuple[T1, T2, ...]               | array of fixed length          |
+    +----------------------------------+--------------------------------+
+    | dict[str, T]                     | object                         |
+    +----------------------------------+--------------------------------+
+    | str, int, float, bool, None      | string, number, true or false, |
+    |                                  | null                           |
+    +----------------------------------+--------------------------------+
+    | enum.Enum subclass               | value of a member              |
+    +----------------------------------+--------------------------------+
+    | T | None, Optional[T]            | null or T                      |
+    +----------------------------------+--------------------------------+
+    | union of str, int, float, bool,  | any of those                   |
+    | None                             |                                |
+    +----------------------------------+--------------------------------+
+    | typing.Any, object, list, dict   | any JSON value of that kind,   |
+    |                                  | decoded like JSONDecoder       |
+    +----------------------------------+--------------------------------+
+
+    The document is scanned as by JSONDecoder and the decoded values
+    are converted by functions compiled for the type, so that there is no
+    per-object hook call and no generic conversion pass.  Values which do
+    not match the type raise JSONDecodeError.  Keys of JSON objects which
+    are not fields of the dataclass are ignored.  Fields missing from the
+    JSON object take their default value.
+
+    If ``strict`` is false (true is the default), then control characters
+    will be allowed inside strings.
+    """
+
+    def __init__(self, tp, *, strict=True):
+        self.type = tp
+        self.strict = strict
+        self.scan_once = JSONDecoder(strict=strict).scan_once
+        self._convert = _Converters().compile(tp)
+        self._parse = _Parsers(self.scan_once, strict).compile(tp)
+
+    def decode(self, s, _w=WHITESPACE.match):
+        """Return the instance of the type represented by ``s`` (a ``str``
+        instance containing a JSON document).
+
+        """
+        obj, end = self.raw_decode(s, idx=_w(s, 0).end())
+        end = _w(s, end).end()
+        if end != len(s):
+            raise JSONDecodeError("Extra data", s, end)
+        return obj
+
+    def raw_decode(self, s, idx=0):
+        """Decode a JSON document from ``s`` (a ``str`` beginning with
+        a JSON document) and return a 2-tuple of the instance of the type
+        and the index in ``s`` where the document ended.
+
+        """
+        if idx < 0:
+            raise ValueError('idx cannot be negative')
+        try:
+            obj, end = self.scan_once(s, idx)
+        except StopIteration as err:
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+        try:
+            return self._convert(obj), end
+        except _Mismatch:
+            # Parse the document again, directly into the type, to find
+            # the position of the value which does not match.
+            return self._parse(s, idx)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.type!r})'
+
+
+class _Mismatch(Exception):
+    pass
+
+
+class _Compiler:
+    # Build a function for a type from the functions for its components.
+    # Subclasses implement one method per kind of type.
+
+    def __init__(self):
+        self.memo = {}
+
+    def compile(self, tp):
+        try:
+            return self.memo[tp]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable annotation.
+            return self._compile(tp)
+        # Recursive types refer to the function being compiled.
+        func = None
+        def forward(*args):
+            return func(*args)
+        self.memo[tp] = forward
+        func = self._compile(tp)
+        self.memo[tp] = func
+        return func
+
+    def _compile(self, tp):
+        import dataclasses
+        import enum
+        import types
+        import typing
+
+        if tp is typing.Any or tp is object:
+            return self.make_any()
+        if tp is None or tp is type(None):
+            return self.make_null()
+        if tp is bool:
+            return self.make_bool()
+        if tp is str:
+            return self.make_str()
+        if tp is int or tp is float:
+            return self.make_number(tp)
+        if tp is list or tp is dict:
+            return self.make_instance(tp)
+        if isinstance(tp, type) and issubclass(tp, enum.Enum):
+            return self.make_enum(tp)
+        if isinstance(tp, type) and dataclasses.is_dataclass(tp):
+            hints = typing.get_type_hints(tp)
+            fields = [field for field in dataclasses.fields(tp) if field.init]
+            funcs = {field.name: self.compile(hints[field.name])
+                     for field in fields}
+            required = frozenset(
+                field.name for field in fields
+                if field.default is dataclasses.MISSING and
+                   field.default_factory is dataclasses.MISSING)
+            kw_only = frozenset(field.name for field in fields
+                                if field.kw_only)
+            return self.make_dataclass(tp, funcs, required, kw_only)
+
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+        if origin is typing.Union or origin is types.UnionType:
+            NoneType = type(None)
+            others = [arg for arg in args if arg is not NoneType]
+            if len(others) == 1:
+                # Optional[T]
+                return self.make_optional(self.compile(others[0]))
+            if not all(arg in (str, int, float, bool, NoneType)
+                       for arg in args):
+                raise TypeError(f'cannot decode JSON into a union of '
+                                f'{args!r}; only unions of scalar types '
+                                f'are supported')
+            return self.make_union(args)
+        if origin in (list, set, frozenset) and len(args) == 1:
+            return self.make_array(self.compile(args[0]), origin)
+        if origin is tuple:
+            if len(args) == 2 and args[1] is Ellipsis:
+                return self.make_array(self.compile(args[0]), tuple)
+            return self.make_fixed_array([self.compile(arg) for arg in args])
+        if origin is dict and len(args) == 2 and args[0] is str:
+            return self.make_mapping(self.compile(args[1]))
+        raise TypeError(f'cannot decode JSON into {tp!r}')
+
+
+class _Converters(_Compiler):
+    # convert(value) returns the value decoded by JSONDecoder converted to
+    # the type, or raises _Mismatch.
+
+    def __init__(self):
+        super().__init__()
+        # Maps converters to a type whose instances they return unchanged,
+        # or to object if they return all values unchanged.
+        self.unchanged = {}
+
+    def make_any(self):
+        def convert(value):
+            return value
+        self.unchanged[convert] = object
+        return convert
+
+    def make_null(self):
+        def convert(value):
+            if value is not None:
+                raise _Mismatch
+            return value
+        return convert
+
+    def _make_exact(self, tp):
+        def convert(value):
+            if type(value) is not tp:
+                raise _Mismatch
+            return value
+        self.unchanged[convert] = tp
+        return convert
+
+    def make_bool(self):
+        return self._make_exact(bool)
+
+    def make_str(self):
+        return self._make_exact(str)
+
+    def make_instance(self, tp):
+        return self._make_exact(tp)
+
+    def make_number(self, tp):
+        if tp is int:
+            return self._make_exact(int)
+        def convert(value):
+            if type(value) is not float:
+                if type(value) is not int:
+                    raise _Mismatch
+                value = float(value)
+            return value
+        self.unchanged[convert] = float
+        return convert
+
+    def make_enum(self, tp):
+        def convert(value):
+            try:
+                return tp(value)
+            except (ValueError, TypeError):
+                raise _Mismatch from None
+        return convert
+
+    def make_optional(self, convert_value):
+        def convert(value):
+            if value is None:
+                return None
+            return convert_value(value)
+        if convert_value in self.unchanged:
+            self.unchanged[convert] = self.unchanged[convert_value]
+        return convert
+
+    def make_union(self, args):
+        types = frozenset(args)
+        if float in types:
+            # JSON does not distinguish 1.0 from 1.
+            types |= {int}
+        to_float = int not in args
+        def convert(value):
+            if type(value) not in types:
+                raise _Mismatch
+            if to_float and type(value) is int:
+                value = float(value)
+            return value
+        return convert
+
+    def make_array(self, convert_item, container):
+        # If the items all have the type which the item converter returns
+        # unchanged, the type check is done without calling it.
+        types = {self.unchanged.get(convert_item)}
+        def convert(value):
+            if type(value) is not list:
+                raise _Mismatch
+            if object not in types and not set(map(type, value)) <= types:
+                value = [convert_item(item) for item in value]
+            if container is not list:
+                value = container(value)
+            return value
+        return convert
+
+    def make_fixed_array(self, converters):
+        n = len(converters)
+        def convert(value):
+            if type(value) is not list or len(value) != n:
+                raise _Mismatch
+            return tuple([convert_item(item)
+                          for convert_item, item in zip(converters, value)])
+        return convert
+
+    def make_mapping(self, convert_value):
+        types = {self.unchanged.get(convert_value)}
+        def convert(value):
+            if type(value) is not dict:
+                raise _Mismatch
+            if (object not in types and
+                not set(map(type, value.values())) <= types):
+                value = {key: convert_value(item)
+                         for key, item in value.items()}
+            return value
+        return convert
+
+    def make_dataclass(self, cls, converters, required, kw_only):
+        def convert_partial(value):
+            # Some fields are missing from the JSON object.
+            kwargs = {}
+            for name, convert_field in converters.items():
+                try:
+                    item = value[name]
+                except KeyError:
+                    if name in required:
+                        raise _Mismatch from None
+                else:
+                    kwargs[name] = convert_field(item)
+            return cls(**kwargs)
+
+        # Like dataclasses does for __init__(), generate the source of the
+        # converter, so that a field only costs a lookup and a type check.
+        globals = {'_cls': cls, '_Mismatch': _Mismatch,
+                   '_convert_partial': convert_partial}
+        lines = ['def convert(value):',
+                 '    if type(value) is not dict:',
+                 '        raise _Mismatch']
+        if converters:
+            lines.append('    try:')
+            for i, name in enumerate(converters):
+                lines.append(f'        _{i} = value[{name!r}]')
+            lines += ['    except KeyError:',
+                      '        return _convert_partial(value)']
+        # Keyword-only fields can be declared before positional fields:
+        # pass them after all the positional arguments.
+        args = []
+        kwargs = []
+        for i, (name, convert_field) in enumerate(converters.items()):
+            if name in kw_only:
+                kwargs.append(f'{name}=_{i}')
+            else:
+                args.append(f'_{i}')
+            tp = self.unchanged.get(convert_field)
+            if tp is object:
+                continue
+            globals[f'_convert{i}'] = convert_field
+            if tp is None:
+                lines.append(f'    _{i} = _convert{i}(_{i})')
+            else:
+                globals[f'_type{i}'] = tp
+                lines += [f'    if type(_{i}) is not _type{i}:',
+                          f'        _{i} = _convert{i}(_{i})']
+        lines.append(f'    return _cls({", ".join(args + kwargs)})')
+        exec('\n'.join(lines), globals)
+        return globals['convert']
+
+
+class _Parsers(_Compiler):
+    # parse(s, idx) has the same interface as scan_once(): it returns the
+    # value starting at s[idx] and the index after it, and raises
+    # JSONDecodeError at the position of the first value which does not
+    # match the type.
+
+    def __init__(self, scan_once, strict):
+        super().__init__()
+        self.scan_once = scan_once
+        self.strict = strict
+
+    def make_any(self):
+        scan_once = self.scan_once
+        def parse(s, idx):
+            try:
+                return scan_once(s, idx)
+            except StopIteration as err:
+                raise JSONDecodeError("Expecting value", s, err.value) from None
+        return parse
+
+    def make_null(self):
+        def parse(s, idx):
+            if s.startswith('null', idx):
+                return None, idx + 4
+            raise JSONDecodeError("Expecting null", s, idx)
+        return parse
+
+    def make_bool(self):
+        def parse(s, idx):
+            if s.startswith('true', idx):
+                return True, idx + 4
+            if s.startswith('false', idx):
+                return False, idx + 5
+            raise JSONDecodeError("Expecting true or false", s, idx)
+        return parse
+
+    def make_str(self):
+        strict = self.strict
+        def parse(s, idx):
+            if s[idx:idx + 1] != '"':
+                raise JSONDecodeError("Expecting string", s, idx)
+            return scanstring(s, idx + 1, strict)
+        return parse
+
+    def make_number(self, tp):
+        scan_once = self.make_any()
+        if tp is int:
+            def parse(s, idx):
+                value, end = scan_once(s, idx)
+                if type(value) is not int:
+                    raise JSONDecodeError("Expecting integer", s, idx)
+                return value, end
+        else:
+            def parse(s, idx):
+                value, end = scan_once(s, idx)
+                if type(value) is not float:
+                    if type(value) is not int:
+                        raise JSONDecodeError("Expecting number", s, idx)
+                    value = float(value)
+                return value, end
+        return parse
+
+    def make_instance(self, tp):
+        scan_once = self.make_any()
+        msg = "Expecting array" if tp is list else "Expecting object"
+        def parse(s, idx):
+            value, end = scan_once(s, idx)
+            if type(value) is not tp:
+                raise JSONDecodeError(msg, s, idx)
+            return value, end
+        return parse
+
+    def make_enum(self, tp):
+        scan_once = self.make_any()
+        msg = f"Expecting a value of {tp.__name__}"
+        def parse(s, idx):
+            value, end = scan_once(s, idx)
+            try:
+                return tp(value), end
+            except (ValueError, TypeError):
+                raise JSONDecodeError(msg, s, idx) from None
+        return parse
+
+    def make_optional(self, parse_value):
+        def parse(s, idx):
+            if s.startswith('null', idx):
+                return None, idx + 4
+            return parse_value(s, idx)
+        return parse
+
+    def make_union(self, args):
+        convert = _Converters().make_union(args)
+        scan_once = self.make_any()
+        msg = "Expecting " + " or ".join(
+            'null' if arg is type(None) else arg.__name__ for arg in args)
+        def parse(s, idx):
+            value, end = scan_once(s, idx)
+            try:
+                return convert(value), end
+            except _Mismatch:
+                raise JSONDecodeError(msg, s, idx) from None
+        return parse
+
+    def make_array(self, parse_item, container,
+                   _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+        def parse(s, end):
+            if s[end:end + 1] != '[':
+                raise JSONDecodeError("Expecting array", s, end)
+            values = []
+            end = _w(s, end + 1).end()
+            if s[end:end + 1] == ']':
+                end += 1
+            else:
+                append = values.append
+                while True:
+                    value, end = parse_item(s, end)
+                    append(value)
+                    nextchar = s[end:end + 1]
+                    if nextchar in _ws:
+                        end = _w(s, end + 1).end()
+                        nextchar = s[end:end + 1]
+                    end += 1
+                    if nextchar == ']':
+                        break
+                    elif nextchar != ',':
+                        raise JSONDecodeError("Expecting ',' delimiter",
+                                              s, end - 1)
+                    end = _w(s, end).end()
+            if container is not list:
+                values = container(values)
+            return values, end
+        return parse
+
+    def make_fixed_array(self, parsers, _w=WHITESPACE.match):
+        msg = f"Expecting array of length {len(parsers)}"
+        def parse(s, end):
+            start = end
+            if s[end:end + 1] != '[':
+                raise JSONDecodeError("Expecting array", s, end)
+            values = []
+            end = _w(s, end + 1).end()
+            for i, parser in enumerate(parsers):
+                if i:
+                    if s[end:end + 1] != ',':
+                        raise JSONDecodeError(msg, s, start)
+                    end = _w(s, end + 1).end()
+                value, end = parser(s, end)
+                values.append(value)
+                end = _w(s, end).end()
+            if s[end:end + 1] != ']':
+                raise JSONDecodeError(msg, s, start)
+            return tuple(values), end + 1
+        return parse
+
+    def _make_object(self, set_item, make,
+                     _w=WHITESPACE.match, _ws=WHITESPACE_STR):
+        # Parse a JSON object, calling set_item(target, key, s, idx) for
+        # each member, where target is the result of make().  set_item()
+        # returns the index after the value.
+        strict = self.strict
+        def parse(s, end):
+            if s[end:end + 1] != '{':
+                raise JSONDecodeError("Expecting object", s, end)
+            target = make()
+            end = _w(s, end + 1).end()
+            nextchar = s[end:end + 1]
+            if nextchar == '}':
+                return target, end + 1
+            while True:
+                if nextchar != '"':
+                    raise JSONDecodeError(
+                        "Expecting property name enclosed in double quotes",
+                        s, end)
+                key, end = scanstring(s, end + 1, strict)
+                if s[end:end + 1] != ':':
+                    end = _w(s, end).end()
+                    if s[end:end + 1] != ':':
+                        raise JSONDecodeError("Expecting ':' delimiter",
+                                              s, end)
+                end = _w(s, end + 1).end()
+                end = set_item(target, key, s, end)
+                nextchar = s[end:end + 1]
+                if nextchar in _ws:
+                    end = _w(s, end + 1).end()
+                    nextchar = s[end:end + 1]
+                end += 1
+                if nextchar == '}':
+                    return target, end
+                elif nextchar != ',':
+                    raise JSONDecodeError("Expecting ',' delimiter",
+                                          s, end - 1)
+                end = _w(s, end).end()
+                nextchar = s[end:end + 1]
+        return parse
+
+    def make_mapping(self, parse_value):
+        def set_item(target, key, s, idx):
+            target[key], end = parse_value(s, idx)
+            return end
+        return self._make_object(set_item, dict)
+
+    def make_dataclass(self, cls, parsers, required, kw_only):
+        skip = self.make_any()
+        def set_item(kwargs, key, s, idx):
+            parser = parsers.get(key)
+            if parser is None:
+                # Not a field: validate and discard the value.
+                return skip(s, idx)[1]
+            kwargs[key], end = parser(s, idx)
+            return end
+        parse_object = self._make_object(set_item, dict)
+
+        def parse(s, idx):
+            kwargs, end = parse_object(s, idx)
+            if not required <= kwargs.keys():
+                missing = ', '.join(sorted(required - kwargs.keys()))
+                raise JSONDecodeError(f"Missing fields for {cls.__name__}: "
+                                      f"{missing}", s, idx)
+            return cls(**kwargs), end
+        return parse
@@ -11,6 +11,7 @@
 
 import io
 import os
+import select
 import sys
 import socket
 import struct
@@ -198,6 +199,11 @@ def send_bytes(self, buf, offset=0, size=None):
             raise ValueError("buffer length < offset + size")
         self._send_bytes(m[offset:offset + size])
 
+    def _send_bytes_many(self, bufs):
+        # Send each buffer as a message; overridden to use fewer writes.
+        for buf in bufs:
+            self._send_bytes(buf)
+
     def send(self, obj):
         """Send a (picklable) object"""
         self._check_closed()
@@ -255,6 +261,11 @@ def poll(self, timeout=0.0):
         self._check_readable()
         return self._poll(timeout)
 
+    def _make_poll_nowait(self):
+        # Return a function telling whether there is input available, like
+        # poll(), for checking it repeatedly; overridden to be cheaper.
+        return self.poll
+
     def __enter__(self):
         return self
 
@@ -409,6 +420,23 @@ def _send_bytes(self, buf):
                 # to avoid "broken pipe" errors if the other end closed the pipe.
                 self._send(header + buf)
 
+    def _send_bytes_many(self, bufs):
+        # Like _send_bytes() for each buffer, but consecutive small messages
+        # are concatenated to be sent with a single write.
+        parts = []
+        for buf in bufs:
+            n = len(buf)
+            if n > 16384:
+                if parts:
+                    self._send(b''.join(parts))
+                    parts.clear()
+                self._send_bytes(buf)
+            else:
+                parts.append(struct.pack("!i", n))
+                parts.append(buf)
+        if parts:
+            self._send(b''.join(parts))
+
     def _recv_bytes(self, maxsize=None):
         buf = self._recv(4)
         size, = struct.unpack("!i", buf.getvalue())
@@ -423,6 +451,15 @@ def _poll(self, timeout):
         r = wait([self], timeout)
         return bool(r)
 
+    if not _winapi and hasattr(select, 'poll'):
+        def _make_poll_nowait(self):
+            # wait() creates a selector on each call: reuse a poll object.
+            self._check_closed()
+            self._check_readable()
+            poller = select.poll()
+            poller.register(self._handle, select.POLLIN)
+            return lambda: bool(poller.poll(0))
+
 
 #
 # Public functions
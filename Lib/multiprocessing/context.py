@@ -97,27 +97,31 @@ def Barrier(self, parties, action=None, timeout=None):
         from .synchronize import Barrier
         return Barrier(parties, action, timeout, ctx=self.get_context())
 
-    def Queue(self, maxsize=0):
+    def Queue(self, maxsize=0, *, shared_memory_threshold=None):
         '''Returns a queue object'''
         from .queues import Queue
-        return Queue(maxsize, ctx=self.get_context())
+        return Queue(maxsize, ctx=self.get_context(),
+                     shared_memory_threshold=shared_memory_threshold)
 
-    def JoinableQueue(self, maxsize=0):
+    def JoinableQueue(self, maxsize=0, *, shared_memory_threshold=None):
         '''Returns a queue object'''
         from .queues import JoinableQueue
-        return JoinableQueue(maxsize, ctx=self.get_context())
+        return JoinableQueue(maxsize, ctx=self.get_context(),
+                             shared_memory_threshold=shared_memory_threshold)
 
-    def SimpleQueue(self):
+    def SimpleQueue(self, *, shared_memory_threshold=None):
         '''Returns a queue object'''
         from .queues import SimpleQueue
-        return SimpleQueue(ctx=self.get_context())
+        return SimpleQueue(ctx=self.get_context(),
+                           shared_memory_threshold=shared_memory_threshold)
 
     def Pool(self, processes=None, initializer=None, initargs=(),
-             maxtasksperchild=None):
+             maxtasksperchild=None, *, shared_memory_threshold=None):
         '''Returns a process pool object'''
         from .pool import Pool
         return Pool(processes, initializer, initargs, maxtasksperchild,
-                    context=self.get_context())
+                    context=self.get_context(),
+                    shared_memory_threshold=shared_memory_threshold)
 
     def RawValue(self, typecode_or_type, *args):
         '''Returns a shared object'''
@@ -181,13 +181,15 @@ def Process(ctx, *args, **kwds):
         return ctx.Process(*args, **kwds)
 
     def __init__(self, processes=None, initializer=None, initargs=(),
-                 maxtasksperchild=None, context=None):
+                 maxtasksperchild=None, context=None, *,
+                 shared_memory_threshold=None):
         # Attributes initialized early to make sure that they exist in
         # __del__() if __init__() raises an exception
         self._pool = []
         self._state = INIT
 
         self._ctx = context or get_context()
+        self._shared_memory_threshold = shared_memory_threshold
         self._setup_queues()
         self._taskqueue = queue.SimpleQueue()
         # The _change_notifier queue exist to wake up self._handle_workers()
@@ -343,9 +345,13 @@ def _maintain_pool(ctx, Process, processes, pool, inqueue, outqueue,
                                          wrap_exception)
 
     def _setup_queues(self):
-        self._inqueue = self._ctx.SimpleQueue()
-        self._outqueue = self._ctx.SimpleQueue()
-        self._quick_put = self._inqueue._writer.send
+        threshold = self._shared_memory_threshold
+        self._inqueue = self._ctx.SimpleQueue(shared_memory_threshold=threshold)
+        self._outqueue = self._ctx.SimpleQueue(shared_memory_threshold=threshold)
+        if threshold is None:
+            self._quick_put = self._inqueue._writer.send
+        else:
+            self._quick_put = self._inqueue.put
         self._quick_get = self._outqueue._reader.recv
 
     def _check_running(self):
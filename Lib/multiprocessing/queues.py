@@ -13,6 +13,7 @@
 import os
 import threading
 import collections
+import functools
 import time
 import types
 import weakref
@@ -28,17 +29,42 @@
 
 from .util import debug, info, Finalize, register_after_fork, is_exiting
 
+
+def _get_dumps(shared_memory_threshold):
+    # Return the function pickling the objects put in a queue.
+    if shared_memory_threshold is None:
+        return _ForkingPickler.dumps
+    if (not isinstance(shared_memory_threshold, int)
+            or shared_memory_threshold <= 0):
+        raise ValueError("shared_memory_threshold must be a positive integer "
+                         "or None")
+    from .shared_memory import _dumps_shared_buffers, _USE_POSIX
+    if _USE_POSIX:
+        # The shared memory blocks are registered with the resource tracker
+        # by the process putting an object and unregistered by the process
+        # getting it.  Start the tracker now, so that processes forked later
+        # share it with this one.
+        from . import resource_tracker
+        resource_tracker.ensure_running()
+    return functools.partial(_dumps_shared_buffers,
+                             threshold=shared_memory_threshold)
+
+# The feeder thread of a Queue sends the objects buffered meanwhile with
+# the same write, up to this many bytes.
+_COALESCE_SIZE = 64 * 1024
+
 #
 # Queue type using a pipe, buffer and thread
 #
 
 class Queue(object):
 
-    def __init__(self, maxsize=0, *, ctx):
+    def __init__(self, maxsize=0, *, ctx, shared_memory_threshold=None):
         if maxsize <= 0:
             # Can raise ImportError (see issues #3770 and #23400)
             from .synchronize import SEM_VALUE_MAX as maxsize
         self._maxsize = maxsize
+        self._shared_memory_threshold = shared_memory_threshold
         self._reader, self._writer = connection.Pipe(duplex=False)
         self._rlock = ctx.Lock()
         self._opid = os.getpid()
@@ -57,11 +83,13 @@ def __init__(self, maxsize=0, *, ctx):
     def __getstate__(self):
         context.assert_spawning(self)
         return (self._ignore_epipe, self._maxsize, self._reader, self._writer,
-                self._rlock, self._wlock, self._sem, self._opid)
+                self._rlock, self._wlock, self._sem, self._opid,
+                self._shared_memory_threshold)
 
     def __setstate__(self, state):
         (self._ignore_epipe, self._maxsize, self._reader, self._writer,
-         self._rlock, self._wlock, self._sem, self._opid) = state
+         self._rlock, self._wlock, self._sem, self._opid,
+         self._shared_memory_threshold) = state
         self._reset()
 
     def _after_fork(self):
@@ -80,8 +108,10 @@ def _reset(self, after_fork=False):
         self._closed = False
         self._close = None
         self._send_bytes = self._writer.send_bytes
+        self._send_bytes_many = self._writer._send_bytes_many
         self._recv_bytes = self._reader.recv_bytes
         self._poll = self._reader.poll
+        self._dumps = _get_dumps(self._shared_memory_threshold)
 
     def put(self, obj, block=True, timeout=None):
         if self._closed:
@@ -95,6 +125,32 @@ def put(self, obj, block=True, timeout=None):
             self._buffer.append(obj)
             self._notempty.notify()
 
+    def put_many(self, objs, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        objs = list(objs)
+        if block and timeout is not None:
+            deadline = time.monotonic() + timeout
+        i = 0
+        while i < len(objs):
+            if block and timeout is not None:
+                timeout = max(deadline - time.monotonic(), 0)
+            if not self._sem.acquire(block, timeout):
+                raise Full
+            # Buffer together the objects which fit in the queue.
+            j = i + 1
+            while j < len(objs) and self._sem.acquire(False):
+                j += 1
+            self._extend_buffer(objs[i:j])
+            i = j
+
+    def _extend_buffer(self, objs):
+        with self._notempty:
+            if self._thread is None:
+                self._start_thread()
+            self._buffer.extend(objs)
+            self._notempty.notify()
+
     def get(self, block=True, timeout=None):
         if self._closed:
             raise ValueError(f"Queue {self!r} is closed")
@@ -121,6 +177,35 @@ def get(self, block=True, timeout=None):
         # unserialize the data after having released the lock
         return _ForkingPickler.loads(res)
 
+    def get_many(self, max_items, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+        if block and timeout is not None:
+            deadline = time.monotonic() + timeout
+        if not self._rlock.acquire(block, timeout):
+            raise Empty
+        try:
+            if block and timeout is not None:
+                timeout = deadline - time.monotonic()
+                if not self._poll(timeout):
+                    raise Empty
+            elif not block and not self._poll():
+                raise Empty
+            res = [self._recv_bytes()]
+            self._sem.release()
+            # Take the following items if they are already in the pipe.
+            if max_items > 1:
+                poll = self._reader._make_poll_nowait()
+                while len(res) < max_items and poll():
+                    res.append(self._recv_bytes())
+                    self._sem.release()
+        finally:
+            self._rlock.release()
+        # unserialize the data after having released the lock
+        return [_ForkingPickler.loads(buf) for buf in res]
+
     def qsize(self):
         # Raises NotImplementedError on Mac OSX because of broken sem_getvalue()
         return self._maxsize - self._sem._semlock._get_value()
@@ -168,7 +253,7 @@ def _start_thread(self):
             args=(self._buffer, self._notempty, self._send_bytes,
                   self._wlock, self._reader.close, self._writer.close,
                   self._ignore_epipe, self._on_queue_feeder_error,
-                  self._sem),
+                  self._sem, self._dumps, self._send_bytes_many),
             name='QueueFeederThread'
         )
         self._thread.daemon = True
@@ -210,7 +295,8 @@ def _finalize_close(buffer, notempty):
 
     @staticmethod
     def _feed(buffer, notempty, send_bytes, writelock, reader_close,
-              writer_close, ignore_epipe, onerror, queue_sem):
+              writer_close, ignore_epipe, onerror, queue_sem,
+              dumps=_ForkingPickler.dumps, send_bytes_many=None):
         debug('starting thread to feed data to pipe')
         nacquire = notempty.acquire
         nrelease = notempty.release
@@ -222,6 +308,7 @@ def _feed(buffer, notempty, send_bytes, writelock, reader_close,
             wrelease = writelock.release
         else:
             wacquire = None
+        batch = None
 
         while 1:
             try:
@@ -241,15 +328,43 @@ def _feed(buffer, notempty, send_bytes, writelock, reader_close,
                             return
 
                         # serialize the data before acquiring the lock
-                        obj = _ForkingPickler.dumps(obj)
-                        if wacquire is None:
-                            send_bytes(obj)
+                        batch = None
+                        if (wacquire is None or send_bytes_many is None
+                                or not buffer):
+                            obj = dumps(obj)
+                            if wacquire is None:
+                                send_bytes(obj)
+                            else:
+                                wacquire()
+                                try:
+                                    send_bytes(obj)
+                                finally:
+                                    wrelease()
                         else:
+                            # Send the objects put meanwhile with the same
+                            # write.  Keep them next to their pickles, to
+                            # report a failure for each of them.
+                            batch = [(obj, dumps(obj))]
+                            size = len(batch[0][1])
+                            while buffer and size < _COALESCE_SIZE:
+                                obj = bpopleft()
+                                if obj is sentinel:
+                                    buffer.appendleft(obj)
+                                    break
+                                try:
+                                    data = dumps(obj)
+                                except Exception:
+                                    # Report the error on the next iteration.
+                                    buffer.appendleft(obj)
+                                    break
+                                batch.append((obj, data))
+                                size += len(data)
                             wacquire()
                             try:
-                                send_bytes(obj)
+                                send_bytes_many([data for _, data in batch])
                             finally:
                                 wrelease()
+                            batch = None
                 except IndexError:
                     pass
             except Exception as e:
@@ -267,9 +382,13 @@ def _feed(buffer, notempty, send_bytes, writelock, reader_close,
                     # to decrease the size of the queue. The error acts as
                     # if the object had been silently removed from the queue
                     # and this step is necessary to have a properly working
-                    # queue.
-                    queue_sem.release()
-                    onerror(e, obj)
+                    # queue.  All the objects of a failed write are reported.
+                    if batch is None:
+                        batch = [(obj, None)]
+                    for obj, _ in batch:
+                        queue_sem.release()
+                        onerror(e, obj)
+                    batch = None
 
     @staticmethod
     def _on_queue_feeder_error(e, obj):
@@ -295,8 +414,9 @@ def _on_queue_feeder_error(e, obj):
 
 class JoinableQueue(Queue):
 
-    def __init__(self, maxsize=0, *, ctx):
-        Queue.__init__(self, maxsize, ctx=ctx)
+    def __init__(self, maxsize=0, *, ctx, shared_memory_threshold=None):
+        Queue.__init__(self, maxsize, ctx=ctx,
+                       shared_memory_threshold=shared_memory_threshold)
         self._unfinished_tasks = ctx.Semaphore(0)
         self._cond = ctx.Condition()
 
@@ -320,6 +440,15 @@ def put(self, obj, block=True, timeout=None):
             self._unfinished_tasks.release()
             self._notempty.notify()
 
+    def _extend_buffer(self, objs):
+        with self._notempty, self._cond:
+            if self._thread is None:
+                self._start_thread()
+            self._buffer.extend(objs)
+            for _ in objs:
+                self._unfinished_tasks.release()
+            self._notempty.notify()
+
     def task_done(self):
         with self._cond:
             if not self._unfinished_tasks.acquire(False):
@@ -338,7 +467,7 @@ def join(self):
 
 class SimpleQueue(object):
 
-    def __init__(self, *, ctx):
+    def __init__(self, *, ctx, shared_memory_threshold=None):
         self._reader, self._writer = connection.Pipe(duplex=False)
         self._rlock = ctx.Lock()
         self._poll = self._reader.poll
@@ -346,6 +475,8 @@ def __init__(self, *, ctx):
             self._wlock = None
         else:
             self._wlock = ctx.Lock()
+        self._shared_memory_threshold = shared_memory_threshold
+        self._dumps = _get_dumps(shared_memory_threshold)
 
     def close(self):
         self._reader.close()
@@ -356,11 +487,14 @@ def empty(self):
 
     def __getstate__(self):
         context.assert_spawning(self)
-        return (self._reader, self._writer, self._rlock, self._wlock)
+        return (self._reader, self._writer, self._rlock, self._wlock,
+                self._shared_memory_threshold)
 
     def __setstate__(self, state):
-        (self._reader, self._writer, self._rlock, self._wlock) = state
+        (self._reader, self._writer, self._rlock, self._wlock,
+         self._shared_memory_threshold) = state
         self._poll = self._reader.poll
+        self._dumps = _get_dumps(self._shared_memory_threshold)
 
     def get(self):
         with self._rlock:
@@ -368,9 +502,22 @@ def get(self):
         # unserialize the data after having released the lock
         return _ForkingPickler.loads(res)
 
+    def get_many(self, max_items):
+        if max_items <= 0:
+            raise ValueError("max_items must be greater than 0")
+        with self._rlock:
+            res = [self._reader.recv_bytes()]
+            # Take the following items if they are already in the pipe.
+            if max_items > 1:
+                poll = self._reader._make_poll_nowait()
+                while len(res) < max_items and poll():
+                    res.append(self._reader.recv_bytes())
+        # unserialize the data after having released the lock
+        return [_ForkingPickler.loads(buf) for buf in res]
+
     def put(self, obj):
         # serialize the data before acquiring the lock
-        obj = _ForkingPickler.dumps(obj)
+        obj = self._dumps(obj)
         if self._wlock is None:
             # writes to a message oriented win32 pipe are atomic
             self._writer.send_bytes(obj)
@@ -378,4 +525,14 @@ def put(self, obj):
             with self._wlock:
                 self._writer.send_bytes(obj)
 
+    def put_many(self, objs):
+        # serialize the data before acquiring the lock
+        objs = [self._dumps(obj) for obj in objs]
+        if self._wlock is None:
+            # writes to a message oriented win32 pipe are atomic
+            self._writer._send_bytes_many(objs)
+        else:
+            with self._wlock:
+                self._writer._send_bytes_many(objs)
+
     __class_getitem__ = classmethod(types.GenericAlias)
@@ -9,9 +9,11 @@
 
 
 from functools import partial
+import array
 import mmap
 import os
 import errno
+import pickle
 import struct
 import secrets
 import types
@@ -24,6 +26,7 @@
     _USE_POSIX = True
 
 from . import resource_tracker
+from .reduction import ForkingPickler
 
 _O_CREX = os.O_CREAT | os.O_EXCL
 
@@ -244,6 +247,111 @@ def unlink(self):
             resource_tracker.unregister(self._name, "shared_memory")
 
 
+#
+# Out-of-band pickle buffers in shared memory, used by the queues and
+# the process pools when they are given a shared_memory_threshold.
+#
+
+def _reduce_array(a):
+    return _rebuild_array, (a.typecode, pickle.PickleBuffer(a))
+
+def _rebuild_array(typecode, buf):
+    a = array.array(typecode)
+    a.frombytes(buf)
+    return a
+
+
+class _SharedBuffersPickler(ForkingPickler):
+    """ForkingPickler giving the contents of arrays as out-of-band buffers."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dispatch_table[array.array] = _reduce_array
+
+
+class _SharedBuffersPickle:
+    """A pickle whose out-of-band buffers are in shared memory blocks."""
+
+    def __init__(self, data, blocks):
+        self.data = data
+        self.blocks = blocks
+
+    def __reduce__(self):
+        return _load_shared_buffers, (self.data, self.blocks)
+
+
+def _dumps_shared_buffers(obj, threshold):
+    """Pickle obj, moving the large out-of-band buffers to shared memory.
+
+    The buffers of at least threshold bytes given to pickle protocol 5 by
+    pickle.PickleBuffer objects, arrays and third-party types are copied
+    into new shared memory blocks, and the pickle only holds their names.
+    Unpickling it attaches to the blocks and unlinks them: the memory is
+    released when the unpickled objects are.
+    """
+    if not _USE_POSIX:
+        # A block is destroyed when its last handle is closed, which could
+        # happen before the receiver attaches to it.
+        return ForkingPickler.dumps(obj)
+
+    blocks = []
+
+    def buffer_callback(picklebuffer):
+        try:
+            view = picklebuffer.raw()
+        except BufferError:
+            # Not contiguous: serialize it in-band.
+            return True
+        with view:
+            size = view.nbytes
+            if size < threshold:
+                return True
+            shm = SharedMemory(create=True, size=size)
+            blocks.append((shm._name, size))
+            try:
+                shm.buf[:size] = view
+            finally:
+                shm.close()
+        return False
+
+    try:
+        data = _SharedBuffersPickler.dumps(obj, 5,
+                                           buffer_callback=buffer_callback)
+    except BaseException:
+        for name, _ in blocks:
+            _unlink_block(name)
+        raise
+    if not blocks:
+        return data
+    return ForkingPickler.dumps(_SharedBuffersPickle(bytes(data), blocks))
+
+
+def _load_shared_buffers(data, blocks):
+    buffers = []
+    try:
+        for name, size in blocks:
+            fd = _posixshmem.shm_open(name, os.O_RDWR, mode=0o600)
+            try:
+                # The mapping outlives the name, as long as a view uses it.
+                buffers.append(memoryview(mmap.mmap(fd, size)))
+            finally:
+                os.close(fd)
+                _unlink_block(name)
+    finally:
+        # Do not leak the blocks following one which could not be opened.
+        for name, _ in blocks[len(buffers) + 1:]:
+            _unlink_block(name)
+    return pickle.loads(data, buffers=buffers)
+
+
+def _unlink_block(name):
+    try:
+        _posixshmem.shm_unlink(name)
+    except FileNotFoundError:
+        pass
+    resource_tracker.unregister(name, "shared_memory")
+
+
 _encoding = "utf8"
 
 class ShareableList:
@@ -7,6 +7,7 @@
 
 import fnmatch
 import functools
+import glob
 import io
 import ntpath
 import os
@@ -81,12 +82,13 @@ def _is_case_sensitive(flavour):
 
 @functools.lru_cache(maxsize=256)
 def _compile_pattern(pat, case_sensitive):
-    """Compile given glob pattern to a re.Pattern object (observing case
+    """Compile given glob pattern to a matching function (observing case
     sensitivity), or None if the pattern should match everything."""
     if pat == '*':
         return None
-    flags = re.NOFLAG if case_sensitive else re.IGNORECASE
-    return re.compile(fnmatch.translate(pat), flags).match
+    if case_sensitive:
+        return fnmatch.compile_many((pat,))
+    return re.compile(fnmatch.translate(pat), re.IGNORECASE).match
 
 
 @functools.lru_cache()
@@ -738,6 +740,14 @@ def match(self, path_pattern, *, case_sensitive=None):
             path_pattern = self.with_segments(path_pattern)
         if case_sensitive is None:
             case_sensitive = _is_case_sensitive(self._flavour)
+        if (len(path_pattern._tail) == 1 and self._tail
+                and not path_pattern.drive and not path_pattern.root):
+            # Single-component relative pattern (e.g. '*.py'): only the last
+            # component of this path needs to be matched.
+            pattern_str = path_pattern._tail[0]
+            if '**' not in pattern_str and '\n' not in pattern_str:
+                match = _compile_pattern(pattern_str, case_sensitive)
+                return match is None or bool(match(self._tail[-1]))
         pattern = _compile_pattern_lines(path_pattern._lines, case_sensitive)
         if path_pattern.drive or path_pattern.root:
             return pattern.match(self._lines) is not None
@@ -1097,6 +1107,31 @@ def _glob(self, pattern, case_sensitive, follow_symlinks):
                 while part_idx < len(pattern_parts) and pattern_parts[part_idx] == '**':
                     part_idx += 1
 
+                remaining_parts = pattern_parts[part_idx:]
+                if (not filter_paths and any(remaining_parts)
+                        and '..' not in remaining_parts):
+                    # Match all following pattern parts against a single
+                    # walk of each directory, rather than scanning every
+                    # directory again for each part.
+                    for rest in remaining_parts:
+                        if '**' in rest and rest != '**':
+                            raise ValueError("Invalid pattern: '**' can only be an entire path component")
+                    dir_only = remaining_parts[-1] == ''
+                    if dir_only:
+                        del remaining_parts[-1]
+                    walker = glob._GlobWalker(
+                        ['**'] + remaining_parts,
+                        functools.partial(_compile_pattern, case_sensitive=case_sensitive),
+                        lambda path: path._scandir(),
+                        lambda path, name: path._make_child_relpath(name),
+                        dir_only=dir_only,
+                        follow_symlinks=follow_symlinks is not False,
+                        recurse_symlinks=bool(follow_symlinks))
+                    paths = (match for path in paths for match, _ in walker.walk(path))
+                    if deduplicate_paths:
+                        paths = _select_unique(paths)
+                    return paths
+
                 if filter_paths and part_idx < len(pattern_parts) and pattern_parts[part_idx] != '':
                     dir_only = pattern_parts[-1] == ''
                     paths = _select_recursive(paths, dir_only, follow_symlinks)
@@ -49,6 +49,7 @@
 # This should never be removed, see rationale in:
 # https://bugs.python.org/issue43743#msg393429
 _USE_CP_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+_USE_CP_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
 _HAS_FCOPYFILE = posix and hasattr(posix, "_fcopyfile")  # macOS
 
 # CMD defaults in Windows 10
@@ -109,6 +110,68 @@ def _fastcopy_fcopyfile(fsrc, fdst, flags):
         else:
             raise err from None
 
+def _determine_linux_fastcopy_blocksize(infd):
+    """Determine blocksize for fastcopying on Linux.
+
+    Hopefully the whole file will be copied in a single call.
+    The copying itself should be performed in a loop 'till EOF is
+    reached (0 return) so a blocksize smaller or bigger than the actual
+    file size should not make any difference, also in case the file
+    content changes while being copied.
+    """
+    try:
+        blocksize = max(os.fstat(infd).st_size, 2 ** 23)  # min 8MiB
+    except OSError:
+        blocksize = 2 ** 27  # 128MiB
+    # On 32-bit architectures truncate to 1GiB to avoid OverflowError,
+    # see bpo-38319.
+    if sys.maxsize < 2 ** 32:
+        blocksize = min(blocksize, 2 ** 30)
+    return blocksize
+
+def _fastcopy_copy_file_range(fsrc, fdst):
+    """Copy data from one regular mmap-like fd to another by using
+    high-performance copy_file_range(2) syscall, which keeps the data
+    in the kernel and lets the filesystem use reflinks or server-side
+    copies.
+    This should work on Linux >= 4.5 only.
+    """
+    try:
+        infd = fsrc.fileno()
+        outfd = fdst.fileno()
+    except Exception as err:
+        raise _GiveupOnFastCopy(err)  # not a regular file
+
+    blocksize = _determine_linux_fastcopy_blocksize(infd)
+    offset = 0
+    while True:
+        try:
+            copied = os.copy_file_range(infd, outfd, blocksize,
+                                        offset_dst=offset)
+        except OSError as err:
+            # ...in oder to have a more informative exception.
+            err.filename = fsrc.name
+            err.filename2 = fdst.name
+
+            if err.errno == errno.ENOSPC:  # filesystem is full
+                raise err from None
+
+            # Give up on first call and if no data was copied
+            # (e.g. EXDEV for cross-filesystem copies on older kernels).
+            if offset == 0 and os.lseek(outfd, 0, os.SEEK_CUR) == 0:
+                raise _GiveupOnFastCopy(err)
+
+            raise err
+        else:
+            if copied == 0:
+                # Some filesystems (e.g. procfs) report a size but
+                # copy_file_range() silently copies nothing, so let the
+                # caller fall back on a regular copy.
+                if offset == 0:
+                    raise _GiveupOnFastCopy()
+                break  # EOF
+            offset += copied
+
 def _fastcopy_sendfile(fsrc, fdst):
     """Copy data from one regular mmap-like fd to another by using
     high-performance sendfile(2) syscall.
@@ -130,20 +193,7 @@ def _fastcopy_sendfile(fsrc, fdst):
     except Exception as err:
         raise _GiveupOnFastCopy(err)  # not a regular file
 
-    # Hopefully the whole file will be copied in a single call.
-    # sendfile() is called in a loop 'till EOF is reached (0 return)
-    # so a bufsize smaller or bigger than the actual file size
-    # should not make any difference, also in case the file content
-    # changes while being copied.
-    try:
-        blocksize = max(os.fstat(infd).st_size, 2 ** 23)  # min 8MiB
-    except OSError:
-        blocksize = 2 ** 27  # 128MiB
-    # On 32-bit architectures truncate to 1GiB to avoid OverflowError,
-    # see bpo-38319.
-    if sys.maxsize < 2 ** 32:
-        blocksize = min(blocksize, 2 ** 30)
-
+    blocksize = _determine_linux_fastcopy_blocksize(infd)
     offset = 0
     while True:
         try:
@@ -268,12 +318,21 @@ def copyfile(src, dst, *, follow_symlinks=True):
                         except _GiveupOnFastCopy:
                             pass
                     # Linux
-                    elif _USE_CP_SENDFILE:
-                        try:
-                            _fastcopy_sendfile(fsrc, fdst)
-                            return dst
-                        except _GiveupOnFastCopy:
-                            pass
+                    elif _USE_CP_SENDFILE or _USE_CP_COPY_FILE_RANGE:
+                        # copy_file_range() keeps same-filesystem copies
+                        # entirely in the kernel (possibly as a reflink).
+                        if _USE_CP_COPY_FILE_RANGE:
+                            try:
+                                _fastcopy_copy_file_range(fsrc, fdst)
+                                return dst
+                            except _GiveupOnFastCopy:
+                                pass
+                        if _USE_CP_SENDFILE:
+                            try:
+                                _fastcopy_sendfile(fsrc, fdst)
+                                return dst
+                            except _GiveupOnFastCopy:
+                                pass
                     # Windows, see:
                     # https://github.com/python/cpython/pull/7160#discussion_r195405230
                     elif _WINDOWS and file_size > 0:
@@ -469,15 +528,19 @@ def ignore_patterns(*patterns):
 
     Patterns is a sequence of glob-style patterns
     that are used to exclude files"""
-    def _ignore_patterns(path, names):
-        ignored_names = []
-        for pattern in patterns:
-            ignored_names.extend(fnmatch.filter(names, pattern))
-        return set(ignored_names)
+    match = fnmatch.compile_many([os.path.normcase(pat) for pat in patterns])
+    if _WINDOWS:
+        def _ignore_patterns(path, names):
+            normcase = os.path.normcase
+            return {name for name in names if match(normcase(name))}
+    else:
+        # normcase on posix is NOP. Optimize it away from the loop.
+        def _ignore_patterns(path, names):
+            return {name for name in names if match(name)}
     return _ignore_patterns
 
 def _copytree(entries, src, dst, symlinks, ignore, copy_function,
-              ignore_dangling_symlinks, dirs_exist_ok=False):
+              ignore_dangling_symlinks, dirs_exist_ok=False, executor=None):
     if ignore is not None:
         ignored_names = ignore(os.fspath(src), [x.name for x in entries])
     else:
@@ -509,17 +572,19 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
                     # doing the right thing.
                     os.symlink(linkto, dstname)
                     copystat(srcobj, dstname, follow_symlinks=not symlinks)
+                    continue
+                # ignore dangling symlink if the flag is on
+                if not os.path.exists(linkto) and ignore_dangling_symlinks:
+                    continue
+                # otherwise let the copy occur. copy2 will raise an error
+            if executor is not None:
+                if srcentry.is_dir():
+                    errors.append(_copytree_deferred(
+                        srcobj, dstname, symlinks, ignore, copy_function,
+                        ignore_dangling_symlinks, dirs_exist_ok, executor))
                 else:
-                    # ignore dangling symlink if the flag is on
-                    if not os.path.exists(linkto) and ignore_dangling_symlinks:
-                        continue
-                    # otherwise let the copy occur. copy2 will raise an error
-                    if srcentry.is_dir():
-                        copytree(srcobj, dstname, symlinks, ignore,
-                                 copy_function, ignore_dangling_symlinks,
-                                 dirs_exist_ok)
-                    else:
-                        copy_function(srcobj, dstname)
+                    future = executor.submit(copy_function, srcobj, dstname)
+                    errors.append((srcname, dstname, future))
             elif srcentry.is_dir():
                 copytree(srcobj, dstname, symlinks, ignore, copy_function,
                          ignore_dangling_symlinks, dirs_exist_ok)
@@ -532,6 +597,11 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
             errors.extend(err.args[0])
         except OSError as why:
             errors.append((srcname, dstname, str(why)))
+    if executor is not None:
+        # The files of this directory may still be being copied, so
+        # its metadata is copied by _copytree_wait() once they are done.
+        errors.append((src, dst, None))
+        return errors
     try:
         copystat(src, dst)
     except OSError as why:
@@ -542,8 +612,50 @@ def _copytree(entries, src, dst, symlinks, ignore, copy_function,
         raise Error(errors)
     return dst
 
+def _copytree_deferred(src, dst, symlinks, ignore, copy_function,
+                       ignore_dangling_symlinks, dirs_exist_ok, executor):
+    sys.audit("shutil.copytree", src, dst)
+    with os.scandir(src) as itr:
+        entries = list(itr)
+    return _copytree(entries=entries, src=src, dst=dst, symlinks=symlinks,
+                     ignore=ignore, copy_function=copy_function,
+                     ignore_dangling_symlinks=ignore_dangling_symlinks,
+                     dirs_exist_ok=dirs_exist_ok, executor=executor)
+
+def _copytree_wait(pending):
+    """Wait for the copies scheduled by _copytree() with an executor.
+
+    Return the list of errors in the same order as a sequential copy
+    would report them.  Directory metadata is copied here, after all
+    files within the directory have been written.
+    """
+    errors = []
+    for item in pending:
+        if isinstance(item, list):
+            errors.extend(_copytree_wait(item))
+            continue
+        srcname, dstname, job = item
+        if job is None:
+            try:
+                copystat(srcname, dstname)
+            except OSError as why:
+                # Copying file access times may fail on Windows
+                if getattr(why, 'winerror', None) is None:
+                    errors.append((srcname, dstname, str(why)))
+        elif isinstance(job, str):
+            errors.append(item)
+        else:
+            try:
+                job.result()
+            except Error as err:
+                errors.extend(err.args[0])
+            except OSError as why:
+                errors.append((srcname, dstname, str(why)))
+    return errors
+
 def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
-             ignore_dangling_symlinks=False, dirs_exist_ok=False):
+             ignore_dangling_symlinks=False, dirs_exist_ok=False, *,
+             workers=None):
     """Recursively copy a directory tree and return the destination directory.
 
     If exception(s) occur, an Error is raised with a list of reasons.
@@ -581,7 +693,25 @@ def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
     operation will continue if it encounters existing directories, and files
     within the `dst` tree will be overwritten by corresponding files from the
     `src` tree.
+
+    If workers is given, the tree is still walked in the calling thread
+    but files are copied concurrently by a pool of that many threads,
+    which helps when copying many small files is bound by the latency of
+    individual system calls.  The copy_function must then be thread-safe.
+    Errors are reported in the same order as for a sequential copy and
+    directory metadata is copied once all files within it are written.
     """
+    if workers is not None:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = _copytree_deferred(src, dst, symlinks, ignore,
+                                         copy_function,
+                                         ignore_dangling_symlinks,
+                                         dirs_exist_ok, executor)
+            errors = _copytree_wait(pending)
+        if errors:
+            raise Error(errors)
+        return dst
     sys.audit("shutil.copytree", src, dst)
     with os.scandir(src) as itr:
         entries = list(itr)
@@ -640,7 +770,7 @@ def _rmtree_unsafe(path, onexc):
         onexc(os.rmdir, path, err)
 
 # Version using fd-based APIs to protect against races
-def _rmtree_safe_fd(topfd, path, onexc):
+def _rmtree_safe_fd(topfd, path, onexc, subdirs=None):
     try:
         with os.scandir(topfd) as scandir_it:
             entries = list(scandir_it)
@@ -662,7 +792,11 @@ def _rmtree_safe_fd(topfd, path, onexc):
                 except OSError as err:
                     onexc(os.lstat, fullname, err)
                     continue
-        if is_dir:
+        if is_dir and subdirs is not None:
+            # Leave the subdirectory to the caller, see
+            # _rmtree_safe_fd_parallel().
+            subdirs.append((entry.name, fullname, orig_st))
+        elif is_dir:
             try:
                 dirfd = os.open(entry.name, os.O_RDONLY, dir_fd=topfd)
                 dirfd_closed = False
@@ -696,12 +830,150 @@ def _rmtree_safe_fd(topfd, path, onexc):
             except OSError as err:
                 onexc(os.unlink, fullname, err)
 
+def _rmtree_safe_fd_open(topfd, name, fullname, orig_st, onexc):
+    # Open the subdirectory *name* of topfd and check that it is still the
+    # directory found by os.scandir().  Return None if it is not.
+    try:
+        dirfd = os.open(name, os.O_RDONLY, dir_fd=topfd)
+    except OSError as err:
+        onexc(os.open, fullname, err)
+        return None
+    try:
+        if os.path.samestat(orig_st, os.fstat(dirfd)):
+            return dirfd
+        try:
+            # This can only happen if someone replaces
+            # a directory with a symlink after the call to
+            # os.scandir or stat.S_ISDIR above.
+            raise OSError("Cannot call rmtree on a symbolic link")
+        except OSError as err:
+            onexc(os.path.islink, fullname, err)
+    except BaseException:
+        os.close(dirfd)
+        raise
+    os.close(dirfd)
+    return None
+
+def _rmtree_safe_fd_scan(topfd, name, fullname, orig_st, onexc):
+    # Remove everything but the subdirectories of the subdirectory *name*
+    # of topfd.  Return its fd and the list of its subdirectories, or None.
+    dirfd = _rmtree_safe_fd_open(topfd, name, fullname, orig_st, onexc)
+    if dirfd is None:
+        return None
+    subdirs = []
+    try:
+        _rmtree_safe_fd(dirfd, fullname, onexc, subdirs)
+    except BaseException:
+        os.close(dirfd)
+        raise
+    return dirfd, subdirs
+
+def _rmtree_safe_fd_subtree(topfd, name, fullname, orig_st, onexc):
+    # Remove the subdirectory *name* of topfd in the current thread.
+    dirfd = _rmtree_safe_fd_open(topfd, name, fullname, orig_st, onexc)
+    if dirfd is None:
+        return None
+    try:
+        _rmtree_safe_fd(dirfd, fullname, onexc)
+    finally:
+        os.close(dirfd)
+    try:
+        os.rmdir(name, dir_fd=topfd)
+    except OSError as err:
+        onexc(os.rmdir, fullname, err)
+    return None
+
+# Maximum number of directory file descriptors kept open by the concurrent
+# part of rmtree(..., workers=N).
+_RMTREE_MAX_FDS = 128
+
+class _RmtreeDir:
+    __slots__ = ('fd', 'name', 'path', 'parent', 'pending')
+
+    def __init__(self, fd, name, path, parent, pending):
+        self.fd = fd
+        self.name = name
+        self.path = path
+        self.parent = parent
+        self.pending = pending  # number of subdirectories not yet removed
+
+def _rmtree_safe_fd_parallel(topfd, path, onexc, workers):
+    """Remove the content of the directory topfd using a pool of threads.
+
+    Every subdirectory is scanned by a worker thread which removes its
+    files and reports back its subdirectories, which are scheduled in turn.
+    The calling thread keeps track of the open directory file descriptors
+    and removes a directory once all its subdirectories are gone.  At most
+    _RMTREE_MAX_FDS directories are held open by the scan; beyond that,
+    subtrees are removed sequentially by a worker as in _rmtree_safe_fd().
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+    subdirs = []
+    _rmtree_safe_fd(topfd, path, onexc, subdirs)
+    if not subdirs:
+        return
+    root = _RmtreeDir(topfd, None, path, None, len(subdirs))
+    ready = [(root, *subdir) for subdir in subdirs]
+    running = {}
+    opened = set()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            while ready or running:
+                while ready and len(running) < 2 * workers:
+                    parent, name, fullname, orig_st = ready.pop()
+                    if len(opened) + len(running) < _RMTREE_MAX_FDS:
+                        func = _rmtree_safe_fd_scan
+                    else:
+                        func = _rmtree_safe_fd_subtree
+                    future = executor.submit(func, parent.fd, name, fullname,
+                                             orig_st, onexc)
+                    running[future] = parent, name, fullname
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    parent, name, fullname = running.pop(future)
+                    result = future.result()
+                    if result is None:
+                        # The subdirectory was removed or could not be.
+                        node = parent
+                        node.pending -= 1
+                    else:
+                        dirfd, subdirs = result
+                        node = _RmtreeDir(dirfd, name, fullname, parent,
+                                          len(subdirs))
+                        opened.add(node)
+                        ready.extend((node, *subdir) for subdir in subdirs)
+                    # Remove the directories left empty, walking upwards.
+                    while not node.pending and node is not root:
+                        opened.remove(node)
+                        os.close(node.fd)
+                        try:
+                            os.rmdir(node.name, dir_fd=node.parent.fd)
+                        except OSError as err:
+                            onexc(os.rmdir, node.path, err)
+                        node = node.parent
+                        node.pending -= 1
+        except BaseException:
+            # Wait for the running workers, which use the descriptors we
+            # hold, and close those they opened before propagating.
+            for future in running:
+                future.cancel()
+            for future in running:
+                if not future.cancelled() and future.exception() is None:
+                    result = future.result()
+                    if result is not None:
+                        os.close(result[0])
+            for node in opened:
+                os.close(node.fd)
+            raise
+
 _use_fd_functions = ({os.open, os.stat, os.unlink, os.rmdir} <=
                      os.supports_dir_fd and
                      os.scandir in os.supports_fd and
                      os.stat in os.supports_follow_symlinks)
 
-def rmtree(path, ignore_errors=False, onerror=None, *, onexc=None, dir_fd=None):
+def rmtree(path, ignore_errors=False, onerror=None, *, onexc=None, dir_fd=None,
+           workers=None):
     """Recursively delete a directory tree.
 
     If dir_fd is not None, it should be a file descriptor open to a directory;
@@ -720,11 +992,19 @@ def rmtree(path, ignore_errors=False, onerror=None, *, onexc=None, dir_fd=None):
 
     onerror is deprecated and only remains for backwards compatibility.
     If both onerror and onexc are set, onerror is ignored and onexc is used.
+
+    If workers is given and the fd-based implementation protecting against
+    symlink attacks is available, sibling subtrees are deleted concurrently
+    by a pool of that many threads; onexc or onerror may then be called from
+    these threads.  The number of directory file descriptors the concurrent
+    walk keeps open is bounded.
     """
 
     if onerror is not None:
         warnings.warn("onerror argument is deprecated, use onexc instead",
                       DeprecationWarning, stacklevel=2)
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be greater than 0")
 
     sys.audit("shutil.rmtree", path, dir_fd)
     if ignore_errors:
@@ -766,7 +1046,10 @@ def onexc(*args):
             return
         try:
             if os.path.samestat(orig_st, os.fstat(fd)):
-                _rmtree_safe_fd(fd, path, onexc)
+                if workers is None:
+                    _rmtree_safe_fd(fd, path, onexc)
+                else:
+                    _rmtree_safe_fd_parallel(fd, path, onexc, workers)
                 try:
                     os.close(fd)
                     fd_closed = True
@@ -97,6 +97,26 @@
 LinearRegression(slope=0.1, intercept=1.5)
 
 
+Streaming statistics
+--------------------
+
+==================  ====================================================
+Class               Description
+==================  ====================================================
+RunningStats        One-pass mean, variance and standard deviation.
+RunningCovariance   One-pass covariance, correlation and regression.
+QuantileSketch      Approximate quantiles in bounded memory.
+==================  ====================================================
+
+Accumulate statistics for data too large to keep in memory, or computed in
+several parts and merged:
+
+>>> stats = RunningStats([2.5, 3.25, 5.5])
+>>> stats.update([11.25, 11.75])
+>>> stats.stdev()  #doctest: +ELLIPSIS
+4.38961843444...
+
+
 Exceptions
 ----------
 
@@ -106,6 +126,9 @@
 
 __all__ = [
     'NormalDist',
+    'QuantileSketch',
+    'RunningCovariance',
+    'RunningStats',
     'StatisticsError',
     'correlation',
     'covariance',
@@ -134,11 +157,11 @@
 
 from fractions import Fraction
 from decimal import Decimal
-from itertools import count, groupby, repeat
+from itertools import accumulate, count, groupby, islice, repeat
 from bisect import bisect_left, bisect_right
 from math import hypot, sqrt, fabs, exp, erf, tau, log, fsum, sumprod
 from functools import reduce
-from operator import itemgetter
+from operator import itemgetter, sub
 from collections import Counter, namedtuple, defaultdict
 
 _SQRT2 = sqrt(2.0)
@@ -246,6 +269,45 @@ def _ss(data, c=None):
     return (T, ssd, c, count)
 
 
+def _float_ss(data, c=None):
+    """Return the sum of square deviations, mean and count of data as floats.
+
+    This is the faster but less accurate counterpart of _ss(), used with
+    precision='float'.  Sequences and buffers such as arrays are traversed
+    several times with C-level iteration instead of being copied to a list of
+    Python objects first; other iterables are copied.
+    """
+    try:
+        n = len(data)
+    except TypeError:
+        data = list(data)
+        n = len(data)
+    if not n:
+        return (0.0, 0.0, 0)
+
+    def deviations():
+        return map(sub, map(float, data), repeat(c))
+
+    if c is None:
+        c = fsum(data) / n
+        # The second term corrects for the rounding error in c.
+        ss = sumprod(deviations(), deviations()) - fsum(deviations()) ** 2 / n
+        ss = max(ss, 0.0)
+    else:
+        c = float(c)
+        ss = sumprod(deviations(), deviations())
+    return (ss, c, n)
+
+
+def _float_precision(precision):
+    """Return true if precision selects float arithmetic over exact arithmetic."""
+    if precision == 'exact':
+        return False
+    if precision == 'float':
+        return True
+    raise ValueError(f'Unknown precision: {precision!r}')
+
+
 def _isfinite(x):
     try:
         return x.is_finite()  # Likely a Decimal.
@@ -465,7 +527,7 @@ def _decimal_sqrt_of_frac(n: int, m: int) -> Decimal:
 
 # === Measures of central tendency (averages) ===
 
-def mean(data):
+def mean(data, *, precision='exact'):
     """Return the sample arithmetic mean of data.
 
     >>> mean([1, 2, 3, 4, 4])
@@ -480,7 +542,16 @@ def mean(data):
     Decimal('0.5625')
 
     If ``data`` is empty, StatisticsError will be raised.
+
+    If ``precision`` is 'float', the data is converted to floats and the
+    result is computed with floating-point arithmetic like fmean() does,
+    which is much faster but not exact.
     """
+    if _float_precision(precision):
+        try:
+            return fmean(data)
+        except StatisticsError:
+            raise StatisticsError('mean requires at least one data point') from None
     T, total, n = _sum(data)
     if n < 1:
         raise StatisticsError('mean requires at least one data point')
@@ -871,7 +942,7 @@ def quantiles(data, *, n=4, method='exclusive'):
 #     http://mathworld.wolfram.com/SampleVariance.html
 
 
-def variance(data, xbar=None):
+def variance(data, xbar=None, *, precision='exact'):
     """Return the sample variance of data.
 
     data should be an iterable of Real-valued numbers, with at least two
@@ -908,14 +979,28 @@ def variance(data, xbar=None):
     >>> variance([F(1, 6), F(1, 2), F(5, 3)])
     Fraction(67, 108)
 
+    If ``precision`` is 'float', the data is converted to floats and the
+    result is computed with floating-point arithmetic, which is much faster
+    but not exact.  The result is then always a float.  This accepts buffers
+    such as array.array('d') without copying them to a list:
+
+    >>> from array import array
+    >>> variance(array('d', data), precision='float')  #doctest: +ELLIPSIS
+    1.37202380952380...
+
     """
+    if _float_precision(precision):
+        ss, c, n = _float_ss(data, xbar)
+        if n < 2:
+            raise StatisticsError('variance requires at least two data points')
+        return ss / (n - 1)
     T, ss, c, n = _ss(data, xbar)
     if n < 2:
         raise StatisticsError('variance requires at least two data points')
     return _convert(ss / (n - 1), T)
 
 
-def pvariance(data, mu=None):
+def pvariance(data, mu=None, *, precision='exact'):
     """Return the population variance of ``data``.
 
     data should be a sequence or iterable of Real-valued numbers, with at least one
@@ -949,14 +1034,21 @@ def pvariance(data, mu=None):
     >>> pvariance([F(1, 4), F(5, 4), F(1, 2)])
     Fraction(13, 72)
 
+    See ``variance`` for the ``precision`` argument.
+
     """
+    if _float_precision(precision):
+        ss, c, n = _float_ss(data, mu)
+        if n < 1:
+            raise StatisticsError('pvariance requires at least one data point')
+        return ss / n
     T, ss, c, n = _ss(data, mu)
     if n < 1:
         raise StatisticsError('pvariance requires at least one data point')
     return _convert(ss / n, T)
 
 
-def stdev(data, xbar=None):
+def stdev(data, xbar=None, *, precision='exact'):
     """Return the square root of the sample variance.
 
     See ``variance`` for arguments and other details.
@@ -965,6 +1057,11 @@ def stdev(data, xbar=None):
     1.0810874155219827
 
     """
+    if _float_precision(precision):
+        ss, c, n = _float_ss(data, xbar)
+        if n < 2:
+            raise StatisticsError('stdev requires at least two data points')
+        return sqrt(ss / (n - 1))
     T, ss, c, n = _ss(data, xbar)
     if n < 2:
         raise StatisticsError('stdev requires at least two data points')
@@ -974,7 +1071,7 @@ def stdev(data, xbar=None):
     return _float_sqrt_of_frac(mss.numerator, mss.denominator)
 
 
-def pstdev(data, mu=None):
+def pstdev(data, mu=None, *, precision='exact'):
     """Return the square root of the population variance.
 
     See ``pvariance`` for arguments and other details.
@@ -983,6 +1080,11 @@ def pstdev(data, mu=None):
     0.986893273527251
 
     """
+    if _float_precision(precision):
+        ss, c, n = _float_ss(data, mu)
+        if n < 1:
+            raise StatisticsError('pstdev requires at least one data point')
+        return sqrt(ss / n)
     T, ss, c, n = _ss(data, mu)
     if n < 1:
         raise StatisticsError('pstdev requires at least one data point')
@@ -1149,6 +1251,556 @@ def linear_regression(x, y, /, *, proportional=False):
     return LinearRegression(slope=slope, intercept=intercept)
 
 
+## Streaming statistics ####################################################
+
+# Welford's algorithm, and Chan, Golub and LeVeque's formulas to combine
+# the statistics of two datasets:
+#     https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
+# The data is added in chunks whose statistics are computed with fsum()
+# and then combined, which is both faster and more accurate than updating
+# the statistics for each value.
+
+_CHUNK_SIZE = 1024
+
+
+class RunningStats:
+    """Accumulate the mean and variance of a stream of data in one pass.
+
+    Values are added one at a time with add() or in bulk with update(),
+    without being stored.  Statistics accumulated separately, for example
+    in several worker processes, can be combined with merge().
+
+    >>> stats = RunningStats([2.75, 1.75, 1.25, 0.25])
+    >>> stats.update([0.5, 1.25, 3.5])
+    >>> stats.n, stats.mean
+    (7, 1.6071428571428572)
+    >>> stats.variance()  #doctest: +ELLIPSIS
+    1.37202380952380...
+
+    All computations use floats, like fmean().  The results agree with
+    those of mean(), variance(), pvariance(), stdev() and pstdev() to
+    within a few units in the last place, unless the variance is tiny
+    compared to the square of the mean.
+    """
+
+    __slots__ = {
+        '_n': 'Number of values',
+        '_mean': 'Arithmetic mean of the values',
+        '_m2': 'Sum of the squared deviations from the mean',
+        '_min': 'Smallest value',
+        '_max': 'Largest value',
+    }
+
+    def __init__(self, data=()):
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = self._max = None
+        self.update(data)
+
+    def add(self, x):
+        "Add the value *x*."
+        x = float(x)
+        n = self._n + 1
+        delta = x - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (x - self._mean)
+        self._n = n
+        if n == 1:
+            self._min = self._max = x
+        elif x < self._min:
+            self._min = x
+        elif x > self._max:
+            self._max = x
+
+    def update(self, data):
+        "Add all the values in the iterable *data*."
+        it = iter(data)
+        while chunk := [float(x) for x in islice(it, _CHUNK_SIZE)]:
+            n = len(chunk)
+            mean = fsum(chunk) / n
+            m2 = fsum([(x - mean) ** 2 for x in chunk])
+            self._combine(n, mean, m2, min(chunk), max(chunk))
+
+    def merge(self, other):
+        "Add the values accumulated by the RunningStats *other*."
+        if not isinstance(other, RunningStats):
+            raise TypeError('can only merge another RunningStats')
+        if other._n:
+            self._combine(other._n, other._mean, other._m2,
+                          other._min, other._max)
+
+    def _combine(self, n_b, mean_b, m2_b, min_b, max_b):
+        n_a = self._n
+        if not n_a:
+            self._n, self._mean, self._m2 = n_b, mean_b, m2_b
+            self._min, self._max = min_b, max_b
+            return
+        n = n_a + n_b
+        delta = mean_b - self._mean
+        self._mean += delta * n_b / n
+        self._m2 += m2_b + delta * delta * n_a * n_b / n
+        self._n = n
+        self._min = min(self._min, min_b)
+        self._max = max(self._max, max_b)
+
+    @property
+    def n(self):
+        "Number of values added."
+        return self._n
+
+    @property
+    def mean(self):
+        "Arithmetic mean of the values."
+        if not self._n:
+            raise StatisticsError('mean requires at least one data point')
+        return self._mean
+
+    @property
+    def min(self):
+        "Smallest value."
+        if not self._n:
+            raise StatisticsError('min requires at least one data point')
+        return self._min
+
+    @property
+    def max(self):
+        "Largest value."
+        if not self._n:
+            raise StatisticsError('max requires at least one data point')
+        return self._max
+
+    def variance(self):
+        "Sample variance of the values."
+        if self._n < 2:
+            raise StatisticsError('variance requires at least two data points')
+        return self._m2 / (self._n - 1)
+
+    def pvariance(self):
+        "Population variance of the values."
+        if self._n < 1:
+            raise StatisticsError('pvariance requires at least one data point')
+        return self._m2 / self._n
+
+    def stdev(self):
+        "Sample standard deviation of the values."
+        if self._n < 2:
+            raise StatisticsError('stdev requires at least two data points')
+        return sqrt(self._m2 / (self._n - 1))
+
+    def pstdev(self):
+        "Population standard deviation of the values."
+        if self._n < 1:
+            raise StatisticsError('pstdev requires at least one data point')
+        return sqrt(self._m2 / self._n)
+
+    def __repr__(self):
+        if not self._n:
+            return f'<{type(self).__name__} n=0>'
+        return (f'<{type(self).__name__} n={self._n} mean={self._mean!r} '
+                f'min={self._min!r} max={self._max!r}>')
+
+    def __getstate__(self):
+        return self._n, self._mean, self._m2, self._min, self._max
+
+    def __setstate__(self, state):
+        self._n, self._mean, self._m2, self._min, self._max = state
+
+
+class RunningCovariance:
+    """Accumulate the covariance of two streams of data in one pass.
+
+    Pairs of values are added one at a time with add() or in bulk with
+    update(), without being stored.  Statistics accumulated separately can
+    be combined with merge().
+
+    >>> stats = RunningCovariance([1, 2, 3, 4, 5, 6, 7, 8, 9],
+    ...                           [1, 2, 3, 1, 2, 3, 1, 2, 3])
+    >>> stats.covariance()
+    0.75
+    >>> stats.correlation()  #doctest: +ELLIPSIS
+    0.31622776601...
+
+    All computations use floats.  The results agree with those of
+    covariance(), correlation() and linear_regression() to within a few
+    units in the last place, unless the variances are tiny compared to the
+    squares of the means.
+    """
+
+    __slots__ = {
+        '_n': 'Number of pairs of values',
+        '_xbar': 'Arithmetic mean of the x values',
+        '_ybar': 'Arithmetic mean of the y values',
+        '_sxx': 'Sum of the squared deviations of x from its mean',
+        '_syy': 'Sum of the squared deviations of y from its mean',
+        '_sxy': 'Sum of the products of the deviations from the means',
+        '_xmin': 'Smallest x value',
+        '_xmax': 'Largest x value',
+        '_ymin': 'Smallest y value',
+        '_ymax': 'Largest y value',
+    }
+
+    def __init__(self, x=(), y=(), /):
+        self._n = 0
+        self._xbar = self._ybar = 0.0
+        self._sxx = self._syy = self._sxy = 0.0
+        self._xmin = self._xmax = self._ymin = self._ymax = None
+        self.update(x, y)
+
+    def add(self, x, y):
+        "Add the pair of values *x* and *y*."
+        x = float(x)
+        y = float(y)
+        n = self._n + 1
+        dx = x - self._xbar
+        dy = y - self._ybar
+        self._xbar += dx / n
+        self._ybar += dy / n
+        self._sxx += dx * (x - self._xbar)
+        self._syy += dy * (y - self._ybar)
+        self._sxy += dx * (y - self._ybar)
+        self._n = n
+        if n == 1:
+            self._xmin = self._xmax = x
+            self._ymin = self._ymax = y
+        else:
+            if x < self._xmin:
+                self._xmin = x
+            elif x > self._xmax:
+                self._xmax = x
+            if y < self._ymin:
+                self._ymin = y
+            elif y > self._ymax:
+                self._ymax = y
+
+    def update(self, x, y, /):
+        "Add the pairs of values from the iterables *x* and *y*."
+        x = iter(x)
+        y = iter(y)
+        while True:
+            xs = [float(xi) for xi in islice(x, _CHUNK_SIZE)]
+            ys = [float(yi) for yi in islice(y, _CHUNK_SIZE)]
+            if len(xs) != len(ys):
+                raise StatisticsError('RunningCovariance requires that both '
+                                      'inputs have same number of data points')
+            if not xs:
+                return
+            n = len(xs)
+            extremes = min(xs), max(xs), min(ys), max(ys)
+            xbar = fsum(xs) / n
+            ybar = fsum(ys) / n
+            xs = [xi - xbar for xi in xs]
+            ys = [yi - ybar for yi in ys]
+            self._combine(n, xbar, ybar, sumprod(xs, xs), sumprod(ys, ys),
+                          sumprod(xs, ys), *extremes)
+
+    def merge(self, other):
+        "Add the pairs of values accumulated by the RunningCovariance *other*."
+        if not isinstance(other, RunningCovariance):
+            raise TypeError('can only merge another RunningCovariance')
+        if other._n:
+            self._combine(other._n, other._xbar, other._ybar,
+                          other._sxx, other._syy, other._sxy,
+                          other._xmin, other._xmax, other._ymin, other._ymax)
+
+    def _combine(self, n_b, xbar_b, ybar_b, sxx_b, syy_b, sxy_b,
+                 xmin_b, xmax_b, ymin_b, ymax_b):
+        n_a = self._n
+        if not n_a:
+            self._n, self._xbar, self._ybar = n_b, xbar_b, ybar_b
+            self._sxx, self._syy, self._sxy = sxx_b, syy_b, sxy_b
+            self._xmin, self._xmax = xmin_b, xmax_b
+            self._ymin, self._ymax = ymin_b, ymax_b
+            return
+        n = n_a + n_b
+        dx = xbar_b - self._xbar
+        dy = ybar_b - self._ybar
+        f = n_a * n_b / n
+        self._xbar += dx * n_b / n
+        self._ybar += dy * n_b / n
+        self._sxx += sxx_b + dx * dx * f
+        self._syy += syy_b + dy * dy * f
+        self._sxy += sxy_b + dx * dy * f
+        self._n = n
+        self._xmin = min(self._xmin, xmin_b)
+        self._xmax = max(self._xmax, xmax_b)
+        self._ymin = min(self._ymin, ymin_b)
+        self._ymax = max(self._ymax, ymax_b)
+
+    @property
+    def n(self):
+        "Number of pairs of values added."
+        return self._n
+
+    @property
+    def x(self):
+        "New RunningStats of the x values."
+        return self._marginal(self._xbar, self._sxx, self._xmin, self._xmax)
+
+    @property
+    def y(self):
+        "New RunningStats of the y values."
+        return self._marginal(self._ybar, self._syy, self._ymin, self._ymax)
+
+    def _marginal(self, mean, m2, min_value, max_value):
+        stats = RunningStats()
+        if self._n:
+            stats._combine(self._n, mean, m2, min_value, max_value)
+        return stats
+
+    def covariance(self):
+        "Sample covariance of the pairs of values."
+        if self._n < 2:
+            raise StatisticsError('covariance requires at least two data points')
+        return self._sxy / (self._n - 1)
+
+    def correlation(self):
+        "Pearson's correlation coefficient of the pairs of values."
+        if self._n < 2:
+            raise StatisticsError('correlation requires at least two data points')
+        try:
+            return self._sxy / sqrt(self._sxx * self._syy)
+        except ZeroDivisionError:
+            raise StatisticsError('at least one of the inputs is constant')
+
+    def linear_regression(self, *, proportional=False):
+        "Slope and intercept for simple linear regression of y on x."
+        n = self._n
+        if n < 2:
+            raise StatisticsError('linear regression requires at least two data points')
+        if proportional:
+            sxy = self._sxy + n * self._xbar * self._ybar
+            sxx = self._sxx + n * self._xbar * self._xbar
+        else:
+            sxy = self._sxy
+            sxx = self._sxx
+        try:
+            slope = sxy / sxx
+        except ZeroDivisionError:
+            raise StatisticsError('x is constant')
+        intercept = 0.0 if proportional else self._ybar - slope * self._xbar
+        return LinearRegression(slope=slope, intercept=intercept)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} n={self._n}>'
+
+    def __getstate__(self):
+        return (self._n, self._xbar, self._ybar,
+                self._sxx, self._syy, self._sxy,
+                self._xmin, self._xmax, self._ymin, self._ymax)
+
+    def __setstate__(self, state):
+        (self._n, self._xbar, self._ybar,
+         self._sxx, self._syy, self._sxy,
+         self._xmin, self._xmax, self._ymin, self._ymax) = state
+
+
+# The KLL sketch keeps a hierarchy of buffers ("compactors").  Items in the
+# buffer at level h stand for 2**h values.  When a buffer is full it is
+# sorted, and every other item, starting at a random offset, is promoted to
+# the next level while the others are discarded.  Lower levels get smaller
+# buffers, geometrically decreasing with the ratio 2/3 from k at the top.
+# Karnin, Lang and Liberty, "Optimal Quantile Approximation in Streams"
+#     https://arxiv.org/abs/1603.05346
+
+class QuantileSketch:
+    """Approximate the quantiles of a stream of data in bounded memory.
+
+    Values are added one at a time with add() or in bulk with update().
+    Only O(k) of them are kept, where *k* trades memory for accuracy.
+    Sketches accumulated separately, for example in several worker
+    processes, can be combined with merge().
+
+    As long as no more than *k* values were added, quantiles() returns
+    the same result as the quantiles() function.  After that, the
+    results are approximate: with the default *k* of 200, the rank of
+    each cut point in the data is typically within 1% of the requested
+    rank, and rarely off by more than 2%.
+
+    >>> sketch = QuantileSketch(range(1, 100_001), seed=8675309)
+    >>> [round(q, -3) for q in sketch.quantiles(n=4)]
+    [25000, 50000, 75000]
+
+    If *seed* is given, the random choices made when compacting the data
+    are reproducible.
+    """
+
+    __slots__ = {
+        '_k': 'Size of the largest buffer',
+        '_levels': 'Buffers of values standing for 2**level values each',
+        '_n': 'Number of values added',
+        '_size': 'Number of values in the buffers',
+        '_capacity': 'Number of values the buffers can hold before compacting',
+        '_min': 'Smallest value',
+        '_max': 'Largest value',
+        '_random': 'Random number generator for compaction',
+    }
+
+    def __init__(self, data=(), *, k=200, seed=None):
+        if k < 8:
+            raise StatisticsError('k must be at least 8')
+        self._k = k
+        self._levels = [[]]
+        self._n = 0
+        self._size = 0
+        self._capacity = self._level_capacity(0)
+        self._min = self._max = None
+        self._random = random.Random(seed)
+        self.update(data)
+
+    def _level_capacity(self, level):
+        depth = len(self._levels) - level - 1
+        return max(2, int(self._k * (2 / 3) ** depth) + 1)
+
+    def add(self, x):
+        "Add the value *x*."
+        if self._n:
+            if x < self._min:
+                self._min = x
+            elif x > self._max:
+                self._max = x
+        else:
+            self._min = self._max = x
+        self._levels[0].append(x)
+        self._n += 1
+        self._size += 1
+        if self._size >= self._capacity:
+            self._compress()
+
+    def update(self, data):
+        "Add all the values in the iterable *data*."
+        it = iter(data)
+        while chunk := list(islice(it, self._k)):
+            lo = min(chunk)
+            hi = max(chunk)
+            if not self._n:
+                self._min, self._max = lo, hi
+            else:
+                self._min = min(self._min, lo)
+                self._max = max(self._max, hi)
+            self._levels[0] += chunk
+            self._n += len(chunk)
+            self._size += len(chunk)
+            while self._size >= self._capacity:
+                self._compress()
+
+    def merge(self, other):
+        "Add the values summarized by the QuantileSketch *other*."
+        if not isinstance(other, QuantileSketch):
+            raise TypeError('can only merge another QuantileSketch')
+        if not other._n:
+            return
+        if self._n:
+            self._min = min(self._min, other._min)
+            self._max = max(self._max, other._max)
+        else:
+            self._min, self._max = other._min, other._max
+        while len(self._levels) < len(other._levels):
+            self._grow()
+        for level, items in zip(self._levels, other._levels):
+            level += items
+        self._n += other._n
+        self._size = sum(map(len, self._levels))
+        while self._size >= self._capacity:
+            self._compress()
+
+    def _grow(self):
+        self._levels.append([])
+        self._capacity = sum(map(self._level_capacity,
+                                 range(len(self._levels))))
+
+    def _compress(self):
+        for h, items in enumerate(self._levels):
+            if len(items) >= self._level_capacity(h):
+                if h + 1 == len(self._levels):
+                    self._grow()
+                items.sort()
+                start = len(items) % 2      # an odd item out stays
+                promoted = items[start + self._random.getrandbits(1)::2]
+                del items[start:]
+                self._levels[h + 1] += promoted
+                self._size = sum(map(len, self._levels))
+                if self._size < self._capacity:
+                    break
+
+    def _weighted(self):
+        # Sorted list of the kept values and the cumulative weight up to
+        # and including each of them.
+        pairs = sorted((x, 1 << h)
+                       for h, items in enumerate(self._levels)
+                       for x in items)
+        values = [x for x, w in pairs]
+        cumulative = list(accumulate(w for x, w in pairs))
+        return values, cumulative
+
+    @property
+    def n(self):
+        "Number of values added."
+        return self._n
+
+    @property
+    def min(self):
+        "Smallest value."
+        if not self._n:
+            raise StatisticsError('min requires at least one data point')
+        return self._min
+
+    @property
+    def max(self):
+        "Largest value."
+        if not self._n:
+            raise StatisticsError('max requires at least one data point')
+        return self._max
+
+    def rank(self, x):
+        "Approximate fraction of the values less than or equal to *x*."
+        if not self._n:
+            raise StatisticsError('rank requires at least one data point')
+        values, cumulative = self._weighted()
+        i = bisect_right(values, x)
+        weight = cumulative[i - 1] if i else 0
+        return weight / cumulative[-1]
+
+    def quantiles(self, *, n=4, method='exclusive'):
+        """Divide the data into *n* continuous intervals with equal probability.
+
+        Returns a list of (n - 1) cut points separating the intervals, as
+        the quantiles() function does.
+        """
+        if n < 1:
+            raise StatisticsError('n must be at least 1')
+        if len(self._levels) == 1:
+            # Nothing was discarded yet.
+            return quantiles(self._levels[0], n=n, method=method)
+        if method not in {'inclusive', 'exclusive'}:
+            raise ValueError(f'Unknown method: {method!r}')
+        values, cumulative = self._weighted()
+        total = cumulative[-1]
+        result = []
+        for i in range(1, n):
+            if method == 'inclusive':
+                rank = i * (total - 1) / n
+            else:
+                rank = i * (total + 1) / n - 1
+            j = bisect_right(cumulative, rank)
+            result.append(values[min(j, len(values) - 1)])
+        return result
+
+    def __repr__(self):
+        return f'<{type(self).__name__} n={self._n} k={self._k}>'
+
+    def __getstate__(self):
+        return (self._k, self._levels, self._n, self._min, self._max,
+                self._random)
+
+    def __setstate__(self, state):
+        (self._k, self._levels, self._n, self._min, self._max,
+         self._random) = state
+        self._size = sum(map(len, self._levels))
+        self._capacity = sum(map(self._level_capacity,
+                                 range(len(self._levels))))
+
+
 ## Normal Distribution #####################################################
 
 
@@ -1276,6 +1276,159 @@ def test_closed_queue_put_get_exceptions(self):
                 q.put('foo')
             with self.assertRaisesRegex(ValueError, 'is closed'):
                 q.get()
+            with self.assertRaisesRegex(ValueError, 'is closed'):
+                q.put_many(['foo'])
+            with self.assertRaisesRegex(ValueError, 'is closed'):
+                q.get_many(1)
+
+    @classmethod
+    def _test_put_many(cls, queue):
+        queue.put_many(range(10, 20))
+        queue.put_many([])
+
+    def test_put_many_get_many(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        queue = self.Queue()
+        queue.put_many(range(10))
+        p = self.Process(target=self._test_put_many, args=(queue,))
+        p.daemon = True
+        p.start()
+
+        items = []
+        while len(items) < 20:
+            batch = queue.get_many(8, timeout=support.SHORT_TIMEOUT)
+            self.assertLessEqual(len(batch), 8)
+            items.extend(batch)
+        self.assertEqual([i for i in items if i < 10], list(range(10)))
+        self.assertEqual([i for i in items if i >= 10], list(range(10, 20)))
+        self.assertRaises(pyqueue.Empty, queue.get_many, 8, False)
+        self.assertRaises(pyqueue.Empty, queue.get_many, 8, True, TIMEOUT1)
+        with self.assertRaises(ValueError):
+            queue.get_many(0)
+
+        p.join()
+        close_queue(queue)
+
+    def test_put_many_full(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        queue = self.Queue(maxsize=4)
+        self.assertRaises(pyqueue.Full, queue.put_many, range(10), False)
+        self.assertRaises(pyqueue.Full, queue.put_many, [10], True, TIMEOUT1)
+        # The items which fit in the queue were put.
+        items = []
+        while len(items) < 4:
+            items.extend(queue.get_many(10, timeout=support.SHORT_TIMEOUT))
+        self.assertEqual(items, [0, 1, 2, 3])
+        self.assertRaises(pyqueue.Empty, queue.get_many, 10, False)
+        close_queue(queue)
+
+    def test_put_many_task_done(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        queue = self.JoinableQueue()
+        queue.put_many(range(10))
+        items = []
+        while len(items) < 10:
+            batch = queue.get_many(10, timeout=support.SHORT_TIMEOUT)
+            items.extend(batch)
+            for _ in batch:
+                queue.task_done()
+        self.assertEqual(items, list(range(10)))
+        queue.join()
+        self.assertRaises(ValueError, queue.task_done)
+        close_queue(queue)
+
+    def test_queue_feeder_coalescing(self):
+        # The objects buffered by the feeder thread are sent with the same
+        # write, but each one is still a message of its own.
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        class NotSerializable(object):
+            def __reduce__(self):
+                raise AttributeError
+
+        payload = [1, b'x' * 100000, NotSerializable(), 2, None]
+        with test.support.captured_stderr():
+            q = self.Queue(maxsize=5)
+            q.put_many(payload)
+            items = []
+            while len(items) < 4:
+                items.extend(q.get_many(10, timeout=support.SHORT_TIMEOUT))
+            self.assertEqual(items, [1, b'x' * 100000, 2, None])
+            try:
+                self.assertEqual(q.qsize(), 0)
+            except NotImplementedError:
+                pass
+            close_queue(q)
+
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        try:
+            messages = [b'a', b'', b'x' * 20000, b'bc']
+            writer._send_bytes_many(messages)
+            for message in messages:
+                self.assertEqual(reader.recv_bytes(), message)
+        finally:
+            reader.close()
+            writer.close()
+
+    @unittest.skipIf(sys.platform == 'win32',
+                     'writes to a win32 pipe are never coalesced')
+    def test_queue_feeder_coalescing_writes(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        writes = []
+        send = multiprocessing.connection.Connection._send
+        def counting_send(conn, buf):
+            writes.append(len(buf))
+            send(conn, buf)
+
+        with unittest.mock.patch.object(multiprocessing.connection.Connection,
+                                        '_send', counting_send):
+            q = self.Queue()
+            q.put_many(range(100))
+            items = []
+            while len(items) < 100:
+                items.extend(q.get_many(100, timeout=support.SHORT_TIMEOUT))
+            close_queue(q)
+        self.assertEqual(items, list(range(100)))
+        # The feeder thread found the 100 objects buffered together.
+        self.assertEqual(len(writes), 1)
+
+    def test_queue_feeder_coalescing_error(self):
+        # A failed write is reported for each object it contained.
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+        errors = []
+        reported = threading.Event()
+
+        def failing_send_bytes_many(bufs):
+            raise OSError('write failed')
+
+        class FailingQueue(multiprocessing.queues.Queue):
+            def _reset(self, after_fork=False):
+                super()._reset(after_fork=after_fork)
+                self._send_bytes_many = failing_send_bytes_many
+
+            @staticmethod
+            def _on_queue_feeder_error(e, obj):
+                errors.append((str(e), obj))
+                if len(errors) == 3:
+                    reported.set()
+
+        q = FailingQueue(ctx=multiprocessing.get_context())
+        q.put_many(['a', 'b', 'c'])
+        self.assertTrue(reported.wait(support.SHORT_TIMEOUT))
+        self.assertEqual(errors, [('write failed', 'a'),
+                                  ('write failed', 'b'),
+                                  ('write failed', 'c')])
+        try:
+            self.assertEqual(q.qsize(), 0)
+        except NotImplementedError:
+            pass
+        close_queue(q)
 #
 #
 #
@@ -4343,6 +4496,66 @@ def test_shared_memory_cleaned_after_process_termination(self):
                     "resource_tracker: There appear to be 1 leaked "
                     "shared_memory objects to clean up at shutdown", err)
 
+    @staticmethod
+    def _echo_through_queues(inqueue, outqueue):
+        # The buffers are received as memoryviews, which cannot be pickled.
+        outqueue.put([pickle.PickleBuffer(obj)
+                      if isinstance(obj, memoryview) else obj
+                      for obj in inqueue.get()])
+
+    @unittest.skipIf(os.name != "posix", "not feasible in non-posix platforms")
+    def test_shared_memory_threshold_queues(self):
+        payload = [pickle.PickleBuffer(bytearray(b'x' * 4096)),
+                   array.array('d', range(1000)),
+                   pickle.PickleBuffer(b'small')]
+        for make_queue in (self.Queue, self.JoinableQueue,
+                           multiprocessing.SimpleQueue):
+            with self.subTest(make_queue=make_queue):
+                inqueue = make_queue(shared_memory_threshold=1024)
+                outqueue = make_queue(shared_memory_threshold=1024)
+                p = self.Process(target=self._echo_through_queues,
+                                 args=(inqueue, outqueue))
+                p.daemon = True
+                p.start()
+                inqueue.put(payload)
+                buf, arr, small = outqueue.get()
+                p.join()
+                self.assertIsInstance(buf, memoryview)
+                self.assertEqual(bytes(buf), b'x' * 4096)
+                self.assertEqual(arr, payload[1])
+                self.assertEqual(bytes(small), b'small')
+
+        for threshold in (0, -1, 1.5):
+            with self.assertRaises(ValueError):
+                self.Queue(shared_memory_threshold=threshold)
+
+    @unittest.skipIf(os.name != "posix", "not feasible in non-posix platforms")
+    def test_shared_memory_threshold_unlinks_blocks(self):
+        payload = [array.array('i', range(1000)), array.array('i', range(10))]
+        data = shared_memory._dumps_shared_buffers(payload, 1024)
+        with unittest.mock.patch.object(
+                shared_memory, '_load_shared_buffers', lambda *args: args):
+            inner, blocks = pickle.loads(data)
+        self.assertEqual(len(blocks), 1)
+        name = blocks[0][0].lstrip('/')
+        # The block exists until the pickle is loaded.
+        shared_memory.SharedMemory(name).close()
+        self.assertEqual(pickle.loads(data), payload)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name)
+
+        # Without large buffers, the pickle is an ordinary one.
+        data = shared_memory._dumps_shared_buffers(payload[1], 1024)
+        self.assertEqual(pickle.loads(data), payload[1])
+
+    @unittest.skipIf(os.name != "posix", "not feasible in non-posix platforms")
+    def test_shared_memory_threshold_pool(self):
+        arrays = [array.array('i', range(n)) for n in (10, 1000, 10000)]
+        with self.Pool(2, shared_memory_threshold=1024) as pool:
+            self.assertEqual(pool.map(len, arrays), [10, 1000, 10000])
+            self.assertEqual(pool.apply(array.array, ('i', range(5000))),
+                             array.array('i', range(5000)))
+
 #
 # Test to verify that `Finalize` works.
 #
@@ -5518,6 +5731,25 @@ def test_empty(self):
 
         proc.join()
 
+    @classmethod
+    def _test_put_many(cls, queue):
+        queue.put_many(range(10))
+
+    def test_put_many_get_many(self):
+        queue = multiprocessing.SimpleQueue()
+        proc = multiprocessing.Process(target=self._test_put_many,
+                                       args=(queue,))
+        proc.daemon = True
+        proc.start()
+        proc.join()
+
+        self.assertEqual(queue.get_many(4), [0, 1, 2, 3])
+        self.assertEqual(queue.get(), 4)
+        self.assertEqual(queue.get_many(10), [5, 6, 7, 8, 9])
+        self.assertTrue(queue.empty())
+        with self.assertRaises(ValueError):
+            queue.get_many(0)
+
     def test_close(self):
         queue = multiprocessing.SimpleQueue()
         queue.close()
@@ -379,6 +379,133 @@ def test_set_debug(self):
         self.loop.set_debug(False)
         self.assertFalse(self.loop.get_debug())
 
+    def test_set_instrumentation(self):
+        self.assertIsNone(self.loop.get_instrumentation())
+        with self.assertRaisesRegex(TypeError, 'A callable object or None'):
+            self.loop.set_instrumentation('spam')
+        self.assertIsNone(self.loop.get_instrumentation())
+
+        calls = []
+        def hook(loop, stats):
+            calls.append((loop, stats))
+        self.loop.set_instrumentation(hook)
+        self.assertIs(self.loop.get_instrumentation(), hook)
+        self.loop.set_instrumentation(None)
+        self.assertIsNone(self.loop.get_instrumentation())
+        self.loop._process_events = mock.Mock()
+        self.loop._run_once()
+        self.assertEqual(calls, [])
+
+    def test__run_once_instrumentation(self):
+        calls = []
+        def hook(loop, stats):
+            calls.append((loop, stats))
+
+        def cb():
+            self.loop.call_soon(lambda: None)
+
+        self.loop._process_events = mock.Mock()
+        self.loop._selector.select.return_value = [mock.Mock()] * 3
+        h = self.loop.call_later(10.0, cb)
+        self.loop.call_later(20.0, cb).cancel()
+        self.loop.call_soon(cb)
+        self.loop.call_soon(cb).cancel()
+        self.loop.set_instrumentation(hook)
+        self.loop._run_once()
+
+        [(loop, stats)] = calls
+        self.assertIs(loop, self.loop)
+        for key in ('select_time', 'events_time', 'timers_time',
+                    'callbacks_time'):
+            self.assertGreaterEqual(stats[key], 0.0)
+        self.assertEqual(stats['timeout'], 0)
+        self.assertEqual(stats['events'], 3)
+        self.assertEqual(stats['callbacks'], 2)
+        self.assertEqual(stats['ready'], 1)
+        self.assertEqual(stats['scheduled'], 2)
+        self.assertEqual(stats['cancelled_timers'], 1)
+
+        # Cancelled timers at the head of the heap are removed.
+        h.cancel()
+        self.loop._run_once()
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[1][1]['scheduled'], 0)
+        self.assertEqual(calls[1][1]['cancelled_timers'], 0)
+
+    def test__run_once_instrumentation_error(self):
+        def hook(loop, stats):
+            1/0
+
+        self.loop._process_events = mock.Mock()
+        self.loop.call_exception_handler = mock.Mock()
+        self.loop.set_instrumentation(hook)
+        self.loop._run_once()
+        context = self.loop.call_exception_handler.call_args[0][0]
+        self.assertEqual(context['message'],
+                         'Exception in instrumentation hook')
+        self.assertIsInstance(context['exception'], ZeroDivisionError)
+
+    def test_set_timer_wheel(self):
+        self.assertIsNone(self.loop.get_timer_wheel())
+        for resolution in 0, -1, 'spam':
+            with self.assertRaises((ValueError, TypeError)):
+                self.loop.set_timer_wheel(resolution)
+        self.assertIsNone(self.loop.get_timer_wheel())
+
+        when = self.loop.time()
+        h1 = self.loop.call_at(when + 10, lambda: None)
+        h2 = self.loop.call_at(when + 20, lambda: None)
+        h3 = self.loop.call_at(when + 30, lambda: None)
+        h2.cancel()
+        self.loop.set_timer_wheel(0.01)
+        self.assertEqual(self.loop.get_timer_wheel(), 0.01)
+        self.assertEqual(self.loop._scheduled, [])
+        self.assertEqual(len(self.loop._timer_wheel), 2)
+        self.assertFalse(h2._scheduled)
+
+        # Cancelled handles are removed from the wheel at once.
+        h1.cancel()
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+        self.assertFalse(h1._scheduled)
+        self.assertEqual(self.loop._timer_cancelled_count, 0)
+
+        self.loop.set_timer_wheel(None)
+        self.assertIsNone(self.loop.get_timer_wheel())
+        self.assertEqual(self.loop._scheduled, [h3])
+        self.assertTrue(h3._scheduled)
+
+    def test__run_once_timer_wheel(self):
+        self.loop._process_events = mock.Mock()
+        self.loop.set_timer_wheel(0.5)
+        calls = []
+        when = self.loop.time()
+        for delay in 3000.0, 1.0, -1.0, 0.2, 1e7, 1.0, 1.1, 600.0:
+            self.loop.call_at(when + delay, calls.append, delay)
+        self.loop.call_at(when + 0.1, calls.append, 'cancelled').cancel()
+        self.loop.call_at(when + 1000.0, calls.append, 'cancelled').cancel()
+
+        self.loop._run_once()
+        self.assertEqual(calls, [-1.0])
+        # The timeout is never later than the next handle.
+        t = self.loop._selector.select.call_args[0][0]
+        self.assertLessEqual(t, 0.2)
+
+        with mock.patch.object(self.loop, 'time',
+                               return_value=when + 1.05):
+            self.loop._run_once()
+            self.loop._run_once()
+            t = self.loop._selector.select.call_args[0][0]
+            # Not 0.05: the difference is computed from the rounded times.
+            self.assertLessEqual(t, (when + 1.1) - (when + 1.05))
+        self.assertEqual(calls, [-1.0, 0.2, 1.0, 1.0])
+
+        with mock.patch.object(self.loop, 'time',
+                               return_value=when + 1e6):
+            self.loop._run_once()
+            self.loop._run_once()
+        self.assertEqual(calls, [-1.0, 0.2, 1.0, 1.0, 1.1, 600.0, 3000.0])
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+
     def test__run_once_schedule_handle(self):
         handle = None
         processed = False
@@ -0,0 +1,154 @@
+"""Tests for asyncio/caches.py"""
+
+import asyncio
+import inspect
+import unittest
+
+from asyncio import caches
+from unittest import mock
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class AlruCacheTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_cache(self):
+        calls = []
+
+        @asyncio.alru_cache
+        async def double(x):
+            calls.append(x)
+            await asyncio.sleep(0)
+            return x * 2
+
+        self.assertTrue(inspect.iscoroutinefunction(double))
+        self.assertEqual(await double(1), 2)
+        self.assertEqual(await double(1), 2)
+        self.assertEqual(await double(2), 4)
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(double.cache_info(), (1, 2, 128, 2))
+        self.assertEqual(double.cache_parameters(),
+                         {'maxsize': 128, 'typed': False})
+        double.cache_clear()
+        self.assertEqual(double.cache_info(), (0, 0, 128, 0))
+        self.assertEqual(await double(1), 2)
+        self.assertEqual(calls, [1, 2, 1])
+
+    async def test_coalesce_concurrent_calls(self):
+        calls = 0
+        event = asyncio.Event()
+
+        @asyncio.alru_cache(maxsize=None)
+        async def fetch(x):
+            nonlocal calls
+            calls += 1
+            await event.wait()
+            return [x]
+
+        futs = [asyncio.ensure_future(fetch(1)) for _ in range(5)]
+        await asyncio.sleep(0)
+        event.set()
+        results = await asyncio.gather(*futs)
+        self.assertEqual(calls, 1)
+        for result in results:
+            self.assertIs(result, results[0])
+        self.assertEqual(fetch.cache_info(), (4, 1, None, 1))
+
+    async def test_cancelled_caller(self):
+        event = asyncio.Event()
+
+        @asyncio.alru_cache
+        async def fetch(x):
+            await event.wait()
+            return x
+
+        first = asyncio.ensure_future(fetch(1))
+        second = asyncio.ensure_future(fetch(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        event.set()
+        self.assertEqual(await second, 1)
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        self.assertEqual(fetch.cache_info(), (1, 1, 128, 1))
+
+    async def test_exception_not_cached(self):
+        calls = 0
+
+        @asyncio.alru_cache
+        async def fail(x):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise ValueError(x)
+
+        futs = [asyncio.ensure_future(fail(1)) for _ in range(3)]
+        results = await asyncio.gather(*futs, return_exceptions=True)
+        self.assertEqual(calls, 1)
+        for exc in results:
+            self.assertIsInstance(exc, ValueError)
+        with self.assertRaises(ValueError):
+            await fail(1)
+        self.assertEqual(calls, 2)
+        self.assertEqual(fail.cache_info().currsize, 0)
+
+    async def test_maxsize(self):
+        @asyncio.alru_cache(maxsize=2)
+        async def identity(x):
+            return x
+
+        for x in [1, 2, 1, 3, 1, 2]:
+            await identity(x)
+        self.assertEqual(identity.cache_info(), (2, 4, 2, 2))
+
+        @asyncio.alru_cache(maxsize=0)
+        async def identity(x):
+            return x
+
+        await identity(1)
+        await identity(1)
+        self.assertEqual(identity.cache_info(), (0, 2, 0, 0))
+
+    async def test_typed(self):
+        @asyncio.alru_cache(typed=True)
+        async def identity(x):
+            return x
+
+        self.assertIs(type(await identity(1)), int)
+        self.assertIs(type(await identity(1.0)), float)
+        self.assertEqual(identity.cache_info().misses, 2)
+
+    async def test_ttl(self):
+        now = 0.0
+        calls = []
+
+        with mock.patch.object(caches, '_monotonic', lambda: now):
+            @asyncio.alru_cache(maxsize=None, ttl=10)
+            async def identity(x):
+                calls.append(x)
+                return x
+
+        await identity(1)
+        await asyncio.sleep(0)
+        now = 5.0
+        await identity(1)
+        await identity(2)
+        await asyncio.sleep(0)
+        self.assertEqual(identity.cache_info(), (1, 2, None, 2, 0, 0))
+        now = 10.0
+        self.assertEqual(identity.cache_info(), (1, 2, None, 1, 0, 1))
+        await identity(1)
+        self.assertEqual(calls, [1, 2, 1])
+        self.assertEqual(identity.cache_parameters(),
+                         {'maxsize': None, 'typed': False, 'ttl': 10})
+
+    def test_bad_arguments(self):
+        self.assertRaises(ValueError, asyncio.alru_cache, ttl=0)
+        self.assertRaises(TypeError, asyncio.alru_cache, 'spam')
+
+
+if __name__ == '__main__':
+    unittest.main()
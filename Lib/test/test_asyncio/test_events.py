@@ -2550,6 +2550,10 @@ def test_not_implemented(self):
             NotImplementedError, loop.default_exception_handler, f)
         self.assertRaises(
             NotImplementedError, loop.call_exception_handler, f)
+        self.assertRaises(
+            NotImplementedError, loop.get_instrumentation)
+        self.assertRaises(
+            NotImplementedError, loop.set_instrumentation, f)
         self.assertRaises(
             NotImplementedError, loop.get_debug)
         self.assertRaises(
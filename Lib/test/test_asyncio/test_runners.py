@@ -1,10 +1,16 @@
 import _thread
 import asyncio
+import contextlib
 import contextvars
+import os
 import re
 import signal
+import socket
 import threading
+import time
 import unittest
+from test import support
+from test.support import os_helper, script_helper, socket_helper
 from test.test_asyncio import utils as test_utils
 from unittest import mock
 from unittest.mock import patch
@@ -482,5 +488,169 @@ async def coro():
         runner.close()
 
 
+MULTIPROCESS_SERVER_SCRIPT = """
+import asyncio
+import os
+import sys
+
+class PidProtocol(asyncio.Protocol):
+    def connection_made(self, transport):
+        transport.write(str(os.getpid()).encode())
+        if 'keep-open' not in sys.argv:
+            transport.close()
+
+if __name__ == '__main__':
+    asyncio.run_multiprocess_server(PidProtocol, '127.0.0.1',
+                                    int(sys.argv[1]), workers=2,
+                                    shutdown_timeout=float(sys.argv[2]))
+    print('stopped')
+"""
+
+CRASHING_SERVER_SCRIPT = """
+import asyncio
+import os
+import sys
+
+class CrashingProtocol(asyncio.Protocol):
+    def connection_made(self, transport):
+        os._exit(1)
+
+if __name__ == '__main__':
+    asyncio.run_multiprocess_server(CrashingProtocol, '127.0.0.1',
+                                    int(sys.argv[1]), workers=2)
+"""
+
+
+@unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT'), 'requires SO_REUSEPORT')
+@support.requires_subprocess()
+class RunMultiprocessServerTests(unittest.TestCase):
+
+    def test_invalid_arguments(self):
+        with self.assertRaisesRegex(ValueError, 'non-zero port'):
+            asyncio.run_multiprocess_server(asyncio.Protocol, '127.0.0.1', 0)
+        with self.assertRaisesRegex(ValueError, 'workers'):
+            asyncio.run_multiprocess_server(asyncio.Protocol, '127.0.0.1',
+                                            8000, workers=0)
+        with self.assertRaises(TypeError):
+            asyncio.run_multiprocess_server(asyncio.Protocol, '127.0.0.1',
+                                            8000, reuse_port=False)
+
+    def test_address_in_use(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            sock.listen()
+            port = sock.getsockname()[1]
+            with self.assertRaisesRegex(RuntimeError,
+                                        'before it started serving'):
+                asyncio.run_multiprocess_server(asyncio.Protocol,
+                                                '127.0.0.1', port, workers=2)
+
+    def get_pid(self, port):
+        deadline = time.monotonic() + support.SHORT_TIMEOUT
+        while True:
+            try:
+                with socket.create_connection(('127.0.0.1', port)) as sock:
+                    data = sock.recv(100)
+                if data:
+                    return int(data)
+            except OSError:
+                pass
+            if time.monotonic() > deadline:
+                self.fail('the server did not start')
+            time.sleep(0.05)
+
+    def connect(self, port):
+        # Return a socket connected to the server, once it is serving.
+        deadline = time.monotonic() + support.SHORT_TIMEOUT
+        while True:
+            try:
+                sock = socket.create_connection(('127.0.0.1', port))
+            except OSError:
+                pass
+            else:
+                return sock
+            if time.monotonic() > deadline:
+                self.fail('the server did not start')
+            time.sleep(0.05)
+
+    def test_serve_restart_and_shutdown(self):
+        port = socket_helper.find_unused_port()
+        with os_helper.temp_dir() as tmpdir:
+            script = script_helper.make_script(tmpdir, 'server',
+                                               MULTIPROCESS_SERVER_SCRIPT)
+            proc = script_helper.spawn_python(script, str(port),
+                                              str(support.SHORT_TIMEOUT))
+            try:
+                pid = self.get_pid(port)
+                self.assertNotEqual(pid, proc.pid)
+                os.kill(pid, signal.SIGKILL)
+                # The dead worker is replaced and the port keeps serving.
+                for _ in range(10):
+                    self.assertNotEqual(self.get_pid(port), pid)
+                proc.send_signal(signal.SIGTERM)
+                out, _ = proc.communicate(timeout=support.SHORT_TIMEOUT)
+            except:
+                proc.terminate()
+                script_helper.kill_python(proc)
+                raise
+        self.assertEqual(proc.returncode, 0)
+        self.assertIn(b'stopped', out)
+
+    def test_shutdown_timeout(self):
+        port = socket_helper.find_unused_port()
+        with os_helper.temp_dir() as tmpdir:
+            script = script_helper.make_script(tmpdir, 'server',
+                                               MULTIPROCESS_SERVER_SCRIPT)
+            proc = script_helper.spawn_python(script, str(port), '0.5',
+                                              'keep-open')
+            try:
+                # The open connections keep both workers running after
+                # SIGTERM, until they are killed.
+                with contextlib.ExitStack() as stack:
+                    pids = set()
+                    deadline = time.monotonic() + support.SHORT_TIMEOUT
+                    while len(pids) < 2:
+                        if time.monotonic() > deadline:
+                            self.fail('no connection to the second worker')
+                        sock = stack.enter_context(self.connect(port))
+                        pids.add(int(sock.recv(100)))
+                    proc.send_signal(signal.SIGTERM)
+                    out, _ = proc.communicate(timeout=support.SHORT_TIMEOUT)
+            except:
+                proc.terminate()
+                script_helper.kill_python(proc)
+                raise
+        self.assertEqual(proc.returncode, 0, out)
+        self.assertIn(b'stopped', out)
+
+    def test_restart_limit(self):
+        port = socket_helper.find_unused_port()
+        with os_helper.temp_dir() as tmpdir:
+            script = script_helper.make_script(tmpdir, 'server',
+                                               CRASHING_SERVER_SCRIPT)
+            proc = script_helper.spawn_python(script, str(port))
+            try:
+                # Every connection kills a worker, until the server gives
+                # up restarting them.
+                deadline = time.monotonic() + support.SHORT_TIMEOUT
+                while proc.poll() is None:
+                    if time.monotonic() > deadline:
+                        self.fail('the server kept restarting the workers')
+                    try:
+                        with socket.create_connection(('127.0.0.1', port)) as sock:
+                            sock.recv(100)
+                    except OSError:
+                        pass
+                    time.sleep(0.05)
+                out, _ = proc.communicate(timeout=support.SHORT_TIMEOUT)
+            except:
+                proc.terminate()
+                script_helper.kill_python(proc)
+                raise
+        self.assertEqual(proc.returncode, 1)
+        self.assertIn(b'RuntimeError', out)
+        self.assertIn(b'2 workers were already restarted', out)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 """Tests for selector_events.py"""
 
+import array
 import collections
 import selectors
 import socket
@@ -805,6 +806,114 @@ def test_writelines_send_partial(self):
         self.assertTrue(self.sock.send.called)
         self.assertTrue(self.loop.writers)
 
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_buffered(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 2
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines([b'head', bytearray(b''), memoryview(b'body')])
+        self.assertEqual(self.sock.sendmsg.call_count, 1)
+        self.assertEqual(list_to_buffer([b'ad', b'body']), transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 6)
+
+        # While the buffer is not empty, new data waits for the write
+        # handler instead of calling sendmsg() again.
+        transport.writelines([b'', b'tail'])
+        self.assertEqual(self.sock.sendmsg.call_count, 1)
+        self.assertEqual(transport.get_write_buffer_size(), 10)
+
+        self.sock.sendmsg.return_value = 7
+        transport._write_ready()
+        self.assertEqual(list_to_buffer([b'ail']), transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 3)
+
+        self.sock.sendmsg.return_value = 3
+        transport._write_ready()
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+        self.assertFalse(self.loop.writers)
+
+        transport.writelines([b'', b''])
+        self.assertEqual(self.sock.sendmsg.call_count, 3)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_pauses_protocol(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 0
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.set_write_buffer_limits(high=6)
+        transport.writelines([b'data'])
+        self.assertFalse(self.protocol.pause_writing.called)
+        transport.writelines([b'da', b'ta'])
+        self.assertTrue(self.protocol.pause_writing.called)
+        self.assertEqual(transport.get_write_buffer_size(), 8)
+
+    @mock.patch('asyncio.selector_events.logger')
+    def test_writelines_conn_lost(self, m_log):
+        transport = self.socket_transport()
+        transport._conn_lost = 1
+        transport.writelines([b'data'])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport._conn_lost, 2)
+
+    def test_write_buffer_size(self):
+        self.sock.send.return_value = 2
+
+        transport = self.socket_transport()
+        transport.write(b'data')
+        transport.write(bytearray(b'data1'))
+        self.assertEqual(transport.get_write_buffer_size(), 7)
+        transport._write_ready()
+        self.assertEqual(transport.get_write_buffer_size(), 5)
+
+        transport._force_close(None)
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+
+    def test_write_buffer_size_bytearray(self):
+        # A buffered bytearray can be resized by the caller.
+        self.sock.send.side_effect = BlockingIOError
+        data = bytearray(b'data')
+
+        transport = self.socket_transport()
+        transport.write(data)
+        data.extend(b'more data')
+        self.assertEqual(transport.get_write_buffer_size(), 4)
+
+        data.clear()
+        self.sock.send.side_effect = None
+        self.sock.send.return_value = 4
+        transport._write_ready()
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+        self.sock.send.assert_called_with(b'data')
+
+        self.sock.send.return_value = 2
+        data[:] = b'data'
+        transport.write(data)
+        self.assertEqual(transport.get_write_buffer_size(), 2)
+        # The rest of the bytearray is a view, which locks its size.
+        with self.assertRaises(BufferError):
+            data.clear()
+
+    def test_write_buffer_size_memoryview(self):
+        # The size of views of other formats than 'B' is counted in bytes.
+        data = memoryview(array.array('i', [1, 2, 3]))
+        self.sock.send.return_value = 2
+
+        transport = self.socket_transport()
+        transport.write(data)
+        self.assertEqual(list_to_buffer([data.tobytes()[2:]]),
+                         transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), data.nbytes - 2)
+        transport.write(data)
+        self.assertEqual(transport.get_write_buffer_size(), 2 * data.nbytes - 2)
+
+        self.sock.send.return_value = data.nbytes - 2
+        transport._write_ready()
+        self.assertEqual(transport.get_write_buffer_size(), data.nbytes)
+
     @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
     def test_write_sendmsg_full(self):
         data = memoryview(b'data')
@@ -224,6 +224,96 @@ def test_read_limit(self):
         self.assertEqual(b'chunk', data)
         self.assertEqual(b'', stream._buffer)
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'line1\nline2')
+        buf = bytearray(8)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 8)
+        self.assertEqual(buf, b'line1\nli')
+        n = self.loop.run_until_complete(stream.readinto(memoryview(buf)[2:]))
+        self.assertEqual(n, 3)
+        self.assertEqual(buf, b'line2\nli')
+        self.assertEqual(b'', stream._buffer)
+
+        read_task = self.loop.create_task(stream.readinto(buf))
+        self.loop.call_soon(stream.feed_data, b'data')
+        self.assertEqual(self.loop.run_until_complete(read_task), 4)
+        self.assertEqual(buf[:4], b'data')
+
+        self.assertEqual(self.loop.run_until_complete(stream.readinto(bytearray())), 0)
+        self.assertRaises(TypeError, self.loop.run_until_complete,
+                          stream.readinto(b'data'))
+        stream.feed_eof()
+        self.assertEqual(self.loop.run_until_complete(stream.readinto(buf)), 0)
+
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.set_exception(ValueError())
+        self.assertRaises(ValueError, self.loop.run_until_complete,
+                          stream.readinto(buf))
+
+    def _buffered_stream(self, sock, **kwargs):
+        reader = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.BufferedStreamReaderProtocol(reader, loop=self.loop,
+                                                        **kwargs)
+        transport, _ = self.loop.run_until_complete(
+            self.loop.create_connection(lambda: protocol, sock=sock))
+        return reader, protocol, transport
+
+    def test_buffered_protocol(self):
+        rsock, wsock = socket.socketpair()
+        self.addCleanup(wsock.close)
+        reader, protocol, transport = self._buffered_stream(rsock,
+                                                            buffer_size=4)
+        self.assertRaises(ValueError, asyncio.BufferedStreamReaderProtocol,
+                          reader, loop=self.loop, buffer_size=0)
+
+        # Data is received directly into the buffer of readinto().
+        buf = bytearray(100)
+        with mock.patch.object(reader, 'feed_data') as feed_data:
+            read_task = self.loop.create_task(reader.readinto(buf))
+            test_utils.run_briefly(self.loop)
+            wsock.sendall(b'direct')
+            self.assertEqual(self.loop.run_until_complete(read_task), 6)
+            self.assertFalse(feed_data.called)
+        self.assertEqual(buf[:6], b'direct')
+
+        # Otherwise data goes through the reusable receive buffer.
+        wsock.sendall(b'line1\nline2\n')
+        self.assertEqual(self.loop.run_until_complete(reader.readline()),
+                         b'line1\n')
+        self.assertEqual(self.loop.run_until_complete(reader.readuntil()),
+                         b'line2\n')
+
+        wsock.sendall(b'spam')
+        wsock.close()
+        self.assertEqual(self.loop.run_until_complete(reader.read()), b'spam')
+        self.assertTrue(reader.at_eof())
+        transport.close()
+
+    def test_buffered_protocol_readinto_cancelled(self):
+        rsock, wsock = socket.socketpair()
+        self.addCleanup(wsock.close)
+        reader, protocol, transport = self._buffered_stream(rsock)
+
+        buf = bytearray(100)
+        read_task = self.loop.create_task(reader.readinto(buf))
+        test_utils.run_briefly(self.loop)
+        read_task.cancel()
+        # Data received into buf before the task sees the cancellation
+        # is not lost.
+        view = protocol.get_buffer(-1)
+        self.assertIs(view.obj, buf)
+        view[:4] = b'spam'
+        protocol.buffer_updated(4)
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(reader._buffer, b'spam')
+        wsock.sendall(b'eggs')
+        self.assertEqual(self.loop.run_until_complete(reader.readexactly(8)),
+                         b'spameggs')
+        transport.close()
+
     def test_readline(self):
         # Read one line. 'readline' will need to wait for the data
         # to come from 'cb'
@@ -8,11 +8,14 @@
 from test.support import hashlib_helper
 from test.support.script_helper import assert_python_ok
 
+import array
+import collections
 import contextlib
 import itertools
 import logging
 from logging.handlers import QueueHandler
 import os
+import pickle
 import queue
 import signal
 import sys
@@ -20,6 +23,7 @@
 import time
 import unittest
 import weakref
+from operator import add
 from pickle import PicklingError
 
 from concurrent import futures
@@ -66,6 +70,10 @@ def sleep_and_raise(t):
     time.sleep(t)
     raise Exception('this is an exception')
 
+def sleep_and_return(t):
+    time.sleep(t)
+    return t
+
 def sleep_and_print(t, msg):
     time.sleep(t)
     print(msg)
@@ -873,6 +881,75 @@ def test_map_timeout(self):
 
         self.assertEqual([None, None], results)
 
+    def test_map_buffersize_type_validation(self):
+        for buffersize in ("foo", 2.0):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    TypeError,
+                    "buffersize must be an integer or None",
+                ):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+    def test_map_buffersize_value_validation(self):
+        for buffersize in (0, -1):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaisesRegex(
+                    ValueError,
+                    r"buffersize must be None or > 0",
+                ):
+                    self.executor.map(str, range(4), buffersize=buffersize)
+
+    def test_map_buffersize(self):
+        ints = range(4)
+        for buffersize in (1, 2, len(ints), len(ints) * 2):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(str, ints, buffersize=buffersize)
+                self.assertListEqual(list(res), ["0", "1", "2", "3"])
+
+    def test_map_buffersize_on_multiple_iterables(self):
+        ints = range(4)
+        for buffersize in (1, 2, len(ints), len(ints) * 2):
+            with self.subTest(buffersize=buffersize):
+                res = self.executor.map(add, ints, ints, buffersize=buffersize)
+                self.assertListEqual(list(res), [0, 2, 4, 6])
+
+    def test_map_buffersize_on_infinite_iterable(self):
+        res = self.executor.map(str, itertools.count(), buffersize=2)
+        self.assertEqual(next(res, None), "0")
+        self.assertEqual(next(res, None), "1")
+        self.assertEqual(next(res, None), "2")
+
+    def test_map_buffersize_on_multiple_infinite_iterables(self):
+        res = self.executor.map(
+            add,
+            itertools.count(),
+            itertools.count(),
+            buffersize=2
+        )
+        self.assertEqual(next(res, None), 0)
+        self.assertEqual(next(res, None), 2)
+        self.assertEqual(next(res, None), 4)
+
+    def test_map_buffersize_on_empty_iterable(self):
+        res = self.executor.map(str, [], buffersize=2)
+        self.assertIsNone(next(res, None))
+
+    def test_map_buffersize_without_iteration(self):
+        it = iter(range(4))
+        self.executor.map(str, it, buffersize=2)
+        self.assertEqual(next(it), 2)
+
+    def test_map_buffersize_when_buffer_is_full(self):
+        ints = iter(range(4))
+        buffersize = 2
+        self.executor.map(str, ints, buffersize=buffersize)
+        self.executor.shutdown(wait=True)  # wait for tasks to complete
+        self.assertEqual(
+            next(ints),
+            buffersize,
+            msg="should have fetched only `buffersize` elements from `ints`.",
+        )
+
     def test_shutdown_race_issue12456(self):
         # Issue #12456: race condition at shutdown where trying to post a
         # sentinel in the call queue blocks (the queue is full while processes
@@ -991,6 +1068,87 @@ def log_n_wait(ident):
         # ident='third' is cancelled because it remained in the collection of futures
         self.assertListEqual(log, ["ident='first' started", "ident='first' stopped"])
 
+    def test_idle_timeout(self):
+        executor = self.executor_type(4, idle_timeout=0.1)
+        self.addCleanup(executor.shutdown)
+        barrier = threading.Barrier(4)
+        fs = [executor.submit(barrier.wait) for _ in range(4)]
+        futures.wait(fs)
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT,
+                                        "idle threads did not exit"):
+            if not executor._threads:
+                break
+        stats = executor.stats()
+        self.assertEqual(stats['threads'], 0)
+        self.assertEqual(stats['threads_retired'], 4)
+
+        # New threads are started for new work.
+        self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+        self.assertEqual(len(executor._threads), 1)
+
+        for idle_timeout in (0, -1):
+            with self.assertRaises(ValueError):
+                self.executor_type(idle_timeout=idle_timeout)
+
+    def test_work_stealing(self):
+        executor = self.executor_type(3, work_stealing=True)
+        self.addCleanup(executor.shutdown)
+
+        def fork_join(n):
+            # The subtasks are pushed to the local queue of the thread,
+            # which is busy waiting: the other threads must steal them.
+            fs = [executor.submit(mul, i, 2) for i in range(n)]
+            return [f.result() for f in fs]
+
+        self.assertEqual(executor.submit(fork_join, 10).result(),
+                         list(range(0, 20, 2)))
+        stats = executor.stats()
+        self.assertEqual(stats['steals'], 10)
+        self.assertEqual(len(stats['local_queue_depths']), 3)
+
+    def test_work_stealing_shutdown(self):
+        # The items left in local queues are run before shutdown() returns.
+        executor = self.executor_type(2, work_stealing=True)
+        submitted = threading.Event()
+        event = threading.Event()
+        subtasks = []
+
+        def task():
+            subtasks.extend(executor.submit(mul, i, 2) for i in range(5))
+            submitted.set()
+            event.wait()
+
+        f = executor.submit(task)
+        submitted.wait()
+        executor.shutdown(wait=False)
+        event.set()
+        executor.shutdown(wait=True)
+        f.result()
+        self.assertEqual([f.result() for f in subtasks], list(range(0, 10, 2)))
+
+    def test_stats(self):
+        executor = self.executor_type(1)
+        self.addCleanup(executor.shutdown)
+        event = threading.Event()
+        self.addCleanup(event.set)
+        executor.submit(event.wait)
+        fs = [executor.submit(mul, i, 2) for i in range(3)]
+        stats = executor.stats()
+        self.assertEqual(stats['threads'], 1)
+        self.assertEqual(stats['idle_threads'], 0)
+        self.assertGreaterEqual(stats['queue_depth'], 3)
+        self.assertEqual(stats['local_queue_depths'], [])
+        self.assertEqual(stats['steals'], 0)
+        self.assertEqual(stats['threads_retired'], 0)
+        event.set()
+        futures.wait(fs)
+        self.assertEqual(executor.stats()['queue_depth'], 0)
+
+
+class ThreadPoolWorkStealingExecutorTest(ThreadPoolMixin, ExecutorTest,
+                                         BaseTestCase):
+    executor_kwargs = dict(work_stealing=True)
+
 
 class ProcessPoolExecutorTest(ExecutorTest):
 
@@ -1084,6 +1242,83 @@ def test_saturation(self):
         for _ in range(job_count):
             sem.release()
 
+    def test_map_unordered(self):
+        ref = list(map(pow, range(40), range(40)))
+        for chunksize in (1, 6, 50):
+            with self.subTest(chunksize=chunksize):
+                res = self.executor.map_unordered(pow, range(40), range(40),
+                                                  chunksize=chunksize)
+                self.assertCountEqual(list(res), ref)
+        with self.assertRaises(ValueError):
+            self.executor.map_unordered(pow, range(4), range(4), chunksize=0)
+
+    def test_map_unordered_completion_order(self):
+        res = self.executor.map_unordered(sleep_and_return, [1.0, 0, 0, 0])
+        self.assertEqual(list(res), [0, 0, 0, 1.0])
+
+    def test_map_unordered_exception(self):
+        res = self.executor.map_unordered(divmod, [1, 1, 1, 1], [2, 3, 0, 5])
+        with self.assertRaises(ZeroDivisionError):
+            list(res)
+
+    def test_map_unordered_timeout(self):
+        results = []
+        with self.assertRaises(futures.TimeoutError):
+            for i in self.executor.map_unordered(time.sleep, [0, 0, 6],
+                                                 timeout=5):
+                results.append(i)
+        self.assertEqual([None, None], results)
+
+    def test_map_unordered_buffersize(self):
+        for buffersize in ("foo", 2.0):
+            with self.subTest(buffersize=buffersize):
+                with self.assertRaises(TypeError):
+                    self.executor.map_unordered(str, range(4),
+                                                buffersize=buffersize)
+        with self.assertRaises(ValueError):
+            self.executor.map_unordered(str, range(4), buffersize=0)
+
+        res = self.executor.map_unordered(str, itertools.count(),
+                                          chunksize=3, buffersize=2)
+        values = [int(next(res)) for _ in range(6)]
+        self.assertEqual(len(set(values)), 6)
+        # Only one more chunk is submitted per completed chunk.
+        self.assertLess(max(values), 12)
+
+        ints = iter(range(40))
+        self.executor.map_unordered(str, ints, chunksize=3, buffersize=2)
+        self.assertEqual(next(ints), 6)
+
+    def test_stats(self):
+        self.assertEqual(self.executor.stats(), {
+            'tasks_done': {},
+            'bytes_sent': 0,
+            'bytes_received': 0,
+            'run_time': 0.0,
+            'wait_time': 0.0,
+            'worker_restarts': 0,
+        })
+        list(self.executor.map(sleep_and_return, [0.1] * 10, chunksize=2))
+        self.executor.shutdown()
+        stats = self.executor.stats()
+        self.assertEqual(sum(stats['tasks_done'].values()), 5)
+        self.assertLessEqual(len(stats['tasks_done']), self.worker_count)
+        self.assertGreater(stats['bytes_sent'], 0)
+        self.assertGreater(stats['bytes_received'], 0)
+        self.assertGreaterEqual(stats['run_time'], 0.9)
+        self.assertGreaterEqual(stats['wait_time'], 0.0)
+        self.assertEqual(stats['worker_restarts'], 0)
+
+    def test_stats_unpickled_call_queue(self):
+        # With the spawn and forkserver start methods, the workers unpickle
+        # the call queue without the counters of the executor.
+        executor = self.executor_type(1, mp_context=self.get_context())
+        self.assertEqual(executor.submit(abs, -3).result(), 3)
+        executor.shutdown()
+        stats = executor.stats()
+        self.assertEqual(sum(stats['tasks_done'].values()), 1)
+        self.assertGreater(stats['bytes_sent'], 0)
+
     def test_idle_process_reuse_one(self):
         executor = self.executor
         assert executor._max_workers >= 4
@@ -1136,6 +1371,33 @@ def test_max_tasks_per_child(self):
 
         executor.shutdown()
 
+    def test_stats_worker_restarts(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            raise unittest.SkipTest("Incompatible with the fork start method.")
+        executor = self.executor_type(
+                1, mp_context=context, max_tasks_per_child=2)
+        pids = [executor.submit(os.getpid).result() for _ in range(5)]
+        executor.shutdown()
+        stats = executor.stats()
+        self.assertEqual(stats['worker_restarts'], 2)
+        self.assertEqual(stats['tasks_done'], collections.Counter(pids))
+
+    @unittest.skipIf(os.name != "posix", "not feasible in non-posix platforms")
+    def test_shared_memory_threshold(self):
+        executor = self.executor_type(
+                2, mp_context=self.get_context(), shared_memory_threshold=1024)
+        self.addCleanup(executor.shutdown)
+        data = array.array('d', range(10000))
+        self.assertEqual(executor.submit(len, data).result(), 10000)
+        self.assertEqual(executor.submit(array.array, 'i', range(5000)).result(),
+                         array.array('i', range(5000)))
+        view = executor.submit(pickle.PickleBuffer, bytearray(4096)).result()
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(bytes(view), bytes(4096))
+        # Only the names of the shared memory blocks were pickled.
+        self.assertLess(executor.stats()['bytes_sent'], 10000)
+
     def test_max_tasks_per_child_defaults_to_spawn_context(self):
         # not using self.executor as we need to control construction.
         # arguably this could go in another class w/o that mixin.
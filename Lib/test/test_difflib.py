@@ -547,6 +547,130 @@ def test_longest_match_with_popular_chars(self):
         self.assertFalse(self.longer_match_exists(a, b, match.size))
 
 
+class TestPatience(unittest.TestCase):
+    def check_opcodes(self, a, b, opcodes):
+        # The opcodes must turn a into b.
+        result = []
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag == 'equal':
+                self.assertEqual(a[i1:i2], b[j1:j2])
+            result.extend(b[j1:j2])
+        self.assertEqual(result, list(b))
+
+    def test_unique_anchors(self):
+        # The default algorithm syncs up on the longest block of braces,
+        # patience on the unique function names.
+        a = ['def f():\n', '{\n', '}\n', '{\n', '}\n', 'def g():\n',
+             '{\n', '}\n']
+        b = ['def g():\n', '{\n', '}\n', '{\n', '}\n']
+        sm = difflib.SequenceMatcher(None, a, b)
+        self.assertEqual(sm.get_opcodes(),
+            [   ('replace', 0, 1, 0, 1),
+                ('equal', 1, 5, 1, 5),
+                ('delete', 5, 8, 5, 5)])
+        sm = difflib.SequenceMatcher(None, a, b, algorithm='patience')
+        self.assertEqual(sm.get_opcodes(),
+            [   ('delete', 0, 5, 0, 0),
+                ('equal', 5, 6, 0, 1),
+                ('insert', 6, 6, 1, 3),
+                ('equal', 6, 8, 3, 5)])
+        self.check_opcodes(a, b, sm.get_opcodes())
+
+    def test_fallback(self):
+        # Without unique elements, the default algorithm is used.
+        a = 'abab' * 5
+        b = 'baba' * 5
+        sm = difflib.SequenceMatcher(None, a, b, algorithm='patience')
+        self.assertEqual(sm.get_opcodes(),
+                         difflib.SequenceMatcher(None, a, b).get_opcodes())
+
+    def test_random(self):
+        import random
+        rand = random.Random(42)
+        for _ in range(200):
+            a = [rand.choice('abcdefgh') for _ in range(rand.randrange(30))]
+            b = [rand.choice('abcdefgh') for _ in range(rand.randrange(30))]
+            sm = difflib.SequenceMatcher(None, a, b, algorithm='patience')
+            self.check_opcodes(a, b, sm.get_opcodes())
+            blocks = sm.get_matching_blocks()
+            self.assertEqual(blocks[-1], (len(a), len(b), 0))
+            for x, y in zip(blocks, blocks[1:]):
+                self.assertLessEqual(x.a + x.size, y.a)
+                self.assertLessEqual(x.b + x.size, y.b)
+                if y.size:
+                    # Adjacent blocks are collapsed.
+                    self.assertNotEqual((x.a + x.size, x.b + x.size),
+                                        (y.a, y.b))
+
+    def test_reuse_b_index(self):
+        b = ['line %d\n' % i for i in range(1000)]
+        sm = difflib.SequenceMatcher(None, b=b, algorithm='patience')
+        b2j = sm.b2j
+        for i in range(0, 1000, 100):
+            a = b[:i] + ['new\n'] + b[i+1:]
+            sm.set_seq1(a)
+            self.assertIs(sm.b2j, b2j)
+            self.assertEqual(sm.get_opcodes(),
+                [   ('equal', 0, i, 0, i),
+                    ('replace', i, i+1, i, i+1),
+                    ('equal', i+1, 1000, i+1, 1000)][i == 0:])
+
+    def test_diff_functions(self):
+        a = ['one\n', 'two\n', 'three\n', 'four\n']
+        b = ['zero\n', 'one\n', 'tree\n', 'four\n']
+        for func in difflib.unified_diff, difflib.context_diff, difflib.ndiff:
+            with self.subTest(func=func):
+                self.assertEqual(list(func(a, b, algorithm='patience')),
+                                 list(func(a, b)))
+        self.assertEqual(list(difflib.Differ(algorithm='patience')
+                              .compare(a, b)),
+                         list(difflib.ndiff(a, b)))
+
+    def test_invalid_algorithm(self):
+        with self.assertRaises(ValueError):
+            difflib.SequenceMatcher(None, 'a', 'b', algorithm='myers')
+        with self.assertRaises(ValueError):
+            difflib.Differ(algorithm='myers')
+        with self.assertRaises(ValueError):
+            list(difflib.unified_diff(['a'], ['b'], algorithm='myers'))
+
+
+class TestCloseMatchIndex(unittest.TestCase):
+    def test_same_as_get_close_matches(self):
+        import random
+        rand = random.Random(7)
+        possibilities = [''.join(rand.choice('abcde')
+                                 for _ in range(rand.randrange(12)))
+                         for _ in range(500)]
+        index = difflib.CloseMatchIndex(possibilities)
+        self.assertEqual(len(index), 500)
+        words = ['', 'a', 'abc', 'eeee', 'abcdeabcde'] + possibilities[:20]
+        for word in words:
+            for n in 1, 3, 10:
+                for cutoff in 0.0, 0.3, 0.6, 0.9, 1.0:
+                    with self.subTest(word=word, n=n, cutoff=cutoff):
+                        self.assertEqual(
+                            index.get_close_matches(word, n, cutoff),
+                            difflib.get_close_matches(word, possibilities,
+                                                      n, cutoff))
+
+    def test_sequences(self):
+        possibilities = [(1, 2, 3), (1, 2), (3, 2, 1), (4, 5, 6, 1, 2, 3)]
+        index = difflib.CloseMatchIndex(possibilities)
+        self.assertEqual(index.get_close_matches((1, 2, 4), 4, 0.5),
+                         difflib.get_close_matches((1, 2, 4), possibilities,
+                                                   4, 0.5))
+
+    def test_bad_args(self):
+        index = difflib.CloseMatchIndex(['spam', 'eggs'])
+        with self.assertRaises(ValueError):
+            index.get_close_matches('spam', n=0)
+        with self.assertRaises(ValueError):
+            index.get_close_matches('spam', cutoff=1.1)
+        self.assertEqual(difflib.CloseMatchIndex([]).get_close_matches('a'),
+                         [])
+
+
 def setUpModule():
     difflib.HtmlDiff._default_prefix = 0
 
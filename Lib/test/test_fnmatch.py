@@ -5,7 +5,7 @@
 import string
 import warnings
 
-from fnmatch import fnmatch, fnmatchcase, translate, filter
+from fnmatch import fnmatch, fnmatchcase, translate, filter, compile_many
 
 class FnmatchTestCase(unittest.TestCase):
 
@@ -261,6 +261,8 @@ def test_filter(self):
     def test_mix_bytes_str(self):
         self.assertRaises(TypeError, filter, ['test'], b'*')
         self.assertRaises(TypeError, filter, [b'test'], '*')
+        self.assertRaises(TypeError, filter, ['test'], b'test')
+        self.assertRaises(TypeError, filter, [b'test'], 'test')
 
     def test_case(self):
         ignorecase = os.path.normcase('P') == os.path.normcase('p')
@@ -277,5 +279,62 @@ def test_sep(self):
                          ['usr/bin', 'usr\\lib'] if normsep else ['usr\\lib'])
 
 
+class CompileManyTestCase(unittest.TestCase):
+
+    names = ['abc', 'abd', 'a.py', 'b.pyc', 'setup.py', 'test_x', 'test',
+             'foo\nbar', '\n', '', 'Makefile', 'README.rst', '[x]']
+    patterns = ['abc', '*.py', 'test*', 'a?d', '[!a-z]*', 'M*e', '*',
+                '', 'foo*', '*bar', '[[]x]', 'x*y*z', '*.p?']
+
+    def check(self, patterns):
+        match = compile_many(patterns)
+        for name in self.names:
+            expected = any(fnmatchcase(name, pat) for pat in patterns)
+            self.assertIs(match(name), expected,
+                          "%r matching %r" % (name, patterns))
+
+    def test_single(self):
+        for pat in self.patterns:
+            self.check([pat])
+
+    def test_combined(self):
+        self.check([])
+        self.check(['abc', 'test'])
+        self.check(['*.py', '*.rst'])
+        self.check(['test*', 'setup*'])
+        self.check(['abc', '*.py', 'test*', 'a?d'])
+        self.check(self.patterns)
+
+    def test_iterable(self):
+        match = compile_many(pat for pat in ['abc', '*.py'])
+        self.assertTrue(match('abc'))
+        self.assertTrue(match('a.py'))
+        self.assertFalse(match('abd'))
+
+    def test_bytes(self):
+        match = compile_many([b'abc', b'*.py', b'te*', b'x?\xff'])
+        self.assertTrue(match(b'abc'))
+        self.assertTrue(match(b'a.py'))
+        self.assertTrue(match(b'test'))
+        self.assertTrue(match(b'xy\xff'))
+        self.assertFalse(match(b'ab'))
+        self.assertFalse(match(b'xy'))
+
+    def test_mix_bytes_str(self):
+        self.assertRaises(TypeError, compile_many, ['*', b'*'])
+        self.assertRaises(TypeError, compile_many, [b'a', 'b'])
+        self.assertRaises(TypeError, compile_many(['*.py']), b'a.py')
+        self.assertRaises(TypeError, compile_many([b'a?c']), 'abc')
+        self.assertRaises(TypeError, compile_many(['abc']), b'abc')
+        self.assertRaises(TypeError, compile_many([b'abc']), 'abc')
+        self.assertRaises(TypeError, compile_many(['abc', 'x*']), b'abc')
+        self.assertRaises(TypeError, compile_many(['*.py']), None)
+
+    def test_bytes_like(self):
+        self.assertTrue(compile_many([b'abc'])(bytearray(b'abc')))
+        self.assertTrue(compile_many([b'*.py'])(memoryview(b'a.py')))
+        self.assertFalse(compile_many([b'abc', b'x*'])(bytearray(b'ab')))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1831,6 +1831,95 @@ def f():
             return 1
         self.assertEqual(f.cache_parameters(), {'maxsize': 1000, "typed": True})
 
+    def test_lru_cache_policy_parameters(self):
+        @self.module.lru_cache(maxsize=2, ttl=5)
+        def f():
+            return 1
+        self.assertEqual(f.cache_parameters(),
+                         {'maxsize': 2, 'typed': False, 'ttl': 5,
+                          'weigher': None})
+        self.assertEqual(f.cache_info(), (0, 0, 2, 0, 0, 0))
+        self.assertRaises(ValueError, self.module.lru_cache, ttl=0)
+        self.assertRaises(ValueError, self.module.lru_cache, ttl=-1)
+        self.assertRaises(TypeError, self.module.lru_cache, weigher=1)
+
+    def test_lru_cache_ttl(self):
+        now = 0.0
+        calls = []
+        def orig(x):
+            calls.append(x)
+            return x * 2
+        with unittest.mock.patch.object(self.module, '_monotonic',
+                                        lambda: now):
+            f = self.module.lru_cache(maxsize=None, ttl=10)(orig)
+        self.assertEqual(f(1), 2)
+        now = 5.0
+        self.assertEqual(f(2), 4)
+        self.assertEqual(f(1), 2)
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(f.cache_info(), (1, 2, None, 2, 0, 0))
+        now = 10.0
+        self.assertEqual(f.cache_info(), (1, 2, None, 1, 0, 1))
+        self.assertEqual(f(1), 2)
+        self.assertEqual(f(2), 4)
+        self.assertEqual(calls, [1, 2, 1])
+        now = 15.0
+        hits, misses, maxsize, currsize, evictions, expirations = f.cache_info()
+        self.assertEqual((currsize, expirations), (1, 2))
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), (0, 0, None, 0, 0, 0))
+
+    def test_lru_cache_weigher(self):
+        f = self.module.lru_cache(maxsize=10, weigher=len)(lambda n: 'x' * n)
+        f(4)
+        f(3)
+        self.assertEqual(f.cache_info(), (0, 2, 10, 7, 0, 0))
+        f(4)
+        f(5)  # evicts f(3), the least recently used
+        self.assertEqual(f.cache_info(), (1, 3, 10, 9, 1, 0))
+        f(4)
+        f(3)  # evicts f(5)
+        self.assertEqual(f.cache_info(), (2, 4, 10, 7, 2, 0))
+        f(11)  # too heavy to be cached
+        self.assertEqual(f.cache_info(), (2, 5, 10, 7, 2, 0))
+        f(0)
+        self.assertEqual(f.cache_info(), (2, 6, 10, 7, 2, 0))
+        f(0)
+        self.assertEqual(f.cache_info().hits, 3)
+
+        g = self.module.lru_cache(maxsize=10, weigher=lambda r: -1)(len)
+        self.assertRaises(ValueError, g, 'x')
+
+    def test_lru_cache_ttl_and_maxsize(self):
+        now = 0.0
+        with unittest.mock.patch.object(self.module, '_monotonic',
+                                        lambda: now):
+            f = self.module.lru_cache(maxsize=2, ttl=10)(lambda x: [x])
+        a = f(1)
+        now = 1.0
+        f(2)
+        self.assertIs(f(1), a)
+        f(3)  # evicts f(2)
+        self.assertEqual(f.cache_info(), (1, 3, 2, 2, 1, 0))
+        now = 10.5
+        self.assertIsNot(f(1), a)  # expired
+        self.assertEqual(f.cache_info(), (1, 4, 2, 2, 1, 1))
+
+    @threading_helper.requires_working_threading()
+    def test_lru_cache_weigher_threaded(self):
+        f = self.module.lru_cache(maxsize=50, weigher=len)(lambda n: 'x' * n)
+        start = threading.Event()
+        def run(k):
+            start.wait(10)
+            for i in range(200):
+                self.assertEqual(f((i * k) % 17), 'x' * ((i * k) % 17))
+        threads = [threading.Thread(target=run, args=[k]) for k in range(1, 6)]
+        with threading_helper.start_threads(threads):
+            start.set()
+        hits, misses, maxsize, currsize, evictions, expirations = f.cache_info()
+        self.assertEqual(hits + misses, 1000)
+        self.assertLessEqual(currsize, 50)
+
     def test_lru_cache_weakrefable(self):
         @self.module.lru_cache
         def test_function(x):
@@ -2319,7 +2408,13 @@ def clear(self):
                 self.data.clear()
 
         td = TracingDict()
-        with support.swap_attr(weakref, "WeakKeyDictionary", lambda: td):
+        # The first WeakKeyDictionary created is the dispatch cache.
+        dicts = [td]
+        real_weak_key_dictionary = weakref.WeakKeyDictionary
+        def weak_key_dictionary():
+            return dicts.pop() if dicts else real_weak_key_dictionary()
+        with support.swap_attr(weakref, "WeakKeyDictionary",
+                               weak_key_dictionary):
             c = collections.abc
             @functools.singledispatch
             def g(arg):
@@ -2385,10 +2480,18 @@ class X:
             self.assertEqual(td.get_ops, [list, dict, dict, list, list, dict,
                                           list, dict])
             self.assertEqual(td.set_ops, [dict, list, dict, list, dict, list])
+            stats = g.dispatch_stats()
             c.MutableSet.register(X)       # Will invalidate the cache.
             self.assertEqual(len(td), 2)   # Stale cache.
             self.assertEqual(g(l), "list")
             self.assertEqual(len(td), 1)
+            # Registering X did not change which ABCs list and dict are
+            # subclasses of, so the cached implementations were kept.
+            self.assertEqual(g(d), "sized")
+            self.assertEqual(len(td), 2)
+            self.assertEqual(g.dispatch_stats().misses, stats.misses)
+            self.assertEqual(g.dispatch_stats().revalidations,
+                             stats.revalidations + 2)
             g.register(c.MutableMapping, lambda arg: "mutablemapping")
             self.assertEqual(len(td), 0)
             self.assertEqual(g(d), "mutablemapping")
@@ -2401,6 +2504,109 @@ class X:
             g._clear_cache()
             self.assertEqual(len(td), 0)
 
+    def test_dispatch_stats(self):
+        @functools.singledispatch
+        def g(arg):
+            return "base"
+        g.register(int, lambda arg: "int")
+        self.assertEqual(g.dispatch_stats(), (0, 0, 0, 0))
+        self.assertEqual(g(1), "int")
+        self.assertEqual(g(2), "int")
+        self.assertEqual(g("x"), "base")
+        self.assertEqual(g(3), "int")
+        self.assertEqual(g.dispatch_stats(), (2, 0, 0, 2))
+        g.register(str, lambda arg: "str")
+        self.assertEqual(g.dispatch_stats().currsize, 0)
+        self.assertEqual(g("x"), "str")
+
+    def test_abc_registration_invalidation(self):
+        c = collections.abc
+        class Base:
+            pass
+        class Child(Base):
+            pass
+        class Unrelated:
+            pass
+        class MyABC(abc.ABC):
+            pass
+        @functools.singledispatch
+        def g(arg):
+            return "base"
+        g.register(c.Sized, lambda arg: "sized")
+        g.register(MyABC, lambda arg: "myabc")
+        self.assertEqual(g(Child()), "base")
+        self.assertEqual(g([]), "sized")
+        stats = g.dispatch_stats()
+        # Unrelated to the classes dispatched on: entries are kept.
+        c.Sized.register(Unrelated)
+        self.assertEqual(g(Child()), "base")
+        self.assertEqual(g([]), "sized")
+        self.assertEqual(g.dispatch_stats().misses, stats.misses)
+        self.assertEqual(g.dispatch_stats().revalidations,
+                         stats.revalidations + 2)
+        # A base class becoming a virtual subclass of a registered ABC.
+        MyABC.register(Base)
+        self.assertEqual(g(Child()), "myabc")
+        self.assertEqual(g([]), "sized")
+        self.assertEqual(g.dispatch_stats().invalidations,
+                         stats.invalidations + 1)
+        self.assertEqual(g.dispatch_stats().misses, stats.misses + 1)
+
+    def test_abc_registration_ambiguous(self):
+        c = collections.abc
+        class P:
+            pass
+        c.Container.register(P)
+        c.Sized.register(P)
+        @functools.singledispatch
+        def g(arg):
+            return "base"
+        g.register(c.Container, lambda arg: "container")
+        g.register(c.Sized, lambda arg: "sized")
+        with self.assertRaises(RuntimeError):
+            g(P())
+        class Q:
+            def __len__(self):
+                return 0
+        self.assertEqual(g(Q()), "sized")
+        c.Container.register(Q)
+        with self.assertRaises(RuntimeError):
+            g(Q())
+
+    def test_cache_does_not_keep_class_alive(self):
+        @functools.singledispatch
+        def g(arg):
+            return "base"
+        class A:
+            pass
+        self.assertEqual(g(A()), "base")
+        ref = weakref.ref(A)
+        del A
+        support.gc_collect()
+        self.assertIsNone(ref())
+        self.assertEqual(g(1), "base")
+
+    def test_method_get_does_not_rewrap(self):
+        class A:
+            @functools.singledispatchmethod
+            def t(self, arg):
+                "Docstring"
+                return "base"
+            @t.register(int)
+            def _(self, arg):
+                return "int"
+        a = A()
+        with unittest.mock.patch.object(functools, 'update_wrapper') as m:
+            self.assertEqual(a.t(1), "int")
+            self.assertEqual(a.t(""), "base")
+        m.assert_not_called()
+        self.assertEqual(a.t.__name__, 't')
+        self.assertEqual(a.t.__qualname__, A.t.__qualname__)
+        self.assertEqual(a.t.__doc__, 'Docstring')
+        self.assertEqual(A.t.__module__, __name__)
+        self.assertIs(a.t.__wrapped__, A.__dict__['t'].func)
+        self.assertRaises(AttributeError, getattr, a.t, '_spam')
+
     def test_annotations(self):
         @functools.singledispatch
         def i(arg):
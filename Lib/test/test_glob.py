@@ -3,6 +3,7 @@
 import shutil
 import sys
 import unittest
+import unittest.mock
 
 from test.support.os_helper import (TESTFN, skip_unless_symlink,
                                     can_symlink, create_empty_file, change_cwd)
@@ -332,6 +333,52 @@ def test_recursive_glob(self):
             eq(glob.glob('**', recursive=True, include_hidden=True),
                [join(*i) for i in full+rec])
 
+    def test_recursive_glob_several_segments(self):
+        eq = self.assertSequencesEqual_noorder
+        eq(self.rglob('**', 'bcd', '**', '*'), self.joins(
+            ('a', 'bcd', 'EF'), ('a', 'bcd', 'efg'),
+            ('a', 'bcd', 'efg', 'ha')))
+        eq(self.rglob('**', 'bcd', '**', ''), self.joins(
+            ('a', 'bcd', ''), ('a', 'bcd', 'efg', '')))
+        eq(self.rglob('**', 'a*', '**', '*F'), self.joins(
+            ('a', 'bcd', 'EF'), ('aaa', 'zzzF'), ('aab', 'F')))
+        eq(self.rglob('**', '**', 'efg', '*'), self.joins(
+            ('a', 'bcd', 'efg', 'ha')) + (
+            self.joins(('sym3', 'efg', 'ha')) if can_symlink() else []))
+        eq(self.rglob('a', '**', 'efg', '**'), self.joins(
+            ('a', 'bcd', 'efg', ''), ('a', 'bcd', 'efg', 'ha')))
+        eq(self.rglob('**', 'G'), [])
+        eq(self.rglob('**', 'G', include_hidden=True),
+           self.joins(('.aa', 'G')))
+
+    def test_recursive_glob_matches_once(self):
+        # Paths matching the pattern in several ways are only returned once.
+        expect = [('a', 'bcd', 'EF'), ('aaa', 'zzzF'), ('aab', 'F'), ('EF',)]
+        if can_symlink():
+            expect += [('sym3', 'EF')]
+        self.assertSequencesEqual_noorder(self.rglob('**', '**', '*F'),
+                                          self.joins(*expect))
+        with change_cwd(self.tempdir):
+            res = glob.glob(os.path.join('**', '*', '**', 'ha'),
+                            recursive=True)
+        expect = [os.path.join('a', 'bcd', 'efg', 'ha')]
+        if can_symlink():
+            expect += [os.path.join('sym3', 'efg', 'ha')]
+        self.assertSequencesEqual_noorder(res, expect)
+
+    def test_recursive_glob_scans_once(self):
+        scanned = []
+        real_scandir = os.scandir
+        def scandir(path):
+            scanned.append(path)
+            return real_scandir(path)
+        with change_cwd(self.tempdir):
+            with unittest.mock.patch('os.scandir', scandir):
+                res = glob.glob(os.path.join('**', 'a*', '**', '*'),
+                                recursive=True)
+        self.assertIn(os.path.join('a', 'bcd', 'efg', 'ha'), res)
+        self.assertEqual(len(scanned), len(set(scanned)))
+
     def test_glob_many_open_files(self):
         depth = 30
         base = os.path.join(self.tempdir, 'deep')
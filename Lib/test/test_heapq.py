@@ -223,6 +223,86 @@ class Int(int):
         result = [i.pair for i in self.module.merge(*inputs)]
         self.assertEqual(result, sorted(result))
 
+    def test_merge_batch(self):
+        inputs = []
+        for i in range(random.randrange(25)):
+            row = []
+            for j in range(random.randrange(100)):
+                tup = random.choice('ABC'), random.randrange(-50, 50)
+                row.append(tup)
+            inputs.append(row)
+        # Long runs from the same input.
+        inputs.append([('B', i) for i in range(200)])
+        inputs.append([('C', i) for i in range(-100, 100, 3)])
+
+        for key in [None, itemgetter(0), itemgetter(1), itemgetter(1, 0)]:
+            for reverse in [False, True]:
+                seqs = []
+                for seq in inputs:
+                    seqs.append(sorted(seq, key=key, reverse=reverse))
+                expected = list(self.module.merge(*seqs, key=key,
+                                                  reverse=reverse))
+                for batch in [1, 2, 7, 1000]:
+                    with self.subTest(key=key, reverse=reverse, batch=batch):
+                        self.assertEqual(
+                            list(self.module.merge(*map(iter, seqs), key=key,
+                                                   reverse=reverse,
+                                                   batch=batch)),
+                            expected)
+        self.assertEqual(list(self.module.merge(batch=10)), [])
+        self.assertEqual(list(self.module.merge([], [1], batch=10)), [1])
+        self.assertRaises(ValueError, list, self.module.merge([1], batch=0))
+        self.assertRaises(TypeError, list, self.module.merge([1], batch=1.5))
+
+    def test_merge_batch_stability(self):
+        class Int(int):
+            pass
+        inputs = [[], [], [], []]
+        for i in range(20000):
+            stream = random.randrange(4)
+            x = random.randrange(50)
+            obj = Int(x)
+            obj.pair = (x, stream)
+            inputs[stream].append(obj)
+        for stream in inputs:
+            stream.sort()
+        result = [i.pair for i in self.module.merge(*inputs, batch=100)]
+        self.assertEqual(result, sorted(result))
+        for stream in inputs:
+            stream.reverse()
+        result = [i.pair for i in self.module.merge(*inputs, reverse=True,
+                                                    batch=100)]
+        self.assertEqual(result, sorted(result, key=itemgetter(0),
+                                        reverse=True))
+        self.assertEqual(result, sorted(sorted(result, key=itemgetter(1)),
+                                        key=itemgetter(0), reverse=True))
+
+    def test_external_sort(self):
+        data = [(random.randrange(100), i) for i in range(1000)]
+        for key in [None, itemgetter(0)]:
+            for reverse in [False, True]:
+                expected = sorted(data, key=key, reverse=reverse)
+                for run_size in [1, 7, 100, 999, 1000, 5000]:
+                    with self.subTest(key=key, reverse=reverse,
+                                      run_size=run_size):
+                        self.assertEqual(
+                            list(self.module.external_sort(
+                                iter(data), key=key, reverse=reverse,
+                                run_size=run_size)),
+                            expected)
+        self.assertEqual(list(self.module.external_sort([])), [])
+        self.assertRaises(ValueError, list,
+                          self.module.external_sort([1], run_size=0))
+
+    def test_external_sort_removes_files(self):
+        import os, tempfile
+        with tempfile.TemporaryDirectory() as tmpdir:
+            it = self.module.external_sort(range(100, 0, -1), run_size=10,
+                                           dir=tmpdir)
+            self.assertEqual(next(it), 1)
+            it.close()
+            self.assertEqual(os.listdir(tmpdir), [])
+
     def test_nsmallest(self):
         data = [(random.randrange(2000), i) for i in range(1000)]
         for f in (None, lambda x:  x[0] * 547 % 2000):
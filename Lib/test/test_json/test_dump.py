@@ -1,4 +1,4 @@
-from io import StringIO
+from io import BytesIO, RawIOBase, StringIO
 from test.test_json import PyTest, CTest
 
 from test.support import bigmemtest, _1G
@@ -12,6 +12,101 @@ def test_dump(self):
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
+    def test_dump_binary(self):
+        obj = {'spam': ['\u20ac', '\udc80', [1.5, None]], 'eggs': {}}
+        for ensure_ascii in True, False:
+            expected = self.dumps(obj, ensure_ascii=ensure_ascii)
+            bio = BytesIO()
+            self.json.dump(obj, bio, ensure_ascii=ensure_ascii)
+            self.assertEqual(bio.getvalue(),
+                             expected.encode('utf-8', 'surrogatepass'))
+            self.assertEqual(self.json.loads(bio.getvalue()), obj)
+
+    def test_dump_buffer_size(self):
+        class Writer(RawIOBase):
+            def __init__(self):
+                self.chunks = []
+            def writable(self):
+                return True
+            def write(self, b):
+                self.chunks.append(bytes(b))
+                return len(b)
+
+        obj = [{'id': i, 'tags': ['a', 'b'] * i} for i in range(200)]
+        expected = self.dumps(obj)
+        for buffer_size in 1, 100, 2000, len(expected) + 1:
+            writer = Writer()
+            self.json.dump(obj, writer, buffer_size=buffer_size)
+            self.assertEqual(b''.join(writer.chunks), expected.encode())
+            for chunk in writer.chunks[:-1]:
+                self.assertGreaterEqual(len(chunk), buffer_size)
+        writer = Writer()
+        self.json.dump(obj, writer, buffer_size=2000)
+        self.assertLess(len(writer.chunks), len(expected) // 1000)
+
+        sio = StringIO()
+        self.json.dump(obj, sio, buffer_size=100, indent=2)
+        self.assertEqual(sio.getvalue(), self.dumps(obj, indent=2))
+
+    def test_dump_raw_partial_write(self):
+        class Writer(RawIOBase):
+            def __init__(self):
+                self.data = bytearray()
+            def writable(self):
+                return True
+            def write(self, b):
+                b = bytes(b)[:100]
+                self.data += b
+                return len(b)
+
+        obj = [{'id': i, 'tags': ['a', 'b'] * i} for i in range(20)]
+        writer = Writer()
+        self.json.dump(obj, writer, buffer_size=1000)
+        self.assertEqual(writer.data, self.dumps(obj).encode())
+
+        class NonBlockingWriter(Writer):
+            def write(self, b):
+                return None
+        with self.assertRaises(BlockingIOError):
+            self.json.dump(obj, NonBlockingWriter())
+
+    def test_iterencode_bytes(self):
+        obj = {'items': [[i, str(i)] for i in range(3000)], 'count': 3000}
+        encoder = self.json.JSONEncoder(ensure_ascii=False)
+        chunks = list(encoder.iterencode_bytes(obj, buffer_size=1000))
+        self.assertGreater(len(chunks), 1)
+        for chunk in chunks:
+            self.assertIsInstance(chunk, bytes)
+        self.assertEqual(b''.join(chunks), encoder.encode(obj).encode())
+
+    def test_iterencode_large_nested(self):
+        # Large containers are streamed, small ones may be encoded at once.
+        small = {'a': [1, 2.5, None, True], 'b': {'c': 'd'}}
+        obj = {'x': [small] * 3000, 'y': [[small] * 10] * 2000,
+               'z': list(range(5000))}
+        for kwargs in {}, {'sort_keys': True}, {'separators': (',', ':')}:
+            encoder = self.json.JSONEncoder(**kwargs)
+            self.assertEqual(''.join(encoder.iterencode(obj)),
+                             self.dumps(obj, **kwargs))
+        self.assertGreater(len(list(self.json.JSONEncoder().iterencode(obj))),
+                           1000)
+
+    def test_iterencode_small_container_of_large_one(self):
+        # Small containers holding large ones are streamed too.
+        items = list(range(300000))
+        for obj in ({'data': {'items': items}}, [[[items]]],
+                    [{'a': [items]}, 1]):
+            chunks = list(self.json.JSONEncoder().iterencode(obj))
+            self.assertEqual(''.join(chunks), self.dumps(obj))
+            self.assertLess(max(map(len, chunks)), 100000)
+
+    def test_iterencode_circular(self):
+        a = []
+        outer = [a] * 2000
+        a.append(outer)
+        with self.assertRaisesRegex(ValueError, 'Circular reference'):
+            ''.join(self.json.JSONEncoder().iterencode(outer))
+
     def test_dump_skipkeys(self):
         v = {b'invalid_key': False, 'valid_key': True}
         with self.assertRaises(TypeError):
@@ -0,0 +1,128 @@
+import io
+from collections import OrderedDict
+from decimal import Decimal
+from test.test_json import PyTest, CTest
+
+
+DOC = {
+    'name': 'spam \\"[{\u20ac',
+    'items': [1, -2.5e3, 'x]}', [], {}, [True, False, None],
+              {'a': {'b': ['c', '\\']}}],
+    'empty': '',
+}
+
+
+class TestIterload:
+    def feed_chunks(self, parser, text, size):
+        for i in range(0, len(text), size):
+            parser.feed(text[i:i + size])
+        parser.close()
+        return list(parser.read_events())
+
+    def test_chunked(self):
+        for indent in None, 2:
+            text = self.dumps(DOC, indent=indent)
+            for size in 1, 2, 3, 7, len(text):
+                with self.subTest(indent=indent, size=size):
+                    parser = self.json.JSONPullParser()
+                    self.assertEqual(self.feed_chunks(parser, text, size),
+                                     [((), DOC)])
+
+    def test_depth(self):
+        text = self.dumps(DOC)
+        parser = self.json.JSONPullParser(depth=1)
+        self.assertEqual(self.feed_chunks(parser, text, 5),
+                         [(('name',), DOC['name']),
+                          (('items',), DOC['items']),
+                          (('empty',), DOC['empty'])])
+        parser = self.json.JSONPullParser(depth=2)
+        self.assertEqual(self.feed_chunks(parser, text, 5),
+                         [(('items', i), item)
+                          for i, item in enumerate(DOC['items'])])
+        parser = self.json.JSONPullParser(depth=4)
+        self.assertEqual(self.feed_chunks(parser, text, 5),
+                         [(('items', 6, 'a', 'b'), ['c', '\\'])])
+        self.assertRaises(ValueError, self.json.JSONPullParser, depth=-1)
+
+    def test_events_as_values_complete(self):
+        parser = self.json.JSONPullParser(depth=1)
+        parser.feed('[1, [2, 3], "four"')
+        self.assertEqual(list(parser.read_events()),
+                         [((0,), 1), ((1,), [2, 3]), ((2,), 'four')])
+        parser.feed(', 5')
+        self.assertEqual(list(parser.read_events()), [])
+        parser.feed(']')
+        self.assertEqual(list(parser.read_events()), [((3,), 5)])
+        parser.close()
+
+    def test_multiple_documents(self):
+        text = '{"a": 1}\n[2]\n"three"\n4\n null '
+        parser = self.json.JSONPullParser()
+        self.assertEqual([value for path, value in
+                          self.feed_chunks(parser, text, 3)],
+                         [{'a': 1}, [2], 'three', 4, None])
+        self.assertEqual(list(self.json.iterload(io.StringIO(text))),
+                         [{'a': 1}, [2], 'three', 4, None])
+        self.assertEqual(list(self.json.iterload(io.StringIO(''))), [])
+
+    def test_iterload(self):
+        items = DOC['items'] * 100
+        text = self.dumps(items)
+        for size in 1, 10, 65536:
+            self.assertEqual(list(self.json.iterload(io.StringIO(text),
+                                                     depth=1,
+                                                     chunk_size=size)),
+                             items)
+
+    def test_iterload_bytes(self):
+        text = self.dumps(DOC['items'], ensure_ascii=False)
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-be',
+                         'utf-16-le', 'utf-32', 'utf-32-be', 'utf-32-le'):
+            with self.subTest(encoding=encoding):
+                fp = io.BytesIO(text.encode(encoding))
+                self.assertEqual(list(self.json.iterload(fp, depth=1,
+                                                         chunk_size=3)),
+                                 DOC['items'])
+
+    def test_iterload_hooks(self):
+        text = '[{"b": 1.5, "a": 2}]'
+        [value] = self.json.iterload(io.StringIO(text), depth=1,
+                                     object_pairs_hook=OrderedDict,
+                                     parse_float=Decimal)
+        self.assertEqual(value, OrderedDict([('b', Decimal('1.5')),
+                                             ('a', 2)]))
+        self.assertIs(type(value), OrderedDict)
+
+    def test_errors(self):
+        for text in ('[1,]', '[1 2]', '{"a" 1}', '{"a": 1,}', '[1, 2',
+                     '{"a":', '"abc', '[}', '{1: 2}', 'tru', '[1] x',
+                     '{"a"', '[1, {"a": [}]]'):
+            for depth in 0, 1:
+                with self.subTest(text=text, depth=depth):
+                    parser = self.json.JSONPullParser(depth=depth)
+                    with self.assertRaises(self.JSONDecodeError):
+                        self.feed_chunks(parser, text, 1)
+
+    def test_max_buffer_size(self):
+        parser = self.json.JSONPullParser(depth=1, max_buffer_size=10)
+        parser.feed('[1, "short", ')
+        with self.assertRaises(self.JSONDecodeError):
+            parser.feed('["too long for the buffer", ')
+        text = self.dumps(['x' * 20])
+        with self.assertRaises(self.JSONDecodeError):
+            list(self.json.iterload(io.StringIO(text), depth=1, chunk_size=4,
+                                    max_buffer_size=10))
+
+    def test_bad_input(self):
+        parser = self.json.JSONPullParser()
+        self.assertRaises(TypeError, parser.feed, b'[]')
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            parser.feed('\ufeff[]')
+        self.assertIn('BOM', str(cm.exception))
+        parser = self.json.JSONPullParser()
+        parser.close()
+        self.assertRaises(ValueError, parser.feed, '[]')
+
+
+class TestPyIterload(TestIterload, PyTest): pass
+class TestCIterload(TestIterload, CTest): pass
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import dataclasses
+import enum
+import typing
+from test.test_json import PyTest, CTest
+
+
+class Color(enum.Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+
+@dataclasses.dataclass
+class Point:
+    x: float
+    y: float
+
+
+@dataclasses.dataclass
+class Shape:
+    name: str
+    points: list[Point]
+    color: Color = Color.RED
+    tags: set[str] = dataclasses.field(default_factory=set)
+    label: str | None = None
+    extra: typing.Any = None
+
+
+@dataclasses.dataclass
+class Options:
+    verbose: bool = False
+    _: dataclasses.KW_ONLY
+    level: int
+    name: str = 'default'
+
+
+@dataclasses.dataclass
+class KwOnlyFirst:
+    x: int = dataclasses.field(kw_only=True)
+    y: int
+
+
+@dataclasses.dataclass
+class Empty:
+    pass
+
+
+@dataclasses.dataclass
+class Node:
+    value: int
+    children: list[Node] = dataclasses.field(default_factory=list)
+
+
+class TestTyped:
+    def decode(self, tp, s, **kwargs):
+        return self.json.TypedDecoder(tp, **kwargs).decode(s)
+
+    def test_scalars(self):
+        self.assertIs(self.decode(bool, 'true'), True)
+        self.assertIs(self.decode(bool, ' false '), False)
+        self.assertIsNone(self.decode(None, 'null'))
+        self.assertEqual(self.decode(str, '"sp\\u00e4m"'), 'sp\xe4m')
+        self.assertEqual(self.decode(int, '-42'), -42)
+        self.assertEqual(self.decode(float, '1.5e3'), 1500.0)
+        value = self.decode(float, '2')
+        self.assertEqual(value, 2.0)
+        self.assertIs(type(value), float)
+        self.assertEqual(self.decode(Color, '"green"'), Color.GREEN)
+        self.assertEqual(self.decode(typing.Any, '[1, {"a": null}]'),
+                         [1, {'a': None}])
+
+    def test_containers(self):
+        self.assertEqual(self.decode(list[int], '[1, 2 ,3 ]'), [1, 2, 3])
+        self.assertEqual(self.decode(list[int], '[ ]'), [])
+        self.assertEqual(self.decode(set[str], '["a", "b", "a"]'), {'a', 'b'})
+        self.assertEqual(self.decode(frozenset[int], '[1]'), frozenset({1}))
+        self.assertEqual(self.decode(tuple[int, ...], '[1, 2]'), (1, 2))
+        self.assertEqual(self.decode(tuple[int, str, bool],
+                                     '[1, "a" , true]'),
+                         (1, 'a', True))
+        self.assertEqual(self.decode(tuple[()], '[]'), ())
+        self.assertEqual(self.decode(dict[str, list[float]],
+                                     '{"a": [1, 2.5], "b": []}'),
+                         {'a': [1.0, 2.5], 'b': []})
+        self.assertEqual(self.decode(dict, '{"a": [1]}'), {'a': [1]})
+        self.assertEqual(self.decode(list, '[{"a": 1}]'), [{'a': 1}])
+
+    def test_unions(self):
+        tp = int | None
+        self.assertEqual(self.decode(list[tp], '[1, null, 2]'), [1, None, 2])
+        self.assertEqual(self.decode(typing.Optional[Point], 'null'), None)
+        tp = list[int | str | None]
+        self.assertEqual(self.decode(tp, '[1, "a", null]'), [1, 'a', None])
+        value = self.decode(float | str, '1')
+        self.assertEqual(value, 1.0)
+        self.assertIs(type(value), float)
+        with self.assertRaises(self.JSONDecodeError):
+            self.decode(int | str, '1.5')
+        with self.assertRaises(TypeError):
+            self.json.TypedDecoder(Point | list[int])
+
+    def test_dataclass(self):
+        s = ('{"name": "triangle", "color": "green", "tags": ["a"], '
+             '"unknown": {"x": [1, 2, {}]}, '
+             '"points": [{"x": 0, "y": 0}, {"y": 1.5, "x": 1}], '
+             '"extra": {"k": [true]}}')
+        self.assertEqual(self.decode(Shape, s),
+                         Shape('triangle', [Point(0.0, 0.0), Point(1.0, 1.5)],
+                               Color.GREEN, {'a'}, extra={'k': [True]}))
+        self.assertEqual(self.decode(Shape, '{"points": [], "name": "x"}'),
+                         Shape('x', []))
+        self.assertEqual(self.decode(list[Point], '[{"x": 1, "y": 2}]'),
+                         [Point(1.0, 2.0)])
+        self.assertEqual(self.decode(Options, '{"level": 2}'),
+                         Options(level=2))
+        self.assertEqual(self.decode(Options, '{"name": "spam", "level": 1, '
+                                              '"verbose": true}'),
+                         Options(True, level=1, name='spam'))
+        self.assertEqual(self.decode(KwOnlyFirst, '{"x": 1, "y": 2}'),
+                         KwOnlyFirst(2, x=1))
+        self.assertEqual(self.decode(Empty, '{"x": 1}'), Empty())
+
+    def test_recursive(self):
+        s = '{"value": 1, "children": [{"value": 2}, {"value": 3, ' \
+            '"children": [{"value": 4, "children": []}]}]}'
+        self.assertEqual(self.decode(Node, s),
+                         Node(1, [Node(2), Node(3, [Node(4)])]))
+
+    def test_matches_loads(self):
+        # The typed decoder accepts the same syntax as loads().
+        s = self.dumps([{'value': i, 'children': [{'value': -i}] * (i % 3)}
+                        for i in range(100)], indent=2)
+        nodes = self.decode(list[Node], s)
+        expected = [Node(d['value'], [Node(**c) for c in d['children']])
+                    for d in self.loads(s)]
+        self.assertEqual(nodes, expected)
+
+    def test_errors(self):
+        tests = [
+            (int, '"1"', 'Expecting integer', 0),
+            (int, '1.0', 'Expecting integer', 0),
+            (float, 'true', 'Expecting number', 0),
+            (bool, '1', 'Expecting true or false', 0),
+            (str, '1', 'Expecting string', 0),
+            (None, '0', 'Expecting null', 0),
+            (Color, '"blue"', 'Expecting a value of Color', 0),
+            (list[int], '{}', 'Expecting array', 0),
+            (list[int], '[1 2]', "Expecting ',' delimiter", 3),
+            (list[int], '[1,]', 'Expecting value', 3),
+            (list, '{}', 'Expecting array', 0),
+            (dict, '[]', 'Expecting object', 0),
+            (tuple[int, int], '[1]', 'Expecting array of length 2', 0),
+            (tuple[int, int], '[1, 2, 3]', 'Expecting array of length 2', 0),
+            (dict[str, int], '{1: 2}', 'Expecting property name', 1),
+            (dict[str, int], '{"a" 2}', "Expecting ':' delimiter", 5),
+            (dict[str, int], '{"a": 2 "b": 3}', "Expecting ',' delimiter", 8),
+            (Point, '{"x": 1}', 'Missing fields for Point: y', 0),
+            (Point, '{}', 'Missing fields for Point: x, y', 0),
+            (Point, '[]', 'Expecting object', 0),
+            (Options, '{"verbose": 1}', 'Expecting true or false', 12),
+            (Point, '{"x": 1, "y": 2, "z": [}', 'Expecting value', 23),
+            (Point, '{"x": 1, "y": 2} 3', 'Extra data', 17),
+            (Node, '{"value": 1, "children": [{"value": "2"}]}',
+             'Expecting integer', 36),
+        ]
+        for tp, s, msg, idx in tests:
+            with self.subTest(tp=tp, s=s):
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    self.decode(tp, s)
+                self.assertEqual(cm.exception.msg[:len(msg)], msg)
+                self.assertEqual(cm.exception.pos, idx)
+
+    def test_strict(self):
+        with self.assertRaises(self.JSONDecodeError):
+            self.decode(list[str], '["a\tb"]')
+        self.assertEqual(self.decode(list[str], '["a\tb"]', strict=False),
+                         ['a\tb'])
+        self.assertEqual(self.decode(Point | None, 'null', strict=False),
+                         None)
+
+    def test_raw_decode(self):
+        decoder = self.json.TypedDecoder(list[int])
+        self.assertEqual(decoder.raw_decode('xx[1, 2] [3]', 2), ([1, 2], 8))
+        self.assertRaises(ValueError, decoder.raw_decode, '[]', -1)
+        self.assertEqual(repr(decoder), 'TypedDecoder(list[int])')
+
+    def test_unsupported(self):
+        for tp in dict[int, str], complex, list[int, str], Point | Color:
+            with self.subTest(tp=tp):
+                self.assertRaises(TypeError, self.json.TypedDecoder, tp)
+
+
+class TestPyTyped(TestTyped, PyTest): pass
+class TestCTyped(TestTyped, CTest): pass
@@ -1900,6 +1900,18 @@ def _check(glob, expected):
         _check(p.rglob("*.txt"), ["dirC/novel.txt"])
         _check(p.rglob("*.*"), ["dirC/novel.txt"])
 
+    def test_glob_recursive_several_segments_common(self):
+        def _check(glob, expected):
+            self.assertEqual(sorted(glob), sorted(P(BASE, q) for q in expected))
+        P = self.cls
+        p = P(BASE)
+        _check(p.glob("**/dirC/**/file*"), ["dirC/fileC", "dirC/dirD/fileD"])
+        _check(p.glob("**/dir*/**/fileD"), ["dirC/dirD/fileD"])
+        _check(p.glob("**/dirC/**/"), ["dirC", "dirC/dirD"])
+        _check(p.glob("dirC/**/dirD/*"), ["dirC/dirD/fileD"])
+        _check(p.glob("**/dirC/*/"), ["dirC/dirD"])
+        _check(p.glob("**/nonexistent/**/*"), [])
+
     def test_rglob_follow_symlinks_common(self):
         if not self.can_symlink:
             self.skipTest("symlinks required")
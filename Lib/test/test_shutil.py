@@ -596,6 +596,99 @@ def test_rmtree_with_dir_fd(self):
         shutil.rmtree(victim, dir_fd=dir_fd)
         self.assertFalse(os.path.exists(fullname))
 
+    def _make_tree(self, root, depth, width, files):
+        for i in range(files):
+            write_file((root, 'file%d' % i), 'foo')
+        if depth:
+            for i in range(width):
+                sub_dir = os.path.join(root, 'dir%d' % i)
+                os.mkdir(sub_dir)
+                self._make_tree(sub_dir, depth - 1, width, files)
+
+    def test_rmtree_workers(self):
+        tmp_dir = self.mkdtemp()
+        victim = os.path.join(tmp_dir, 'killme')
+        os.mkdir(victim)
+        self._make_tree(victim, 3, 4, 3)
+        os.mkdir(os.path.join(victim, 'empty'))
+        shutil.rmtree(victim, workers=4)
+        self.assertFalse(os.path.exists(victim))
+        self.assertEqual(os.listdir(tmp_dir), [])
+
+    @unittest.skipUnless(shutil._use_fd_functions, "dir_fd is not supported")
+    def test_rmtree_workers_fd_budget(self):
+        # Subtrees beyond the descriptor budget are removed sequentially.
+        tmp_dir = self.mkdtemp()
+        victim = os.path.join(tmp_dir, 'killme')
+        os.mkdir(victim)
+        self._make_tree(victim, 3, 4, 1)
+        with unittest.mock.patch('shutil._RMTREE_MAX_FDS', 3):
+            with unittest.mock.patch('shutil._rmtree_safe_fd_subtree',
+                        wraps=shutil._rmtree_safe_fd_subtree) as m:
+                shutil.rmtree(victim, workers=2)
+        self.assertTrue(m.called)
+        self.assertFalse(os.path.exists(victim))
+
+    @unittest.skipUnless(shutil._use_fd_functions, "dir_fd is not supported")
+    def test_rmtree_workers_onexc(self):
+        tmp_dir = self.mkdtemp()
+        victim = os.path.join(tmp_dir, 'killme')
+        os.mkdir(victim)
+        self._make_tree(victim, 2, 3, 2)
+        orig_unlink = os.unlink
+        def unlink(path, *args, **kwargs):
+            if path == 'file1':
+                raise PermissionError(errno.EACCES, 'denied', path)
+            return orig_unlink(path, *args, **kwargs)
+
+        errors = []
+        def onexc(*args):
+            errors.append(args)
+        with unittest.mock.patch('os.unlink', side_effect=unlink):
+            shutil.rmtree(victim, onexc=onexc, workers=3)
+        # file1 is left in each of the 13 directories, which therefore
+        # cannot be removed either.
+        unlink_errors = [path for func, path, exc in errors
+                         if isinstance(exc, PermissionError)]
+        rmdir_errors = [path for func, path, exc in errors
+                        if func is os.rmdir]
+        self.assertEqual(len(unlink_errors), 13)
+        self.assertEqual(len(rmdir_errors), 13)
+        self.assertEqual(len(errors), 26)
+        self.assertTrue(os.path.exists(os.path.join(victim, 'dir2', 'dir0',
+                                                    'file1')))
+        self.assertFalse(os.path.exists(os.path.join(victim, 'dir2', 'dir0',
+                                                     'file0')))
+
+        # Without onexc the first error is raised once the running
+        # workers are done.
+        with unittest.mock.patch('os.unlink', side_effect=unlink):
+            with self.assertRaises(PermissionError):
+                shutil.rmtree(victim, workers=3)
+        shutil.rmtree(victim, workers=3)
+        self.assertFalse(os.path.exists(victim))
+
+    @os_helper.skip_unless_symlink
+    def test_rmtree_workers_symlink_inside(self):
+        tmp_dir = self.mkdtemp()
+        victim = os.path.join(tmp_dir, 'killme')
+        keep = os.path.join(tmp_dir, 'keep')
+        os.mkdir(victim)
+        os.mkdir(keep)
+        write_file((keep, 'precious'), 'foo')
+        self._make_tree(victim, 2, 2, 1)
+        os.symlink(keep, os.path.join(victim, 'dir1', 'link'),
+                   target_is_directory=True)
+        shutil.rmtree(victim, workers=2)
+        self.assertFalse(os.path.exists(victim))
+        self.assertTrue(os.path.exists(os.path.join(keep, 'precious')))
+
+    def test_rmtree_workers_invalid(self):
+        tmp_dir = self.mkdtemp()
+        with self.assertRaises(ValueError):
+            shutil.rmtree(tmp_dir, workers=0)
+        self.assertTrue(os.path.exists(tmp_dir))
+
     @unittest.skipIf(shutil._use_fd_functions, "dir_fd is supported")
     def test_rmtree_with_dir_fd_unsupported(self):
         tmp_dir = self.mkdtemp()
@@ -993,6 +1086,77 @@ def test_copytree_subdirectory(self):
         rv = shutil.copytree(src_dir, dst_dir)
         self.assertEqual(['pol'], os.listdir(rv))
 
+    def test_copytree_workers(self):
+        src_dir = self.mkdtemp()
+        dst_dir = os.path.join(self.mkdtemp(), 'destination')
+        for i in range(3):
+            sub_dir = os.path.join(src_dir, 'dir%d' % i)
+            os.mkdir(sub_dir)
+            for j in range(20):
+                write_file((sub_dir, 'file%d.txt' % j), str(i * j))
+        write_file((src_dir, 'test.txt'), '123')
+        os.utime(os.path.join(src_dir, 'dir1'), (0, 12345))
+
+        rv = shutil.copytree(src_dir, dst_dir, workers=4)
+        self.assertEqual(rv, dst_dir)
+        self.assertEqual(read_file((dst_dir, 'test.txt')), '123')
+        for i in range(3):
+            for j in range(20):
+                actual = read_file((dst_dir, 'dir%d' % i, 'file%d.txt' % j))
+                self.assertEqual(actual, str(i * j))
+        # Directory metadata is copied after the files within it.
+        self.assertEqual(os.stat(os.path.join(dst_dir, 'dir1')).st_mtime,
+                         12345)
+
+    @os_helper.skip_unless_symlink
+    def test_copytree_workers_symlinks(self):
+        src_dir = self.mkdtemp()
+        os.mkdir(os.path.join(src_dir, 'real_dir'))
+        write_file((src_dir, 'real_dir', 'test.txt'), 'foo')
+        os.symlink(os.path.join(src_dir, 'real_dir'),
+                   os.path.join(src_dir, 'link_to_dir'),
+                   target_is_directory=True)
+
+        dst_dir = os.path.join(self.mkdtemp(), 'destination')
+        shutil.copytree(src_dir, dst_dir, symlinks=False, workers=2)
+        self.assertFalse(os.path.islink(os.path.join(dst_dir, 'link_to_dir')))
+        self.assertEqual(read_file((dst_dir, 'link_to_dir', 'test.txt')),
+                         'foo')
+
+        dst_dir = os.path.join(self.mkdtemp(), 'destination2')
+        shutil.copytree(src_dir, dst_dir, symlinks=True, workers=2)
+        self.assertTrue(os.path.islink(os.path.join(dst_dir, 'link_to_dir')))
+
+    def test_copytree_workers_errors_order(self):
+        src_dir = self.mkdtemp()
+        dst_dir = os.path.join(self.mkdtemp(), 'destination')
+        os.mkdir(os.path.join(src_dir, 'a'))
+        os.mkdir(os.path.join(src_dir, 'b'))
+        for name in ('a', 'b'):
+            for i in range(5):
+                write_file((src_dir, name, 'f%d' % i), 'x')
+
+        def copy_function(src, dst):
+            if os.path.basename(src) in ('f1', 'f3'):
+                raise OSError(errno.EIO, 'failed', src)
+            shutil.copy2(src, dst)
+
+        with self.assertRaises(Error) as cm:
+            shutil.copytree(src_dir, dst_dir, copy_function=copy_function)
+        expected = cm.exception.args[0]
+        self.assertEqual(len(expected), 4)
+        shutil.rmtree(dst_dir)
+        with self.assertRaises(Error) as cm:
+            shutil.copytree(src_dir, dst_dir, copy_function=copy_function,
+                            workers=3)
+        self.assertEqual(cm.exception.args[0], expected)
+
+    def test_copytree_workers_nonexistent_src(self):
+        src_dir = os.path.join(self.mkdtemp(), 'missing')
+        dst_dir = os.path.join(self.mkdtemp(), 'destination')
+        with self.assertRaises(FileNotFoundError):
+            shutil.copytree(src_dir, dst_dir, workers=2)
+
 class TestCopy(BaseTest, unittest.TestCase):
 
     ### shutil.copymode
@@ -2792,6 +2956,12 @@ def test_filesystem_full(self):
 class TestZeroCopySendfile(_ZeroCopyFileTest, unittest.TestCase):
     PATCHPOINT = "os.sendfile"
 
+    def setUp(self):
+        # Make copyfile() go straight to sendfile().
+        patcher = unittest.mock.patch('shutil._USE_CP_COPY_FILE_RANGE', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def zerocopy_fun(self, fsrc, fdst):
         return shutil._fastcopy_sendfile(fsrc, fdst)
 
@@ -2907,6 +3077,78 @@ def test_file2file_not_supported(self):
             shutil._USE_CP_SENDFILE = True
 
 
+@unittest.skipIf(not shutil._USE_CP_COPY_FILE_RANGE,
+                 'os.copy_file_range() not supported')
+class TestZeroCopyCopyFileRange(_ZeroCopyFileTest, unittest.TestCase):
+    PATCHPOINT = "os.copy_file_range"
+
+    def zerocopy_fun(self, fsrc, fdst):
+        return shutil._fastcopy_copy_file_range(fsrc, fdst)
+
+    def test_non_regular_file_src(self):
+        with io.BytesIO(self.FILEDATA) as src:
+            with open(TESTFN2, "wb") as dst:
+                with self.assertRaises(_GiveupOnFastCopy):
+                    self.zerocopy_fun(src, dst)
+
+    def test_empty_file(self):
+        # copy_file_range() cannot tell an empty file from a filesystem
+        # which silently copies nothing, so it gives up and copyfile()
+        # falls back on a regular copy.
+        srcname = TESTFN + 'src'
+        dstname = TESTFN + 'dst'
+        self.addCleanup(lambda: os_helper.unlink(srcname))
+        self.addCleanup(lambda: os_helper.unlink(dstname))
+        with open(srcname, "wb"):
+            pass
+
+        with open(srcname, "rb") as src:
+            with open(dstname, "wb") as dst:
+                with self.assertRaises(_GiveupOnFastCopy):
+                    self.zerocopy_fun(src, dst)
+
+        shutil.copyfile(srcname, dstname)
+        self.assertEqual(read_file(dstname, binary=True), b"")
+
+    def test_nothing_copied(self):
+        # Emulate a filesystem where copy_file_range() reports success
+        # without copying anything: copyfile() must fall back.
+        with unittest.mock.patch(self.PATCHPOINT, return_value=0) as m:
+            with self.get_files() as (src, dst):
+                with self.assertRaises(_GiveupOnFastCopy):
+                    self.zerocopy_fun(src, dst)
+            shutil.copyfile(TESTFN, TESTFN2)
+            assert m.called
+        self.assertEqual(read_file(TESTFN2, binary=True), self.FILEDATA)
+
+    def test_exception_on_second_call(self):
+        def copy_file_range(*args, **kwargs):
+            if not flag:
+                flag.append(None)
+                return orig_copy_file_range(*args, **kwargs)
+            else:
+                raise OSError(errno.EBADF, "yo")
+
+        flag = []
+        orig_copy_file_range = os.copy_file_range
+        with unittest.mock.patch(self.PATCHPOINT, create=True,
+                                 side_effect=copy_file_range):
+            with self.get_files() as (src, dst):
+                with self.assertRaises(OSError) as cm:
+                    shutil._fastcopy_copy_file_range(src, dst)
+        assert flag
+        self.assertEqual(cm.exception.errno, errno.EBADF)
+
+    def test_small_chunks(self):
+        mock = unittest.mock.Mock()
+        mock.st_size = 65536 + 1
+        with unittest.mock.patch('os.fstat', return_value=mock) as m:
+            with self.get_files() as (src, dst):
+                shutil._fastcopy_copy_file_range(src, dst)
+                assert m.called
+        self.assertEqual(read_file(TESTFN2, binary=True), self.FILEDATA)
+
+
 @unittest.skipIf(not MACOS, 'macOS only')
 class TestZeroCopyMACOS(_ZeroCopyFileTest, unittest.TestCase):
     PATCHPOINT = "posix._fcopyfile"
@@ -3,6 +3,7 @@
 
 """
 
+import array
 import bisect
 import collections
 import collections.abc
@@ -2241,6 +2242,53 @@ def test_center_not_at_mean(self):
         data = (1.0, 2.0)
         self.assertEqual(self.func(data, xbar=2.0), 1.0)
 
+class TestFloatPrecision(unittest.TestCase):
+    # Tests for precision='float' in mean() and the variance functions.
+    funcs = [statistics.mean, statistics.variance, statistics.pvariance,
+             statistics.stdev, statistics.pstdev]
+
+    def test_compare_to_exact(self):
+        data = [random.gauss(1e6, 3.0) for _ in range(3000)]
+        for func in self.funcs:
+            with self.subTest(func=func.__name__):
+                expected = func(data)
+                for arg in (data, tuple(data), iter(data), array.array('d', data),
+                            memoryview(array.array('d', data))):
+                    result = func(arg, precision='float')
+                    self.assertIsInstance(result, float)
+                    self.assertAlmostEqual(result, expected,
+                                           delta=abs(expected) * 1e-12)
+
+    def test_other_types(self):
+        data = [1, Fraction(3, 2), Decimal('2.5'), 4.0]
+        self.assertEqual(statistics.mean(data[:3], precision='float'), 5/3)
+        self.assertEqual(statistics.pvariance([1, 2, 3, 4], precision='float'),
+                         1.25)
+        self.assertEqual(statistics.variance([Decimal('1.5'), Decimal('2.5')],
+                                             precision='float'), 0.5)
+        self.assertIsInstance(statistics.pstdev(data, precision='float'),
+                              float)
+
+    def test_center_given(self):
+        data = [1.0, 2.0, 4.0]
+        self.assertEqual(statistics.pvariance(data, 2.0, precision='float'),
+                         statistics.pvariance(data, 2.0))
+        self.assertEqual(statistics.stdev((1.0, 2.0), 2.0, precision='float'),
+                         1.0)
+
+    def test_errors(self):
+        StatisticsError = statistics.StatisticsError
+        for func in self.funcs:
+            with self.subTest(func=func.__name__):
+                with self.assertRaises(StatisticsError):
+                    func([], precision='float')
+                with self.assertRaises(ValueError):
+                    func([1, 2], precision='fast')
+        for func in statistics.variance, statistics.stdev:
+            with self.assertRaises(StatisticsError):
+                func([1.0], precision='float')
+        self.assertEqual(statistics.pvariance([5.0], precision='float'), 0.0)
+
 class TestGeometricMean(unittest.TestCase):
 
     def test_basics(self):
@@ -2620,6 +2668,252 @@ def test_float_output(self):
         self.assertTrue(isinstance(slope, float))
         self.assertTrue(isinstance(intercept, float))
 
+class TestRunningStats(unittest.TestCase):
+
+    def make_data(self, n=5000, seed=8675309):
+        r = random.Random(seed)
+        return [r.gauss(1000.0, 15.0) for i in range(n)]
+
+    def test_matches_functions(self):
+        data = self.make_data()
+        stats = statistics.RunningStats(data)
+        self.assertEqual(stats.n, len(data))
+        self.assertAlmostEqual(stats.mean, statistics.fmean(data), places=9)
+        self.assertAlmostEqual(stats.variance(), statistics.variance(data))
+        self.assertAlmostEqual(stats.pvariance(), statistics.pvariance(data))
+        self.assertAlmostEqual(stats.stdev(), statistics.stdev(data))
+        self.assertAlmostEqual(stats.pstdev(), statistics.pstdev(data))
+        self.assertEqual(stats.min, min(data))
+        self.assertEqual(stats.max, max(data))
+
+    def test_add_update_merge(self):
+        data = self.make_data()
+        expected = statistics.RunningStats(data)
+        one_by_one = statistics.RunningStats()
+        for x in data:
+            one_by_one.add(x)
+        merged = statistics.RunningStats()
+        for i in range(0, len(data), 700):
+            merged.merge(statistics.RunningStats(data[i : i+700]))
+        merged.merge(statistics.RunningStats())
+        for stats in one_by_one, merged:
+            self.assertEqual(stats.n, expected.n)
+            self.assertAlmostEqual(stats.mean, expected.mean, places=9)
+            self.assertAlmostEqual(stats.variance(), expected.variance())
+            self.assertEqual(stats.min, expected.min)
+            self.assertEqual(stats.max, expected.max)
+        with self.assertRaises(TypeError):
+            merged.merge(data)
+
+    def test_exact_values(self):
+        stats = statistics.RunningStats(iter([2, 4, 4, 4, 5, 5, 7, 9]))
+        self.assertEqual(stats.mean, 5.0)
+        self.assertEqual(stats.pvariance(), 4.0)
+        self.assertEqual(stats.pstdev(), 2.0)
+        self.assertIsInstance(stats.mean, float)
+
+    def test_too_few_data_points(self):
+        StatisticsError = statistics.StatisticsError
+        stats = statistics.RunningStats()
+        for method in (stats.variance, stats.pvariance,
+                       stats.stdev, stats.pstdev):
+            with self.assertRaises(StatisticsError):
+                method()
+        for attr in 'mean', 'min', 'max':
+            with self.assertRaises(StatisticsError):
+                getattr(stats, attr)
+        stats.add(3)
+        self.assertEqual(stats.pvariance(), 0.0)
+        with self.assertRaises(StatisticsError):
+            stats.variance()
+        with self.assertRaises(StatisticsError):
+            stats.stdev()
+
+    def test_pickle_and_copy(self):
+        stats = statistics.RunningStats(self.make_data(100))
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                other = pickle.loads(pickle.dumps(stats, protocol=proto))
+                self.assertEqual(other.__getstate__(), stats.__getstate__())
+        other = copy.copy(stats)
+        other.add(0.0)
+        self.assertEqual(stats.n, 100)
+        self.assertEqual(other.n, 101)
+
+    def test_repr(self):
+        self.assertEqual(repr(statistics.RunningStats()), '<RunningStats n=0>')
+        self.assertEqual(repr(statistics.RunningStats([1, 3])),
+                         '<RunningStats n=2 mean=2.0 min=1.0 max=3.0>')
+
+
+class TestRunningCovariance(unittest.TestCase):
+
+    def make_data(self, n=3000, seed=8675309):
+        r = random.Random(seed)
+        x = [r.uniform(100.0, 200.0) for i in range(n)]
+        y = [3.0 * xi - 50.0 + r.gauss(0.0, 10.0) for xi in x]
+        return x, y
+
+    def test_matches_functions(self):
+        x, y = self.make_data()
+        stats = statistics.RunningCovariance(x, y)
+        self.assertEqual(stats.n, len(x))
+        self.assertAlmostEqual(stats.covariance(), statistics.covariance(x, y))
+        self.assertAlmostEqual(stats.correlation(),
+                               statistics.correlation(x, y))
+        for proportional in False, True:
+            slope, intercept = stats.linear_regression(
+                proportional=proportional)
+            expected = statistics.linear_regression(
+                x, y, proportional=proportional)
+            self.assertAlmostEqual(slope, expected.slope)
+            self.assertAlmostEqual(intercept, expected.intercept, places=5)
+        self.assertAlmostEqual(stats.x.variance(), statistics.variance(x))
+        self.assertAlmostEqual(stats.y.mean, statistics.fmean(y))
+
+    def test_marginals(self):
+        x, y = self.make_data()
+        stats = statistics.RunningCovariance(x[:1000], y[:1000])
+        stats.merge(statistics.RunningCovariance(x[1000:2000],
+                                                 y[1000:2000]))
+        for xi, yi in zip(x[2000:], y[2000:]):
+            stats.add(xi, yi)
+        for marginal, data in (stats.x, x), (stats.y, y):
+            self.assertEqual(marginal.n, len(data))
+            self.assertEqual(marginal.min, min(data))
+            self.assertEqual(marginal.max, max(data))
+            # The marginals are independent RunningStats objects.
+            marginal.add(1000.0)
+            self.assertEqual(marginal.max, 1000.0)
+            merged = statistics.RunningStats()
+            merged.merge(marginal)
+            self.assertEqual(merged.n, len(data) + 1)
+        self.assertEqual(stats.x.max, max(x))
+        empty = statistics.RunningCovariance().x
+        self.assertEqual(empty.n, 0)
+        with self.assertRaises(statistics.StatisticsError):
+            empty.min
+
+    def test_add_merge(self):
+        x, y = self.make_data()
+        expected = statistics.RunningCovariance(x, y)
+        one_by_one = statistics.RunningCovariance()
+        for xi, yi in zip(x, y):
+            one_by_one.add(xi, yi)
+        merged = statistics.RunningCovariance()
+        for i in range(0, len(x), 1100):
+            merged.merge(statistics.RunningCovariance(x[i : i+1100],
+                                                      y[i : i+1100]))
+        for stats in one_by_one, merged:
+            self.assertEqual(stats.n, expected.n)
+            self.assertAlmostEqual(stats.covariance(), expected.covariance())
+            self.assertAlmostEqual(stats.correlation(),
+                                   expected.correlation())
+        with self.assertRaises(TypeError):
+            merged.merge(statistics.RunningStats(x))
+
+    def test_errors(self):
+        StatisticsError = statistics.StatisticsError
+        with self.assertRaises(StatisticsError):
+            statistics.RunningCovariance([1, 2, 3], [1, 2])
+        with self.assertRaises(StatisticsError):
+            statistics.RunningCovariance(range(2000), range(1999))
+        stats = statistics.RunningCovariance([1], [2])
+        for method in (stats.covariance, stats.correlation,
+                       stats.linear_regression):
+            with self.assertRaises(StatisticsError):
+                method()
+        stats = statistics.RunningCovariance([1, 2, 3], [5, 5, 5])
+        with self.assertRaises(StatisticsError):
+            stats.correlation()
+        stats = statistics.RunningCovariance([1, 1, 1], [1, 2, 3])
+        with self.assertRaises(StatisticsError):
+            stats.linear_regression()
+
+    def test_pickle(self):
+        stats = statistics.RunningCovariance(*self.make_data(100))
+        other = pickle.loads(pickle.dumps(stats))
+        self.assertEqual(other.__getstate__(), stats.__getstate__())
+
+
+class TestQuantileSketch(unittest.TestCase):
+
+    def rank_error(self, data, cut_points):
+        data = sorted(data)
+        n = len(cut_points) + 1
+        return max(abs(bisect.bisect(data, c) / len(data) - i / n)
+                   for i, c in enumerate(cut_points, start=1))
+
+    def test_exact_for_small_data(self):
+        data = [random.random() for i in range(150)]
+        sketch = statistics.QuantileSketch(data)
+        for method in 'exclusive', 'inclusive':
+            for n in 2, 4, 10, 100:
+                self.assertEqual(sketch.quantiles(n=n, method=method),
+                                 statistics.quantiles(data, n=n,
+                                                      method=method))
+
+    def test_accuracy(self):
+        r = random.Random(8675309)
+        data = [r.expovariate(1.0) for i in range(50_000)]
+        sketch = statistics.QuantileSketch(data, seed=1)
+        self.assertEqual(sketch.n, len(data))
+        self.assertLess(sum(map(len, sketch._levels)), 1000)
+        self.assertEqual(sketch.min, min(data))
+        self.assertEqual(sketch.max, max(data))
+        for n in 4, 10, 100:
+            self.assertLess(self.rank_error(data, sketch.quantiles(n=n)), 0.02)
+        median = statistics.median(data)
+        self.assertAlmostEqual(sketch.rank(median), 0.5, delta=0.02)
+        self.assertEqual(sketch.quantiles(n=1), [])
+
+    def test_add_and_merge(self):
+        r = random.Random(8675309)
+        data = [r.random() for i in range(40_000)]
+        merged = statistics.QuantileSketch(seed=2)
+        for i in range(0, len(data), 10_000):
+            part = statistics.QuantileSketch(seed=i)
+            for x in data[i : i+10_000]:
+                part.add(x)
+            merged.merge(part)
+        self.assertEqual(merged.n, len(data))
+        self.assertLess(self.rank_error(data, merged.quantiles(n=10)), 0.02)
+        with self.assertRaises(TypeError):
+            merged.merge(data)
+
+    def test_reproducible(self):
+        data = list(range(10_000))
+        random.Random(8675309).shuffle(data)
+        a = statistics.QuantileSketch(data, seed=42)
+        b = statistics.QuantileSketch(data, seed=42)
+        self.assertEqual(a.quantiles(n=10), b.quantiles(n=10))
+
+    def test_pickle(self):
+        sketch = statistics.QuantileSketch(range(5000), seed=42)
+        other = pickle.loads(pickle.dumps(sketch))
+        self.assertEqual(other.quantiles(n=10), sketch.quantiles(n=10))
+        sketch.update(range(5000, 10000))
+        other.update(range(5000, 10000))
+        self.assertEqual(other.quantiles(n=10), sketch.quantiles(n=10))
+
+    def test_errors(self):
+        StatisticsError = statistics.StatisticsError
+        with self.assertRaises(StatisticsError):
+            statistics.QuantileSketch(k=4)
+        sketch = statistics.QuantileSketch()
+        with self.assertRaises(StatisticsError):
+            sketch.quantiles()
+        with self.assertRaises(StatisticsError):
+            sketch.rank(1)
+        with self.assertRaises(StatisticsError):
+            sketch.min
+        sketch.update(range(1000))
+        with self.assertRaises(StatisticsError):
+            sketch.quantiles(n=0)
+        with self.assertRaises(ValueError):
+            sketch.quantiles(method='X')
+
+
 class TestNormalDist:
 
     # General note on precision: The pdf(), cdf(), and overlap() methods